@@ -1,36 +1,58 @@
 import tkinter as tk
-from queue import PriorityQueue
-from typing import List, Tuple, Optional
+import heapq
+import threading
+from queue import Empty, Queue
+from typing import Callable, List, Tuple, Optional
 import random
 import copy
-import time
+
+from puzzle_engine import is_solvable
+
+
+POLL_INTERVAL_MS = 50  # How often the GUI checks on the solver thread
+PLAYBACK_INTERVAL_MS = 500  # Delay between solution steps
 
 
 class PuzzleState:
+    """Immutable board keyed by a flat tuple, with the blank index and hash cached."""
+    __slots__ = ("key", "size", "blank", "parent", "move", "h", "g", "f", "_hash")
+
     def __init__(self, board: List[List[int]], parent=None, move=""):
-        self.board = board
+        key = tuple(tile for row in board for tile in row)
+        self._init(key, len(board), key.index(0), parent, move)
+
+    def _init(self, key: Tuple[int, ...], size: int, blank: int, parent, move):
+        self.key = key
+        self.size = size
+        self.blank = blank  # flat index of the empty cell
         self.parent = parent
         self.move = move
         self.h = 0  # Heuristic value (misplaced tiles)
         self.g = 0  # Cost from start state
         self.f = 0  # Total cost (f = g + h)
-        self.size = len(board)
+        self._hash = hash(key)
+
+    @classmethod
+    def from_key(cls, key: Tuple[int, ...], size: int, blank: int, parent=None, move="") -> 'PuzzleState':
+        state = cls.__new__(cls)
+        state._init(key, size, blank, parent, move)
+        return state
+
+    @property
+    def board(self) -> List[List[int]]:
+        return [list(self.key[i:i + self.size]) for i in range(0, len(self.key), self.size)]
 
     def __lt__(self, other):
         return self.f < other.f  # Compare total cost in A*
 
     def __eq__(self, other):
-        return str(self.board) == str(other.board)
+        return self.key == other.key
 
     def __hash__(self):
-        return hash(str(self.board))
+        return self._hash
 
     def get_blank_pos(self) -> Tuple[int, int]:
-        for i in range(self.size):
-            for j in range(self.size):
-                if self.board[i][j] == 0:
-                    return (i, j)
-        return (-1, -1)
+        return divmod(self.blank, self.size)
 
     def get_possible_moves(self) -> List[Tuple[int, int]]:
         i, j = self.get_blank_pos()
@@ -44,45 +66,66 @@ class PuzzleState:
         return moves
 
     def get_next_state(self, move_pos: Tuple[int, int]) -> 'PuzzleState':
-        i, j = self.get_blank_pos()
         new_i, new_j = move_pos
-        new_board = [row[:] for row in self.board]
-        new_board[i][j], new_board[new_i][new_j] = new_board[new_i][new_j], new_board[i][j]
-        return PuzzleState(new_board, self, "MOVE")
+        new_blank = new_i * self.size + new_j
+        tiles = list(self.key)
+        tiles[self.blank], tiles[new_blank] = tiles[new_blank], 0
+        return PuzzleState.from_key(tuple(tiles), self.size, new_blank, self, "MOVE")
 
 
 class PuzzleSolver:
     def __init__(self, initial_state: PuzzleState, goal_state: List[List[int]]):
         self.initial_state = initial_state
         self.goal_state = goal_state
+        self.goal_key = tuple(tile for row in goal_state for tile in row)
 
     def heuristic(self, state: PuzzleState) -> int:
-        return sum(
-            1 for i in range(state.size) for j in range(state.size)
-            if state.board[i][j] != 0 and state.board[i][j] != self.goal_state[i][j]
-        )
-
-    def solve(self) -> Optional[List[PuzzleState]]:
-        open_set = PriorityQueue()
-        open_set.put((0, self.initial_state))
+        return sum(1 for tile, goal in zip(state.key, self.goal_key) if tile != 0 and tile != goal)
+
+    def solve(self, cancel_event: Optional[threading.Event] = None,
+              progress: Optional[Callable[[int, int], None]] = None,
+              progress_every: int = 1000) -> Optional[List[PuzzleState]]:
+        """A* from the initial state; returns None if unsolvable or cancelled.
+
+        Every progress_every expansions, cancel_event is checked and progress is
+        called with (nodes expanded, frontier size).
+        """
+        if not is_solvable(self.initial_state.key, self.initial_state.size, self.goal_key):
+            return None  # Unreachable goal; skip the exhaustive search
+
+        # (f, insertion counter, state); the counter keeps ties FIFO without comparing states
+        open_set = [(self.heuristic(self.initial_state), 0, self.initial_state)]
+        counter = 1
         came_from = {}
-        g_score = {str(self.initial_state.board): 0}
-        f_score = {str(self.initial_state.board): self.heuristic(self.initial_state)}
-
-        while not open_set.empty():
-            _, current = open_set.get()
-            if current.board == self.goal_state:
+        g_score = {self.initial_state.key: 0}
+        expanded = 0
+
+        while open_set:
+            _, _, current = heapq.heappop(open_set)
+            current_g = g_score[current.key]
+            if current.g > current_g:
+                continue  # A cheaper copy of this board was queued later
+            expanded += 1
+            if expanded % progress_every == 0:
+                if cancel_event is not None and cancel_event.is_set():
+                    return None
+                if progress is not None:
+                    progress(expanded, len(open_set))
+            if current.key == self.goal_key:
                 return self.reconstruct_path(came_from, current)
 
             for move in current.get_possible_moves():
                 neighbor = current.get_next_state(move)
-                tentative_g_score = g_score[str(current.board)] + 1
+                tentative_g_score = current_g + 1
 
-                if str(neighbor.board) not in g_score or tentative_g_score < g_score[str(neighbor.board)]:
+                if tentative_g_score < g_score.get(neighbor.key, tentative_g_score + 1):
                     came_from[neighbor] = current
-                    g_score[str(neighbor.board)] = tentative_g_score
-                    f_score[str(neighbor.board)] = tentative_g_score + self.heuristic(neighbor)
-                    open_set.put((f_score[str(neighbor.board)], neighbor))
+                    g_score[neighbor.key] = tentative_g_score
+                    neighbor.g = tentative_g_score
+                    neighbor.h = self.heuristic(neighbor)
+                    neighbor.f = tentative_g_score + neighbor.h
+                    heapq.heappush(open_set, (neighbor.f, counter, neighbor))
+                    counter += 1
 
         return None
 
@@ -101,14 +144,20 @@ class PuzzleGUI:
         self.state = initial_state
         self.goal_state = goal_state
         self.solver = PuzzleSolver(initial_state, goal_state)
-        self.size = len(initial_state.board)
+        self.size = initial_state.size
         self.buttons = [[None for _ in range(self.size)] for _ in range(self.size)]
+
+        # Background solving and playback state
+        self.worker: Optional[threading.Thread] = None
+        self.cancel_event = threading.Event()
+        self.messages: Queue = Queue()
+        self.playback_job = None
         self.create_ui()
 
     def create_ui(self):
         for i in range(self.size):
             for j in range(self.size):
-                self.buttons[i][j] = tk.Button(self.root, text=str(self.state.board[i][j]),
+                self.buttons[i][j] = tk.Button(self.root, text=str(self.state.key[i * self.size + j]),
                                                font=("Arial", 20), height=2, width=5,
                                                command=lambda x=i, y=j: self.move_tile(x, y))
                 self.buttons[i][j].grid(row=i, column=j)
@@ -122,37 +171,116 @@ class PuzzleGUI:
         self.reset_button = tk.Button(self.root, text="Reset", command=self.reset)
         self.reset_button.grid(row=self.size, column=2)
 
+        self.cancel_button = tk.Button(self.root, text="Cancel", command=self.cancel, state="disabled")
+        self.cancel_button.grid(row=self.size + 1, column=0)
+
+        self.status_var = tk.StringVar(value="")
+        tk.Label(self.root, textvariable=self.status_var, anchor="w").grid(
+            row=self.size + 1, column=1, columnspan=max(self.size - 1, 1), sticky="w")
+
         self.update_ui()
 
     def update_ui(self):
         for i in range(self.size):
             for j in range(self.size):
-                value = self.state.board[i][j]
+                value = self.state.key[i * self.size + j]
                 self.buttons[i][j].config(text=str(value) if value != 0 else "", bg="lightgrey")
-        self.root.update()
+
+    def is_busy(self) -> bool:
+        return self.worker is not None or self.playback_job is not None
+
+    def set_busy(self, busy: bool):
+        idle_state = "disabled" if busy else "normal"
+        self.start_button.config(state=idle_state)
+        self.shuffle_button.config(state=idle_state)
+        self.cancel_button.config(state="normal" if busy else "disabled")
 
     def move_tile(self, i, j):
-        blank_i, blank_j = self.state.get_blank_pos()
+        if self.is_busy():
+            return
         if (i, j) in self.state.get_possible_moves():
             self.state = self.state.get_next_state((i, j))
             self.update_ui()
 
     def shuffle(self):
-        flat_board = sum(self.state.board, [])
+        flat_board = list(self.state.key)
         random.shuffle(flat_board)
+        if not is_solvable(flat_board, self.size, self.solver.goal_key):
+            # Swapping two tiles flips the permutation parity, making the board solvable
+            first, second = [idx for idx, tile in enumerate(flat_board) if tile != 0][:2]
+            flat_board[first], flat_board[second] = flat_board[second], flat_board[first]
         new_board = [flat_board[i:i + self.size] for i in range(0, len(flat_board), self.size)]
         self.state = PuzzleState(new_board)
         self.update_ui()
 
     def start_solving(self):
-        solution = self.solver.solve()
-        if solution:
-            for step in solution:
-                self.state = step
-                self.update_ui()
-                time.sleep(0.5)
+        """Run the solver on a worker thread; the Tk loop polls it with after()."""
+        if self.is_busy():
+            return
+        self.solver = PuzzleSolver(self.state, self.goal_state)
+        self.cancel_event = threading.Event()
+        self.messages = Queue()
+        self.worker = threading.Thread(target=self.solve_in_background,
+                                       args=(self.solver, self.cancel_event, self.messages), daemon=True)
+        self.set_busy(True)
+        self.status_var.set("Solving...")
+        self.worker.start()
+        self.root.after(POLL_INTERVAL_MS, self.poll_solver)
+
+    @staticmethod
+    def solve_in_background(solver: PuzzleSolver, cancel_event: threading.Event, messages: Queue):
+        def report(expanded, frontier):
+            messages.put(("progress", expanded, frontier))
+
+        messages.put(("done", solver.solve(cancel_event, report)))
+
+    def poll_solver(self):
+        messages, cancelled = self.messages, self.cancel_event.is_set()
+        try:
+            while True:
+                message = messages.get_nowait()
+                if message[0] == "progress" and not cancelled:
+                    self.status_var.set(f"Expanded {message[1]}, frontier {message[2]}")
+                elif message[0] == "done":
+                    self.worker = None
+                    self.on_solved(None if cancelled else message[1])
+                    return
+        except Empty:
+            pass
+        self.root.after(POLL_INTERVAL_MS, self.poll_solver)
+
+    def on_solved(self, solution: Optional[List[PuzzleState]]):
+        if self.cancel_event.is_set():
+            self.status_var.set("Cancelled")
+            self.set_busy(False)
+        elif solution is None:
+            self.status_var.set("No solution")
+            self.set_busy(False)
+        else:
+            self.status_var.set(f"Solved in {len(solution)} moves")
+            self.play_solution(solution)
+
+    def play_solution(self, solution: List[PuzzleState], index: int = 0):
+        """Show one step per tick, scheduled with after() instead of sleeping."""
+        if index >= len(solution):
+            self.playback_job = None
+            self.set_busy(self.worker is not None)
+            return
+        self.state = solution[index]
+        self.update_ui()
+        self.playback_job = self.root.after(PLAYBACK_INTERVAL_MS, self.play_solution, solution, index + 1)
+
+    def cancel(self):
+        self.cancel_event.set()
+        if self.playback_job is not None:
+            self.root.after_cancel(self.playback_job)
+            self.playback_job = None
+            self.status_var.set("Cancelled")
+        if self.worker is None:
+            self.set_busy(False)
 
     def reset(self):
+        self.cancel()
         self.state = PuzzleState([[1, 2, 3], [4, 5, 6], [7, 0, 8]])
         self.update_ui()
 
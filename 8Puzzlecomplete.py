@@ -3,34 +3,77 @@ import matplotlib.pyplot as plt
 import numpy as np
 from matplotlib.animation import FuncAnimation
 
-# Goal state of the 8-puzzle
-GOAL_STATE = (1, 2, 3, 4, 5, 6, 7, 8, 0)
+from bidirectional_search import mm_search
+from pattern_database import get_pdb
+from puzzle_engine import (a_star_packed, board_width, goal_state, heuristic_deltas, is_solvable,
+                           neighbor_table, tile_cost_tables)
+
+# Goal state of the 8-puzzle; other board widths use goal_state(width)
+GOAL_STATE = goal_state(3)
 GOAL_TILES = {tile: idx for idx, tile in enumerate(GOAL_STATE)}
 
 
 def h1(state):
     """Heuristic 1: Number of misplaced tiles excluding the blank."""
-    return sum(1 for i in range(9) if state[i] != GOAL_STATE[i] and state[i] != 0)
+    goal = goal_state(board_width(state))
+    return sum(1 for i, tile in enumerate(state) if tile != goal[i] and tile != 0)
 
 
 def h2(state):
     """Heuristic 2: Sum of Manhattan distances of all tiles from their goal positions."""
-    sum_distance = 0
-    for idx in range(9):
-        tile = state[idx]
-        if tile == 0:
-            continue
-        goal_idx = GOAL_TILES[tile]
-        current_row, current_col = divmod(idx, 3)
-        goal_row, goal_col = divmod(goal_idx, 3)
-        sum_distance += abs(current_row - goal_row) + abs(current_col - goal_col)
-    return sum_distance
-
+    distance = tile_cost_tables(board_width(state))['manhattan']
+    return sum(distance[tile][idx] for idx, tile in enumerate(state))
+
+
+# Table names used by puzzle_engine for the heuristics above
+HEURISTIC_NAMES = {h1: 'misplaced', h2: 'manhattan'}
+
+
+ENGINES = ("tuple", "packed", "bidirectional")
+# Start heuristics below which a search takes only a few dozen nodes, where the
+# tuple loop's cheaper setup beats the packed engine (see benchmark_puzzle.py)
+SHALLOW_BELOW = {h1: 7, h2: 14}
+
+
+def a_star(initial_state, heuristic_func, engine="tuple", incremental=True):
+    """Perform A* search using the specified heuristic function.
+
+    engine="packed" runs the packed-integer engine instead, which takes any
+    heuristic, though boards that h1 or h2 rate as shallow (SHALLOW_BELOW) stay
+    on the tuple loop. engine="bidirectional" runs meet-in-the-middle search
+    from both ends and supports h1 and h2 only.
+    With incremental=True, h1 and h2 are updated per move from a precomputed
+    (tile, from_idx, to_idx) delta table instead of being re-evaluated.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine {engine!r}; expected one of {ENGINES}")
+    # The other engines check solvability themselves
+    if engine == "bidirectional":
+        if heuristic_func not in HEURISTIC_NAMES:
+            raise ValueError("The bidirectional engine supports only the h1 and h2 heuristics")
+        return mm_search(initial_state, HEURISTIC_NAMES[heuristic_func])
+    start_h = heuristic_func(initial_state)
+    if engine == "packed" and start_h >= SHALLOW_BELOW.get(heuristic_func, 0):
+        # h1 and h2 become table names the engine updates per move; other heuristics are called as-is
+        return a_star_packed(initial_state, HEURISTIC_NAMES.get(heuristic_func, heuristic_func))
+    return _a_star_tuple(initial_state, heuristic_func, start_h, incremental)
+
+
+def _a_star_tuple(initial_state, heuristic_func, start_h, incremental):
+    """The tuple engine behind a_star: a heap of (f, h, g, state, parent) entries."""
+    width = board_width(initial_state)
+    if not is_solvable(initial_state, width):
+        # Half of all boards can never reach the goal; don't sweep them
+        return None, 0, 0
+
+    goal = goal_state(width)
+    neighbors = neighbor_table(width)
+    delta = None
+    if incremental and heuristic_func in HEURISTIC_NAMES:
+        delta = heuristic_deltas(width)[HEURISTIC_NAMES[heuristic_func]]
 
-def a_star(initial_state, heuristic_func):
-    """Perform A* search using the specified heuristic function."""
     open_list = []
-    heapq.heappush(open_list, (0, 0, 0, initial_state, None))  # (f, h, g, state, parent)
+    heapq.heappush(open_list, (start_h, start_h, 0, initial_state, None))  # (f, h, g, state, parent)
     closed_set = set()
     nodes_explored = 0
 
@@ -38,60 +81,64 @@ def a_star(initial_state, heuristic_func):
         current_f, current_h, current_g, current_state, parent = heapq.heappop(open_list)
         nodes_explored += 1
 
-        if current_state == GOAL_STATE:
-            # Reconstruct the path
-            path = []
-            node = (current_state, parent)
-            while node is not None:
-                path.append(node[0])
-                node = node[1]
-            path.reverse()
-            return path, nodes_explored, current_g
+        if current_state == goal:
+            return _unwind((current_state, parent)), nodes_explored, current_g
 
         if current_state in closed_set:
             continue
         closed_set.add(current_state)
 
-        # Generate all possible next states
+        # Generate all possible next states (neighbors are in Up, Down, Left, Right order)
         blank_pos = current_state.index(0)
-        row, col = divmod(blank_pos, 3)
-        directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]  # Up, Down, Left, Right
-
-        for dr, dc in directions:
-            new_row, new_col = row + dr, col + dc
-            if 0 <= new_row < 3 and 0 <= new_col < 3:
-                new_blank_pos = new_row * 3 + new_col
-                state_list = list(current_state)
-                # Swap blank with the new position
-                state_list[blank_pos], state_list[new_blank_pos] = state_list[new_blank_pos], state_list[blank_pos]
-                new_state = tuple(state_list)
-
-                if new_state in closed_set:
-                    continue
-
-                new_g = current_g + 1
+
+        for new_blank_pos in neighbors[blank_pos]:
+            state_list = list(current_state)
+            # Swap blank with the new position
+            state_list[blank_pos], state_list[new_blank_pos] = state_list[new_blank_pos], state_list[blank_pos]
+            new_state = tuple(state_list)
+
+            if new_state in closed_set:
+                continue
+
+            new_g = current_g + 1
+            if delta is None:
                 new_h = heuristic_func(new_state)
-                new_f = new_g + new_h
+            else:
+                # The tile now at blank_pos slid over from new_blank_pos
+                new_h = current_h + delta[new_state[blank_pos]][new_blank_pos][blank_pos]
+            new_f = new_g + new_h
 
-                heapq.heappush(open_list, (new_f, new_h, new_g, new_state, (current_state, parent)))
+            heapq.heappush(open_list, (new_f, new_h, new_g, new_state, (current_state, parent)))
 
     # If no solution found
     return None, nodes_explored, 0
 
 
+def _unwind(node):
+    """Reconstruct the path from the start to a (state, parent) chain's head."""
+    path = []
+    while node is not None:
+        path.append(node[0])
+        node = node[1]
+    path.reverse()
+    return path
+
+
 def plot_puzzle(state, ax):
-    """Plot the 8-puzzle state."""
+    """Plot the puzzle state."""
+    width = board_width(state)
+    top = width - 1
     ax.clear()
     ax.set_xticks([])
     ax.set_yticks([])
-    for i in range(3):
-        for j in range(3):
-            tile = state[i * 3 + j]
+    for i in range(width):
+        for j in range(width):
+            tile = state[i * width + j]
             if tile != 0:
-                ax.text(j, 2 - i, str(tile), fontsize=20, ha='center', va='center')
-            ax.add_patch(plt.Rectangle((j - 0.5, 2 - i - 0.5), 1, 1, fill=False, edgecolor='black'))
-    ax.set_xlim(-0.5, 2.5)
-    ax.set_ylim(-0.5, 2.5)
+                ax.text(j, top - i, str(tile), fontsize=20, ha='center', va='center')
+            ax.add_patch(plt.Rectangle((j - 0.5, top - i - 0.5), 1, 1, fill=False, edgecolor='black'))
+    ax.set_xlim(-0.5, top + 0.5)
+    ax.set_ylim(-0.5, top + 0.5)
     ax.set_aspect('equal')
 
 
@@ -122,7 +169,7 @@ def main():
 
     for idx, initial_state in enumerate(initial_states):
         print(f"Testing initial state {idx + 1}: {initial_state}")
-        for heuristic_name, heuristic_func in [('H1', h1), ('H2', h2)]:
+        for heuristic_name, heuristic_func in [('H1', h1), ('H2', h2), ('PDB', get_pdb())]:
             print(f"Using heuristic {heuristic_name}:")
             path, nodes_explored, depth = a_star(initial_state, heuristic_func)
             if path:
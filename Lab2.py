@@ -4,72 +4,131 @@ from collections import deque
 import time
 
 def bidirectional_bfs(graph, start, end):
+    """Level-by-level BFS from both ends, always expanding the smaller frontier."""
     if start == end:
         return [start]
 
-    # Frontiers
-    front_start = {start}
-    front_end = {end}
-    # Parent Trackers
+    # Parent trackers double as each side's visited set
     parent_start = {start: None}
     parent_end = {end: None}
-
-    visited_start = set()
-    visited_end = set()
+    depth_start = {start: 0}
+    depth_end = {end: 0}
+    front_start = [start]
+    front_end = [end]
 
     while front_start and front_end:
-        # EXPAND FROM START
-        new_front_start = set()
-        for node in front_start:
-            for neighbor in graph.neighbors(node):
-                if neighbor not in visited_start:
-                    parent_start[neighbor] = node
-                    new_front_start.add(neighbor)
-                    if neighbor in front_end:
-                        return construct_path(parent_start, parent_end, neighbor)
-        visited_start.update(front_start)
-        front_start = new_front_start
-
-        # Expand from the end
-        new_front_end = set()
-        for node in front_end:
-            for neighbor in graph.neighbors(node):
-                parent_end[neighbor] = node
-                new_front_end.add(neighbor)
-                if neighbor in front_start:
-                    return construct_path(parent_start, parent_end, neighbor)
-        visited_end.update(front_end)
-        front_end = new_front_end
+        if len(front_start) <= len(front_end):
+            front_start, meeting = expand_level(graph, front_start, parent_start, depth_start, depth_end)
+        else:
+            front_end, meeting = expand_level(graph, front_end, parent_end, depth_end, depth_start)
+        if meeting is not None:
+            return construct_path(parent_start, parent_end, meeting)
 
     return None  # No path found
 
+def expand_level(graph, frontier, parent, depth, other_depth):
+    """Expand one whole frontier level; returns (next frontier, meeting node or None)."""
+    next_frontier = []
+    meeting = None
+    for node in frontier:
+        for neighbor in graph.neighbors(node):
+            if neighbor in depth:
+                continue
+            parent[neighbor] = node
+            depth[neighbor] = depth[node] + 1
+            if neighbor in other_depth:
+                # Finish the level and keep the meeting node closest to the other root,
+                # which makes the joined path a shortest one
+                if meeting is None or other_depth[neighbor] < other_depth[meeting]:
+                    meeting = neighbor
+            else:
+                next_frontier.append(neighbor)
+    return next_frontier, meeting
+
+def construct_path(parent_start, parent_end, meeting):
+    """Join the start-side path to the meeting node with the end-side path back from it."""
+    path = walk_back(parent_start, meeting)
+    node = parent_end[meeting]
+    while node is not None:
+        path.append(node)
+        node = parent_end[node]
+    return path
+
+def walk_back(parent, node):
+    """Follow parent links from node back to the root and return the path root-first."""
+    path = []
+    while node is not None:
+        path.append(node)
+        node = parent[node]
+    path.reverse()
+    return path
+
 def bfs(graph, start, end):
-    queue = deque([(start, [start])])
-    visited = set()
+    """Breadth-first search with a parent map; nodes are marked when enqueued."""
+    if start == end:
+        return [start]
+    parent = {start: None}
+    queue = deque([start])
     while queue:
-        current, path = queue.popleft()
-        if current in visited:
-            continue
-        visited.add(current)
+        current = queue.popleft()
         for neighbor in graph.neighbors(current):
+            if neighbor in parent:
+                continue
+            parent[neighbor] = current
             if neighbor == end:
-                return path + [neighbor]
-            queue.append((neighbor, path + [neighbor]))
+                return walk_back(parent, end)
+            queue.append(neighbor)
     return None
 
-def dfs(graph, start, end, path=None, visited=None):
-    if path is None:
-        path = [start]
-    if visited is None:
-        visited = set()
+_DONE = object()  # Sentinel for an exhausted neighbor iterator
+
+def _depth_limited_dfs(graph, start, end, depth_limit=None):
+    """Iterative DFS; returns (path or None, whether the depth limit cut off any branch)."""
     if start == end:
-        return path
-    visited.add(start)
-    for neighbor in graph.neighbors(start):
-        if neighbor not in visited:
-            result = dfs(graph, neighbor, end, path + [neighbor], visited)
-            if result:
-                return result
+        return [start], False
+    # depth_of records the shallowest depth each node was entered at. Without a
+    # limit a node is entered once, like the recursive version; with one, a node
+    # is re-entered when reached by a shorter route so no path within the limit is missed.
+    depth_of = {start: 0}
+    path = [start]
+    stack = [iter(graph.neighbors(start))]
+    cut_off = False
+    while stack:
+        neighbor = next(stack[-1], _DONE)
+        if neighbor is _DONE:
+            stack.pop()
+            path.pop()
+            continue
+        depth = len(path)
+        known = depth_of.get(neighbor)
+        if known is not None and (depth_limit is None or known <= depth):
+            continue
+        if depth_limit is not None and depth > depth_limit:
+            cut_off = True
+            continue
+        if neighbor == end:
+            return path + [neighbor], cut_off
+        depth_of[neighbor] = depth
+        path.append(neighbor)
+        stack.append(iter(graph.neighbors(neighbor)))
+    return None, cut_off
+
+def dfs(graph, start, end, depth_limit=None):
+    """Depth-first search with an explicit stack; depth_limit caps the path length in edges."""
+    return _depth_limited_dfs(graph, start, end, depth_limit)[0]
+
+def iddfs(graph, start, end, max_depth=None):
+    """Iterative deepening DFS: depth-limited searches with limits 0, 1, 2, ...
+
+    Returns a shortest path like BFS while only holding one path in memory.
+    Stops early once a limit is reached without any branch being cut off.
+    """
+    depth_limit = 0
+    while max_depth is None or depth_limit <= max_depth:
+        path, cut_off = _depth_limited_dfs(graph, start, end, depth_limit)
+        if path is not None or not cut_off:
+            return path
+        depth_limit += 1
     return None
 
 def visualize_graph(graph, path, title="Graph"):
@@ -82,26 +141,25 @@ def visualize_graph(graph, path, title="Graph"):
     plt.title(title)
     plt.show()
 
-# Create the graph
-city_graph = nx.Graph()
-city_graph.add_edges_from([
-    ("A", "B"), ("A", "C"), ("B", "D"), ("C", "E"),
-    ("D", "E"), ("D", "F"), ("E", "F"), ("F", "G")
-])
-
-# Start and end nodes
-start_node = "A"
-end_node = "G"
-
-# Compare methods
-start_time = time.time()
-bfs_path = bfs(city_graph, start_node, end_node)
-print("BFS Path:", bfs_path, "Time:", time.time() - start_time)
-
-start_time = time.time()
-dfs_path = dfs(city_graph, start_node, end_node)
-print("DFS Path:", dfs_path, "Time:", time.time() - start_time)
-
-start_time = time.time()
-bidirectional_path = bidirectional_bfs(city_graph, start_node, end_node)
-print("Bi-directional BFS Path:", bidirectional_path, "Time:", time.time() - start_time)
+def make_city_graph():
+    """The small road network used by the lab demo."""
+    city_graph = nx.Graph()
+    city_graph.add_edges_from([
+        ("A", "B"), ("A", "C"), ("B", "D"), ("C", "E"),
+        ("D", "E"), ("D", "F"), ("E", "F"), ("F", "G")
+    ])
+    return city_graph
+
+if __name__ == "__main__":
+    # Create the graph
+    city_graph = make_city_graph()
+
+    # Start and end nodes
+    start_node = "A"
+    end_node = "G"
+
+    # Compare methods (see benchmark_lab2.py for repeatable timings on larger graphs)
+    for name, search in [("BFS", bfs), ("DFS", dfs), ("IDDFS", iddfs), ("Bi-directional BFS", bidirectional_bfs)]:
+        start_time = time.perf_counter()
+        path = search(city_graph, start_node, end_node)
+        print(f"{name} Path:", path, "Time:", time.perf_counter() - start_time)
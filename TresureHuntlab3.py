@@ -1,8 +1,9 @@
+import heapq
 import tkinter as tk
-from queue import PriorityQueue
 import numpy as np
-from typing import List, Tuple
-import time
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from search_animation import SPEEDS, SearchAnimation
 
 
 class TreasureHunt:
@@ -14,6 +15,41 @@ class TreasureHunt:
         """Calculate Manhattan distance between two points."""
         return abs(a[0] - b[0]) + abs(a[1] - b[1])
 
+    def best_first_events(self, start: Tuple[int, int], target: Tuple[int, int]) -> Iterator[Tuple[str, object]]:
+        """Greedy best-first search by Manhattan distance, as a stream of events.
+
+        Yields ("expand", cell) as each cell is taken off the frontier,
+        ("frontier", cell) as cells are queued and ("path", cells) at the
+        target. Returns (path or None, nodes explored).
+        """
+        frontier = [(0, start)]
+        came_from: Dict[Tuple[int, int], Optional[Tuple[int, int]]] = {start: None}
+        nodes_explored = 0
+
+        while frontier:
+            _, current = heapq.heappop(frontier)
+            yield "expand", current
+
+            if current == target:  # If goal is reached
+                path = []
+                while current:
+                    path.append(current)
+                    current = came_from[current]
+                path.reverse()
+                yield "path", path
+                return path, nodes_explored
+
+            nodes_explored += 1
+            for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:  # Move in 4 directions
+                neighbor = (current[0] + dx, current[1] + dy)
+                if 0 <= neighbor[0] < self.grid_size and 0 <= neighbor[1] < self.grid_size:
+                    if neighbor not in came_from:
+                        heapq.heappush(frontier, (self.manhattan_distance(neighbor, target), neighbor))
+                        came_from[neighbor] = current
+                        yield "frontier", neighbor
+
+        return None, nodes_explored
+
 
 class TreasureHuntGUI:
     def __init__(self, root, grid_size: int, cell_size: int = 50):  # Reduced cell size
@@ -52,7 +88,7 @@ class TreasureHuntGUI:
         speed_frame.pack(fill='x')
         tk.Label(speed_frame, text="Speed").pack(side=tk.LEFT)
         self.speed_var = tk.StringVar(value="Normal")
-        self.speed_menu = tk.OptionMenu(speed_frame, self.speed_var, "Slow", "Normal", "Fast")
+        self.speed_menu = tk.OptionMenu(speed_frame, self.speed_var, *SPEEDS)
         self.speed_menu.pack(side=tk.LEFT, padx=5)
 
         # Node selection
@@ -98,36 +134,46 @@ class TreasureHuntGUI:
             tk.Canvas(frame, width=20, height=20, bg=color).pack(side=tk.LEFT, padx=5)
             tk.Label(frame, text=text).pack(side=tk.LEFT)
 
+        self.cell_items: Dict[Tuple[int, int], Tuple[int, int]] = {}  # cell -> (rectangle, text)
+        self.animation = None
         self.initialize_game()
 
     def generate_node_options(self):
         """Generate a list of node options for the menu."""
         return [f"({i}, {j})" for i in range(self.grid_size) for j in range(self.grid_size)]
 
-    def get_animation_delay(self):
-        speeds = {"Slow": 1000, "Normal": 500, "Fast": 100}
-        return speeds[self.speed_var.get()] / 1000  # Convert to seconds
-
     def draw_grid(self):
         """Draw the initial grid with heuristic values."""
         self.canvas.delete("all")
+        self.cell_items.clear()
         for i in range(self.grid_size):
             for j in range(self.grid_size):
-                self.draw_cell((i, j), "white", str(self.hunt.grid[i, j]))
+                self.cell_items[(i, j)] = self.draw_cell((i, j), "white", str(self.hunt.grid[i, j]))
 
-    def draw_cell(self, pos: Tuple[int, int], color: str, text: str = "", show_heuristic: bool = True):
+    def draw_cell(self, pos: Tuple[int, int], color: str, text: str = "", show_heuristic: bool = True) -> Tuple[int, int]:
         """Draw a colored cell with heuristic value and optional text."""
         x1 = pos[1] * self.cell_size
         y1 = pos[0] * self.cell_size
         x2 = x1 + self.cell_size
         y2 = y1 + self.cell_size
 
-        self.canvas.create_rectangle(x1, y1, x2, y2, fill=color, outline="gray", tags="cell")
-        if text:
-            self.canvas.create_text(x1 + self.cell_size / 2, y1 + self.cell_size / 2, text=text, font=("Arial", 10, "bold"))
+        rect = self.canvas.create_rectangle(x1, y1, x2, y2, fill=color, outline="gray", tags="cell")
+        label = self.canvas.create_text(x1 + self.cell_size / 2, y1 + self.cell_size / 2, text=text,
+                                        font=("Arial", 10, "bold"))
+        return rect, label
+
+    def color_cell(self, pos: Tuple[int, int], color: str, text: Optional[str] = None):
+        """Recolor an existing cell (and optionally relabel it) without adding canvas items."""
+        rect, label = self.cell_items[pos]
+        self.canvas.itemconfigure(rect, fill=color)
+        if text is not None:
+            self.canvas.itemconfigure(label, text=text)
 
     def initialize_game(self):
         """Set up the initial game state with start and goal positions."""
+        if self.animation is not None:
+            self.animation.cancel()
+            self.animation = None
         self.start_pos = eval(self.start_var.get())  # Start at top-left corner
         self.target_pos = eval(self.end_var.get())  # Goal at bottom-right corner
         self.hunt = TreasureHunt(self.grid_size)
@@ -135,59 +181,55 @@ class TreasureHuntGUI:
         self.draw_grid()
 
         # Highlight the start and goal positions
-        self.draw_cell(self.start_pos, "green", "S")
-        self.draw_cell(self.target_pos, "gold", "G")
+        self.color_cell(self.start_pos, "green", "S")
+        self.color_cell(self.target_pos, "gold", "G")
 
         # Reset statistics
         self.nodes_explored_var.set("Nodes explored: 0")
         self.path_length_var.set("Path length: 0")
 
     def start_hunt(self):
-        """Run Best-First Search to find the treasure."""
-        frontier = PriorityQueue()
-        frontier.put((0, self.start_pos))
-        came_from = {}
-        nodes_explored = 0
-        came_from[self.start_pos] = None
-
-        while not frontier.empty():
-            _, current = frontier.get()
-
+        """Run Best-First Search to find the treasure, animated at the chosen speed."""
+        if self.animation is not None:
+            self.animation.cancel()  # Pressed again mid-hunt: start over from the start node
+        events = self.hunt.best_first_events(self.start_pos, self.target_pos)
+        self.current = None
+        self.explored = 0
+        self.animation = SearchAnimation(self.root, events, self._on_hunt_event, self._on_hunt_done,
+                                         self._on_hunt_frame, rate=SPEEDS[self.speed_var.get()]).start()
+
+    def _mark_explored(self):
+        """Color the previous current node as done; start and target keep their colors."""
+        if self.current is not None and self.current not in (self.start_pos, self.target_pos):
+            self.color_cell(self.current, "pink")
+
+    def _on_hunt_event(self, kind, payload):
+        """Paint one search event: the expanded node, a new frontier node or the final path."""
+        if kind == "expand":
+            self._mark_explored()
+            self.current = payload
             # Highlight the current node being explored
-            self.draw_cell(current, "yellow")
-            self.root.update()
-            time.sleep(self.get_animation_delay())
-
-            if current == self.target_pos:  # If goal is reached
-                path = []
-                while current:
-                    path.append(current)
-                    current = came_from.get(current)
-                path.reverse()
-
-                # Draw the path
-                for pos in path:
-                    self.draw_cell(pos, "red")
-                    self.root.update()
-                    time.sleep(self.get_animation_delay())
-
-                self.path_length_var.set(f"Path length: {len(path)}")
-                return
-
-            nodes_explored += 1
-            self.nodes_explored_var.set(f"Nodes explored: {nodes_explored}")
-
-            for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:  # Move in 4 directions
-                neighbor = (current[0] + dx, current[1] + dy)
-                if 0 <= neighbor[0] < self.grid_size and 0 <= neighbor[1] < self.grid_size:
-                    priority = self.hunt.manhattan_distance(neighbor, self.target_pos)
-                    if neighbor not in came_from:
-                        frontier.put((priority, neighbor))
-                        came_from[neighbor] = current
-
-            # Mark explored nodes
-            if current != self.start_pos and current != self.target_pos:
-                self.draw_cell(current, "pink")
+            self.color_cell(payload, "yellow")
+            if payload != self.target_pos:
+                self.explored += 1
+        elif kind == "frontier" and payload != self.target_pos:
+            self.color_cell(payload, "light green")
+        elif kind == "path":
+            for pos in payload:
+                self.color_cell(pos, "red")
+
+    def _on_hunt_frame(self):
+        """Refresh the node counter once per animation frame."""
+        self.nodes_explored_var.set(f"Nodes explored: {self.explored}")
+
+    def _on_hunt_done(self, result):
+        """Report the path length, or finish coloring when the treasure is unreachable."""
+        self.animation = None
+        path, _ = result
+        if path is None:
+            self._mark_explored()
+        else:
+            self.path_length_var.set(f"Path length: {len(path)}")
 
 
 if __name__ == "__main__":
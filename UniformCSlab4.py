@@ -1,11 +1,17 @@
 import tkinter as tk
-from queue import PriorityQueue
-from typing import Dict, List, Tuple
+from tkinter import filedialog
+from typing import Dict, Iterator, List, Tuple
 import random
 import math
-from collections import deque
+
+from graph_generators import random_geometric_graph
+from graph_io import load_graph, save_graph
+from graph_search import SearchResult, breadth_first_search, dijkstra
+from landmarks import LandmarkIndex
 
 class GraphNode:
+    __slots__ = ("x", "y", "id", "neighbors")
+
     def __init__(self, x: int, y: int, node_id: str):
         self.x = x
         self.y = y
@@ -21,14 +27,108 @@ class GraphNode:
 class Graph:
     def __init__(self):
         self.nodes: Dict[str, GraphNode] = {}
+        self.version = 0  # Bumped on every change so cached preprocessing can tell it is stale
 
     def add_node(self, node_id: str, x: int, y: int):
         self.nodes[node_id] = GraphNode(x, y, node_id)
+        self.version += 1
 
     def add_edge(self, from_id: str, to_id: str, weight: float):
         if from_id in self.nodes and to_id in self.nodes:
             self.nodes[from_id].add_neighbor(self.nodes[to_id], weight)
             self.nodes[to_id].add_neighbor(self.nodes[from_id], weight)  # Undirected graph
+            self.version += 1
+
+    def neighbors(self, node_id: str) -> Iterator[Tuple[str, float]]:
+        """(neighbor id, edge weight) pairs; the interface the search engines use."""
+        for neighbor, weight in self.nodes[node_id].neighbors.items():
+            yield neighbor.id, weight
+
+class GraphRenderer:
+    """Draws a graph onto a canvas once and then updates individual items.
+
+    Each undirected edge gets one line and one weight label, indexed by its
+    sorted endpoint pair; each node gets one oval and one label. Highlighting
+    a path or resetting it only reconfigures the affected items. Labels are
+    hidden while zoomed out too far for them to be readable.
+    """
+    NODE_RADIUS = 10
+    EDGE_STYLE = {"fill": "black", "width": 2}
+    PATH_STYLE = {"fill": "blue", "width": 3}
+    ZOOM_STEP = 1.2
+
+    def __init__(self, canvas: tk.Canvas):
+        self.canvas = canvas
+        self.edge_items: Dict[Tuple[str, str], Tuple[int, int]] = {}  # (a, b) with a < b -> (line, label)
+        self.node_items: Dict[str, Tuple[int, int]] = {}  # node id -> (oval, label)
+        self.highlighted: List[Tuple[str, str]] = []
+        self.zoom = 1.0
+        self.label_zoom = 1.0
+        self.labels_shown = True
+
+        canvas.bind("<MouseWheel>", self.on_wheel)  # Windows and macOS
+        canvas.bind("<Button-4>", lambda event: self.zoom_at(event.x, event.y, self.ZOOM_STEP))  # X11
+        canvas.bind("<Button-5>", lambda event: self.zoom_at(event.x, event.y, 1 / self.ZOOM_STEP))
+        canvas.bind("<ButtonPress-1>", lambda event: canvas.scan_mark(event.x, event.y))
+        canvas.bind("<B1-Motion>", lambda event: canvas.scan_dragto(event.x, event.y, gain=1))
+
+    def draw(self, graph, node_colors: Dict[str, str]):
+        """Create every item for a new graph; the only full redraw."""
+        self.canvas.delete("all")
+        self.edge_items.clear()
+        self.node_items.clear()
+        self.highlighted = []
+        self.zoom = 1.0
+        self.labels_shown = True  # New labels start out visible
+        # Bigger graphs need more zoom before labels stop overlapping
+        self.label_zoom = max(1.0, math.sqrt(len(graph.nodes) / 100))
+
+        for node_id, node in graph.nodes.items():
+            for neighbor_id, weight in graph.neighbors(node_id):
+                key = (node_id, neighbor_id) if node_id < neighbor_id else (neighbor_id, node_id)
+                if key in self.edge_items:
+                    continue  # Already drawn from the other endpoint
+                neighbor = graph.nodes[neighbor_id]
+                line = self.canvas.create_line(node.x, node.y, neighbor.x, neighbor.y, **self.EDGE_STYLE)
+                label = self.canvas.create_text((node.x + neighbor.x) / 2, (node.y + neighbor.y) / 2,
+                                                text=str(weight), fill="blue", tags=("label",))
+                self.edge_items[key] = (line, label)
+
+        r = self.NODE_RADIUS
+        for node_id, node in graph.nodes.items():
+            oval = self.canvas.create_oval(node.x - r, node.y - r, node.x + r, node.y + r,
+                                           fill=node_colors.get(node_id, "gray"))
+            label = self.canvas.create_text(node.x, node.y, text=node_id, fill="white", tags=("label",))
+            self.node_items[node_id] = (oval, label)
+        self.update_labels()
+
+    def highlight_path(self, path: List[str]):
+        self.clear_highlight()
+        for a, b in zip(path, path[1:]):
+            key = (a, b) if a < b else (b, a)
+            self.canvas.itemconfigure(self.edge_items[key][0], **self.PATH_STYLE)
+            self.highlighted.append(key)
+
+    def clear_highlight(self):
+        for key in self.highlighted:
+            self.canvas.itemconfigure(self.edge_items[key][0], **self.EDGE_STYLE)
+        self.highlighted = []
+
+    def on_wheel(self, event):
+        self.zoom_at(event.x, event.y, self.ZOOM_STEP if event.delta > 0 else 1 / self.ZOOM_STEP)
+
+    def zoom_at(self, x: int, y: int, factor: float):
+        x, y = self.canvas.canvasx(x), self.canvas.canvasy(y)
+        self.canvas.scale("all", x, y, factor, factor)
+        self.zoom *= factor
+        self.update_labels()
+
+    def update_labels(self):
+        # One call on the shared tag toggles every label, and only when the state changes
+        show = self.zoom >= self.label_zoom
+        if show != self.labels_shown:
+            self.canvas.itemconfigure("label", state="normal" if show else "hidden")
+            self.labels_shown = show
 
 class GraphSearchGUI:
     def __init__(self, root):
@@ -43,6 +143,7 @@ class GraphSearchGUI:
         self.canvas_size = 600
         self.canvas = tk.Canvas(self.main_frame, width=self.canvas_size, height=self.canvas_size, bg='white')
         self.canvas.pack(side=tk.LEFT)
+        self.renderer = GraphRenderer(self.canvas)
 
         # Control Panel
         self.control_panel = tk.Frame(self.main_frame)
@@ -53,11 +154,15 @@ class GraphSearchGUI:
         tk.Label(self.control_panel, text="Algorithm:").pack(anchor='w')
         tk.Radiobutton(self.control_panel, text="Uniform Cost Search", variable=self.algo_var, value="UCS").pack(anchor='w')
         tk.Radiobutton(self.control_panel, text="Breadth-First Search", variable=self.algo_var, value="BFS").pack(anchor='w')
+        tk.Radiobutton(self.control_panel, text="A* with Landmarks (ALT)", variable=self.algo_var,
+                       value="ALT").pack(anchor='w')
 
         # Buttons
         tk.Button(self.control_panel, text="Generate New Graph", command=self.generate_graph).pack(fill='x', pady=5)
         tk.Button(self.control_panel, text="Start Search", command=self.start_search).pack(fill='x', pady=5)
         tk.Button(self.control_panel, text="Reset", command=self.reset_visualization).pack(fill='x', pady=5)
+        tk.Button(self.control_panel, text="Save Graph", command=self.save_graph).pack(fill='x', pady=5)
+        tk.Button(self.control_panel, text="Load Graph", command=self.load_graph).pack(fill='x', pady=5)
 
         # Statistics
         self.stats_frame = tk.LabelFrame(self.control_panel, text="Statistics", padx=5, pady=5)
@@ -68,116 +173,70 @@ class GraphSearchGUI:
         tk.Label(self.stats_frame, textvariable=self.nodes_explored_var).pack(anchor='w')
         tk.Label(self.stats_frame, textvariable=self.path_cost_var).pack(anchor='w')
 
+        # Landmark tables are built once per graph and reused across queries
+        self.landmarks = None
+
         # Initialize Graph
         self.generate_graph()
 
     def generate_graph(self):
-        self.graph = Graph()
         num_nodes = 10
 
-        # Generate random nodes
+        # Random nodes, each joined to its nearest neighbors with distance weights
         padding = 50
-        for i in range(num_nodes):
-            x = random.randint(padding, self.canvas_size - padding)
-            y = random.randint(padding, self.canvas_size - padding)
-            self.graph.add_node(str(i), x, y)
+        self.graph = random_geometric_graph(num_nodes, k=2, width=self.canvas_size, height=self.canvas_size,
+                                            padding=padding, seed=random.randrange(2 ** 32), graph_factory=Graph)
+        self.show_graph()
 
-        # Generate random edges with weights
+    def show_graph(self):
         node_ids = list(self.graph.nodes.keys())
-        for i in range(num_nodes):
-            for j in range(i + 1, num_nodes):
-                if random.random() < 0.3:  # 30% chance of creating an edge
-                    weight = round(math.dist(self.graph.nodes[node_ids[i]].get_position(),
-                                             self.graph.nodes[node_ids[j]].get_position()), 2)
-                    self.graph.add_edge(node_ids[i], node_ids[j], weight)
 
         self.start_node = node_ids[0]
         self.goal_node = node_ids[-1]
 
         self.draw_graph()
+        self.nodes_explored_var.set("Nodes explored: 0")
+        self.path_cost_var.set("Path cost: 0")
 
-    def draw_graph(self):
-        self.canvas.delete("all")
+    def save_graph(self):
+        path = filedialog.asksaveasfilename(defaultextension=".npz", filetypes=[("Graph files", "*.npz")])
+        if path:
+            save_graph(self.graph, path)
 
-        # Draw edges
-        for node in self.graph.nodes.values():
-            for neighbor, weight in node.neighbors.items():
-                self.canvas.create_line(node.x, node.y, neighbor.x, neighbor.y, fill="black", width=2)
-                mid_x = (node.x + neighbor.x) // 2
-                mid_y = (node.y + neighbor.y) // 2
-                self.canvas.create_text(mid_x, mid_y, text=str(weight), fill="blue")
+    def load_graph(self):
+        path = filedialog.askopenfilename(filetypes=[("Graph files", "*.npz")])
+        if path:
+            self.graph = load_graph(path)
+            self.show_graph()
 
-        # Draw nodes
-        for node in self.graph.nodes.values():
-            color = "red" if node.id == self.start_node else "green" if node.id == self.goal_node else "gray"
-            self.canvas.create_oval(node.x - 10, node.y - 10, node.x + 10, node.y + 10, fill=color)
-            self.canvas.create_text(node.x, node.y, text=node.id, fill="white")
+    def draw_graph(self):
+        self.renderer.draw(self.graph, {self.start_node: "red", self.goal_node: "green"})
 
     def start_search(self):
         algorithm = self.algo_var.get()
         if algorithm == "UCS":
-            self.uniform_cost_search()
+            result = dijkstra(self.graph, self.start_node, self.goal_node)
         elif algorithm == "BFS":
-            self.breadth_first_search()
-
-    def uniform_cost_search(self):
-        start = self.graph.nodes[self.start_node]
-        goal = self.graph.nodes[self.goal_node]
-        visited = set()
-        pq = PriorityQueue()
-        pq.put((0, start, []))  # (cost, node, path)
-
-        while not pq.empty():
-            cost, current, path = pq.get()
-            if current.id in visited:
-                continue
-            visited.add(current.id)
-            path = path + [current]
-
-            if current == goal:
-                self.highlight_path(path, cost)
-                return
-
-            for neighbor, weight in current.neighbors.items():
-                if neighbor.id not in visited:
-                    pq.put((cost + weight, neighbor, path))
-
-        self.nodes_explored_var.set(f"Nodes explored: {len(visited)}")
-        self.path_cost_var.set("Path cost: No Path Found")
-
-    def breadth_first_search(self):
-        start = self.graph.nodes[self.start_node]
-        goal = self.graph.nodes[self.goal_node]
-        visited = set()
-        queue = deque([(start, [])])  # (node, path)
-
-        while queue:
-            current, path = queue.popleft()
-            if current.id in visited:
-                continue
-            visited.add(current.id)
-            path = path + [current]
-
-            if current == goal:
-                self.highlight_path(path, len(path) - 1)
-                return
-
-            for neighbor in current.neighbors.keys():
-                if neighbor.id not in visited:
-                    queue.append((neighbor, path))
-
-        self.nodes_explored_var.set(f"Nodes explored: {len(visited)}")
-        self.path_cost_var.set("Path cost: No Path Found")
-
-    def highlight_path(self, path, cost):
-        for i in range(len(path) - 1):
-            self.canvas.create_line(path[i].x, path[i].y, path[i + 1].x, path[i + 1].y, fill="blue", width=3)
-
-        self.nodes_explored_var.set(f"Nodes explored: {len(path)}")
-        self.path_cost_var.set(f"Path cost: {cost}")
+            result = breadth_first_search(self.graph, self.start_node, self.goal_node)
+        elif algorithm == "ALT":
+            if self.landmarks is None or self.landmarks.graph is not self.graph:
+                self.landmarks = LandmarkIndex(self.graph)
+            result = self.landmarks.shortest_path(self.start_node, self.goal_node)
+        else:
+            return
+        self.show_result(result)
+
+    def show_result(self, result: SearchResult):
+        self.nodes_explored_var.set(f"Nodes explored: {result.expanded}")
+        if result.path is None:
+            self.renderer.clear_highlight()
+            self.path_cost_var.set("Path cost: No Path Found")
+            return
+        self.renderer.highlight_path(result.path)
+        self.path_cost_var.set(f"Path cost: {round(result.cost, 2)}")
 
     def reset_visualization(self):
-        self.draw_graph()
+        self.renderer.clear_highlight()
         self.nodes_explored_var.set("Nodes explored: 0")
         self.path_cost_var.set("Path cost: 0")
 
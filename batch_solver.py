@@ -0,0 +1,189 @@
+import argparse
+import itertools
+import json
+import os
+import re
+import sys
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from multiprocessing import shared_memory
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from pattern_database import DEFAULT_CACHE_DIR, DEFAULT_PARTITIONS, AdditivePDB, PatternDatabase, get_pdb
+from puzzle_engine import a_star_packed, board_width
+
+HEURISTICS = ("manhattan", "misplaced", "pdb")
+
+# Set in each worker by _init_worker
+_worker_heuristic = None
+_worker_segments: List[shared_memory.SharedMemory] = []
+
+
+def parse_board(line: str) -> Optional[Tuple[int, ...]]:
+    """Read a board from a line of digits separated by spaces, commas or brackets."""
+    tiles = [int(token) for token in re.findall(r"\d+", line)]
+    return tuple(tiles) if tiles else None
+
+
+def read_boards(lines: Iterable[str]) -> Iterator[Tuple[int, Tuple[int, ...]]]:
+    """Yield (line number, board) for every non-empty, non-comment line."""
+    for line_no, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        board = parse_board(line)
+        if board:
+            yield line_no, board
+
+
+def _first_pdb_width(boards: Iterator[Tuple[int, Sequence[int]]]) -> Tuple[List, Optional[int]]:
+    """Read boards up to the first one with a pattern database width; returns those boards and the width."""
+    leading = []
+    for line_no, board in boards:
+        leading.append((line_no, board))
+        if sorted(board) != list(range(len(board))):
+            continue
+        try:
+            width = board_width(board)
+        except ValueError:
+            continue
+        if width in DEFAULT_PARTITIONS:
+            return leading, width
+    return leading, None
+
+
+def share_tables(pdb: AdditivePDB) -> Tuple[List[shared_memory.SharedMemory], List[Dict]]:
+    """Copy each pattern table into a shared-memory block once, for all workers."""
+    segments, specs = [], []
+    for database in pdb.databases:
+        segment = shared_memory.SharedMemory(create=True, size=database.table.nbytes)
+        np.ndarray(database.table.shape, dtype=np.uint8, buffer=segment.buf)[:] = database.table
+        segments.append(segment)
+        specs.append({"name": segment.name, "size": int(database.table.size),
+                      "width": database.width, "tiles": database.tiles})
+    return segments, specs
+
+
+def _init_worker(heuristic: str, specs: List[Dict]):
+    global _worker_heuristic
+    if heuristic != "pdb":
+        _worker_heuristic = heuristic
+        return
+    databases = []
+    for spec in specs:
+        # Pool workers report to the parent's resource tracker, so attaching here
+        # does not hand ownership over; the parent unlinks the blocks when done
+        segment = shared_memory.SharedMemory(name=spec["name"])
+        _worker_segments.append(segment)
+        table = np.ndarray((spec["size"],), dtype=np.uint8, buffer=segment.buf)
+        databases.append(PatternDatabase(spec["width"], spec["tiles"], table))
+    _worker_heuristic = AdditivePDB.from_databases(databases)
+
+
+def solve_one(line_no: int, board: Sequence[int], include_path: bool = False) -> Dict:
+    """Solve a single board with the worker's heuristic and describe the outcome."""
+    result = {"line": line_no, "board": list(board)}
+    if sorted(board) != list(range(len(board))):
+        result["error"] = "Board must contain each tile 0..n-1 exactly once"
+        return result
+    # Pattern tables only fit the board width they were built for
+    width = getattr(_worker_heuristic, "width", None)
+    if width is not None and len(board) != width * width:
+        result["error"] = f"Board is not {width}x{width}, the width of the pattern databases"
+        return result
+    try:
+        path, nodes_explored, depth = a_star_packed(board, _worker_heuristic)
+    except ValueError as exc:
+        result["error"] = str(exc)
+        return result
+    result["solvable"] = path is not None
+    result["depth"] = depth if path is not None else None
+    result["nodes_explored"] = nodes_explored
+    if include_path and path is not None:
+        result["path"] = [list(state) for state in path]
+    return result
+
+
+def _solve_chunk(chunk: List[Tuple[int, Tuple[int, ...]]], include_path: bool) -> List[Dict]:
+    return [solve_one(line_no, board, include_path) for line_no, board in chunk]
+
+
+def solve_batch(boards: Iterable[Tuple[int, Sequence[int]]], heuristic: str = "manhattan",
+                workers: Optional[int] = None, chunk_size: int = 256, include_path: bool = False,
+                cache_dir: str = DEFAULT_CACHE_DIR, width: Optional[int] = None) -> Iterator[Dict]:
+    """Solve (line number, board) pairs across a process pool, yielding results as chunks finish.
+
+    Results stream back in completion order; each carries its input line number.
+    With heuristic="pdb" the pattern tables are placed in shared memory once and
+    every worker maps the same blocks instead of receiving a pickled copy. The
+    tables are for width, by default the width of the first valid board that
+    has pattern databases; boards of any other width are reported as errors.
+    """
+    if heuristic not in HEURISTICS:
+        raise ValueError(f"Unknown heuristic {heuristic!r}; expected one of {HEURISTICS}")
+    workers = workers or os.cpu_count() or 1
+
+    segments: List[shared_memory.SharedMemory] = []
+    specs: List[Dict] = []
+    if heuristic == "pdb":
+        if width is None:
+            boards = iter(boards)
+            leading, width = _first_pdb_width(boards)
+            if not leading:
+                return
+            boards = itertools.chain(leading, boards)
+            # With no usable board at all, every board is reported against the 3x3 tables
+            width = width or 3
+        segments, specs = share_tables(get_pdb(width, cache_dir=cache_dir))
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(heuristic, specs)) as executor:
+            boards_iter = iter(boards)
+            chunks = iter(lambda: list(itertools.islice(boards_iter, chunk_size)), [])
+            # Keep a bounded number of chunks in flight so huge inputs are never fully queued
+            pending = set()
+            for chunk in itertools.islice(chunks, 2 * workers):
+                pending.add(executor.submit(_solve_chunk, chunk, include_path))
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+                    chunk = next(chunks, None)
+                    if chunk:
+                        pending.add(executor.submit(_solve_chunk, chunk, include_path))
+    finally:
+        for segment in segments:
+            segment.close()
+            segment.unlink()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Solve a file of sliding-tile boards in parallel, "
+                                                 "writing one JSON result per line.")
+    parser.add_argument("input", help="File with one board per line, or - for stdin")
+    parser.add_argument("-o", "--output", help="Output file (default: stdout)")
+    parser.add_argument("--heuristic", choices=HEURISTICS, default="manhattan")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=256)
+    parser.add_argument("--paths", action="store_true", help="Include the full solution path")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR, help="Pattern database directory")
+    args = parser.parse_args()
+
+    source = sys.stdin if args.input == "-" else open(args.input)
+    sink = open(args.output, "w") if args.output else sys.stdout
+    try:
+        results = solve_batch(read_boards(source), args.heuristic, args.workers,
+                              args.chunk_size, args.paths, args.cache_dir)
+        for result in results:
+            sink.write(json.dumps(result) + "\n")
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if sink is not sys.stdout:
+            sink.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+import argparse
+import csv
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, Iterator, List, Sequence, Tuple
+
+import networkx as nx
+
+from Lab2 import bfs, bidirectional_bfs, dfs, iddfs, make_city_graph
+
+SEARCHES: Dict[str, Callable] = {
+    "bfs": bfs,
+    "dfs": dfs,
+    "iddfs": iddfs,
+    "bidirectional_bfs": bidirectional_bfs,
+}
+FAMILIES = ("city", "grid", "erdos_renyi", "scale_free")
+FIELDS = ["label", "family", "size", "nodes", "edges", "search", "path_length", "expanded",
+          "repeats", "min_s", "median_s", "mean_s", "peak_kib"]
+
+
+class CountingGraph:
+    """Wraps a graph and counts neighbors() calls, i.e. nodes expanded by a search."""
+
+    def __init__(self, graph):
+        self.graph = graph
+        self.expanded = 0
+
+    def neighbors(self, node):
+        self.expanded += 1
+        return self.graph.neighbors(node)
+
+
+def make_graph(family: str, size: int, seed: int) -> Tuple[nx.Graph, object, object]:
+    """Build one graph of the family and pick its (start, end) query."""
+    if family == "city":
+        return make_city_graph(), "A", "G"
+    if family == "grid":
+        # size is the side length; search corner to corner
+        graph = nx.grid_2d_graph(size, size)
+        return graph, (0, 0), (size - 1, size - 1)
+    if family == "erdos_renyi":
+        graph = nx.fast_gnp_random_graph(size, 4.0 / size, seed=seed)
+    elif family == "scale_free":
+        graph = nx.barabasi_albert_graph(size, 2, seed=seed)
+    else:
+        raise ValueError(f"Unknown graph family {family!r}")
+    # Query the two ends of a long shortest path inside the largest component
+    component = max(nx.connected_components(graph), key=len)
+    first = min(component)
+    distances = nx.single_source_shortest_path_length(graph, first)
+    start = max(distances, key=distances.get)
+    distances = nx.single_source_shortest_path_length(graph, start)
+    return graph, start, max(distances, key=distances.get)
+
+
+def measure(search: Callable, graph, start, end, repeats: int, warmup: int) -> Dict:
+    """Time repeated runs after warmup, then count expansions and peak memory on one more run."""
+    for _ in range(warmup):
+        search(graph, start, end)
+    timings = []
+    for _ in range(repeats):
+        began = time.perf_counter()
+        search(graph, start, end)
+        timings.append(time.perf_counter() - began)
+
+    # Counting and tracing slow the search down, so they get their own run
+    counting = CountingGraph(graph)
+    tracemalloc.start()
+    path = search(counting, start, end)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "path_length": len(path) - 1 if path else None,
+        "expanded": counting.expanded,
+        "repeats": repeats,
+        "min_s": min(timings),
+        "median_s": statistics.median(timings),
+        "mean_s": statistics.fmean(timings),
+        "peak_kib": round(peak / 1024, 1),
+    }
+
+
+def run_suite(families: Sequence[str], sizes: Dict[str, List[int]], searches: Sequence[str],
+              repeats: int = 5, warmup: int = 1, seed: int = 0, label: str = "") -> Iterator[Dict]:
+    """Yield one result row per (family, size, search)."""
+    for family in families:
+        for size in sizes.get(family, [None]):
+            graph, start, end = make_graph(family, size, seed)
+            for name in searches:
+                row = {"label": label, "family": family, "size": size,
+                       "nodes": graph.number_of_nodes(), "edges": graph.number_of_edges(), "search": name}
+                row.update(measure(SEARCHES[name], graph, start, end, repeats, warmup))
+                yield row
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Lab2 graph searches on generated graph families.")
+    parser.add_argument("--families", nargs="+", choices=FAMILIES, default=list(FAMILIES))
+    parser.add_argument("--grid-sizes", type=int, nargs="+", default=[10, 30, 100], help="Grid side lengths")
+    parser.add_argument("--er-sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--sf-sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--searches", nargs="+", choices=list(SEARCHES),
+                        default=["bfs", "dfs", "bidirectional_bfs"],
+                        help="iddfs is left out by default; it is slow on large graphs")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--label", default="", help="Tag stored with every row, e.g. a version or commit")
+    parser.add_argument("--format", choices=("csv", "json"), default="csv")
+    parser.add_argument("-o", "--output", help="Output file (default: stdout)")
+    args = parser.parse_args()
+
+    sizes = {"grid": args.grid_sizes, "erdos_renyi": args.er_sizes, "scale_free": args.sf_sizes}
+    rows = run_suite(args.families, sizes, args.searches, args.repeats, args.warmup, args.seed, args.label)
+    sink = open(args.output, "w", newline="") if args.output else sys.stdout
+    try:
+        if args.format == "csv":
+            writer = csv.DictWriter(sink, fieldnames=FIELDS)
+            writer.writeheader()
+            for row in rows:
+                writer.writerow(row)
+                sink.flush()
+        else:
+            json.dump({"python": platform.python_version(), "label": args.label, "results": list(rows)},
+                      sink, indent=2)
+            sink.write("\n")
+    finally:
+        if sink is not sys.stdout:
+            sink.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+import argparse
+import csv
+import importlib.util
+import os
+import random
+import statistics
+import sys
+import timeit
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+from puzzle_engine import goal_state, neighbor_table
+
+# 8Puzzlecomplete.py starts with a digit, so it cannot be imported by name
+_spec = importlib.util.spec_from_file_location(
+    "puzzle_complete", os.path.join(os.path.dirname(os.path.abspath(__file__)), "8Puzzlecomplete.py"))
+puzzle_complete = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(puzzle_complete)
+
+HEURISTICS = {"h1": puzzle_complete.h1, "h2": puzzle_complete.h2}
+ENGINES = ("tuple", "packed", "bidirectional")
+# The states 8Puzzlecomplete.main() tries
+MAIN_STATES = [
+    (1, 2, 3, 4, 5, 6, 7, 0, 8),
+    (1, 2, 3, 4, 5, 6, 0, 7, 8),
+    (1, 2, 3, 0, 4, 6, 7, 5, 8),
+    (8, 1, 3, 4, 0, 2, 7, 6, 5),
+]
+FIELDS = ["board", "heuristic", "engine", "depth", "nodes", "repeats", "min_us", "median_us", "nodes_per_s"]
+
+
+def random_walk_board(moves: int, rng: random.Random, width: int = 3) -> Tuple[int, ...]:
+    """A solvable board from a random walk of the blank, never undoing the previous move."""
+    state = list(goal_state(width))
+    neighbors = neighbor_table(width)
+    blank, previous = len(state) - 1, None
+    for _ in range(moves):
+        cell = rng.choice([cell for cell in neighbors[blank] if cell != previous])
+        state[blank], state[cell] = state[cell], 0
+        previous, blank = blank, cell
+    return tuple(state)
+
+
+def measure(board: Sequence[int], heuristic: str, engine: str, repeats: int, min_time: float = 0.05) -> Dict:
+    """Best-of-repeats timing of one a_star call, each repeat looping for about min_time seconds."""
+    def run():
+        return puzzle_complete.a_star(board, HEURISTICS[heuristic], engine=engine)
+
+    path, nodes, depth = run()
+    timer = timeit.Timer(run)
+    number, _ = timer.autorange()
+    number = max(1, int(number * min_time / 0.2))
+    timings = [total / number for total in timer.repeat(repeats, number)]
+    return {
+        "board": " ".join(map(str, board)), "heuristic": heuristic, "engine": engine,
+        "depth": depth if path else None, "nodes": nodes, "repeats": repeats,
+        "min_us": round(min(timings) * 1e6, 1), "median_us": round(statistics.median(timings) * 1e6, 1),
+        "nodes_per_s": round(nodes / min(timings)),
+    }
+
+
+def run_suite(boards: Sequence[Tuple[int, ...]], heuristics: Sequence[str], engines: Sequence[str],
+              repeats: int) -> Iterator[Dict]:
+    for board in boards:
+        for heuristic in heuristics:
+            for engine in engines:
+                yield measure(board, heuristic, engine, repeats)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time the 8-puzzle A* engines against each other.")
+    parser.add_argument("--random", type=int, default=5, help="Random-walk boards to add to the main() states")
+    parser.add_argument("--walk", type=int, default=40, help="Random-walk length for those boards")
+    parser.add_argument("--heuristics", nargs="+", choices=list(HEURISTICS), default=["h1", "h2"])
+    parser.add_argument("--engines", nargs="+", choices=ENGINES, default=["tuple", "packed"])
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    boards: List[Tuple[int, ...]] = MAIN_STATES + [random_walk_board(args.walk, rng) for _ in range(args.random)]
+    writer = csv.DictWriter(sys.stdout, fieldnames=FIELDS)
+    writer.writeheader()
+    for row in run_suite(boards, args.heuristics, args.engines, args.repeats):
+        writer.writerow(row)
+        sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
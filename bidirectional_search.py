@@ -0,0 +1,179 @@
+import heapq
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from puzzle_engine import a_star_packed, board_width, goal_state, is_solvable, neighbor_table
+
+State = Tuple[int, ...]
+EPSILON = 1  # Cheapest move cost; every slide costs one
+
+
+def target_heuristic(kind: str, target: Sequence[int]) -> Callable[[State], int]:
+    """Misplaced-tiles or Manhattan heuristic toward an arbitrary target board."""
+    width = board_width(target)
+    cells = width * width
+    target_idx = [0] * cells
+    for idx, tile in enumerate(target):
+        target_idx[tile] = idx
+    cost = [[0] * cells for _ in range(cells)]
+    for tile in range(1, cells):
+        goal_row, goal_col = divmod(target_idx[tile], width)
+        for idx in range(cells):
+            row, col = divmod(idx, width)
+            if kind == 'misplaced':
+                cost[tile][idx] = int(idx != target_idx[tile])
+            elif kind == 'manhattan':
+                cost[tile][idx] = abs(row - goal_row) + abs(col - goal_col)
+            else:
+                raise ValueError(f"Unknown heuristic {kind!r}")
+
+    def heuristic(state: State) -> int:
+        return sum(cost[tile][idx] for idx, tile in enumerate(state))
+
+    return heuristic
+
+
+class _Frontier:
+    """One search direction: open/closed g-values and lazily cleaned heaps."""
+
+    def __init__(self, root: State, heuristic: Callable[[State], int]):
+        self.heuristic = heuristic
+        self.open: Dict[State, int] = {}
+        self.closed: Dict[State, int] = {}
+        self.parent: Dict[State, Optional[State]] = {root: None}
+        self.h_cache: Dict[State, int] = {}
+        # Heaps ordered by MM priority max(f, 2g), by f, and by g
+        self.by_priority: List[Tuple[int, int, State]] = []
+        self.by_f: List[Tuple[int, State, int]] = []
+        self.by_g: List[Tuple[int, State]] = []
+        self.add(root, 0, None)
+
+    def h(self, state: State) -> int:
+        value = self.h_cache.get(state)
+        if value is None:
+            value = self.h_cache[state] = self.heuristic(state)
+        return value
+
+    def add(self, state: State, g: int, parent: Optional[State]):
+        self.open[state] = g
+        self.parent[state] = parent
+        f = g + self.h(state)
+        heapq.heappush(self.by_priority, (max(f, 2 * g), g, state))
+        heapq.heappush(self.by_f, (f, state, g))
+        heapq.heappush(self.by_g, (g, state))
+
+    def min_priority(self) -> float:
+        # Entries whose g no longer matches the open list are stale
+        while self.by_priority and self.open.get(self.by_priority[0][2]) != self.by_priority[0][1]:
+            heapq.heappop(self.by_priority)
+        return self.by_priority[0][0] if self.by_priority else float('inf')
+
+    def min_f(self) -> float:
+        while self.by_f and self.open.get(self.by_f[0][1]) != self.by_f[0][2]:
+            heapq.heappop(self.by_f)
+        return self.by_f[0][0] if self.by_f else float('inf')
+
+    def min_g(self) -> float:
+        while self.by_g and self.open.get(self.by_g[0][1]) != self.by_g[0][0]:
+            heapq.heappop(self.by_g)
+        return self.by_g[0][0] if self.by_g else float('inf')
+
+    def pop(self) -> Tuple[State, int]:
+        self.min_priority()
+        _, g, state = heapq.heappop(self.by_priority)
+        del self.open[state]
+        self.closed[state] = g
+        return state, g
+
+    def path_to_root(self, state: State) -> List[State]:
+        path = []
+        while state is not None:
+            path.append(state)
+            state = self.parent[state]
+        return path
+
+
+def mm_search(initial_state: Sequence[int], heuristic: str = 'manhattan',
+              goal: Optional[Sequence[int]] = None):
+    """Bidirectional meet-in-the-middle (MM) search.
+
+    Both frontiers expand by priority max(g + h, 2g), so neither direction
+    expands a node beyond the midpoint of an optimal path. The search stops
+    once the best meeting cost U is no larger than the lower bound
+    max(C, fmin_F, fmin_B, gmin_F + gmin_B + epsilon), which guarantees U
+    is optimal for admissible heuristics. Returns (path, nodes_explored,
+    depth) like a_star, where nodes_explored counts expansions in both
+    directions.
+    """
+    start = tuple(initial_state)
+    width = board_width(start)
+    goal = tuple(goal) if goal is not None else goal_state(width)
+    if not is_solvable(start, width, goal):
+        return None, 0, 0
+    if start == goal:
+        return [start], 0, 0
+
+    neighbors = neighbor_table(width)
+    forward = _Frontier(start, target_heuristic(heuristic, goal))
+    backward = _Frontier(goal, target_heuristic(heuristic, start))
+    best_cost = float('inf')
+    meeting: Optional[State] = None
+    nodes_explored = 0
+
+    while forward.open and backward.open:
+        c = min(forward.min_priority(), backward.min_priority())
+        lower_bound = max(c, forward.min_f(), backward.min_f(), forward.min_g() + backward.min_g() + EPSILON)
+        if best_cost <= lower_bound:
+            break
+
+        # Expand the side whose cheapest priority equals C
+        side, other = (forward, backward) if forward.min_priority() <= backward.min_priority() \
+            else (backward, forward)
+        state, g = side.pop()
+        nodes_explored += 1
+
+        blank = state.index(0)
+        for cell in neighbors[blank]:
+            tiles = list(state)
+            tiles[blank], tiles[cell] = tiles[cell], 0
+            child = tuple(tiles)
+            child_g = g + 1
+            known_g = side.open.get(child, side.closed.get(child))
+            if known_g is not None and known_g <= child_g:
+                continue
+            side.closed.pop(child, None)
+            side.add(child, child_g, state)
+
+            other_g = other.open.get(child)
+            if other_g is not None and child_g + other_g < best_cost:
+                best_cost = child_g + other_g
+                meeting = child
+
+    if meeting is None:
+        return None, nodes_explored, 0
+    path = forward.path_to_root(meeting)
+    path.reverse()
+    path.extend(backward.path_to_root(meeting)[1:])
+    return path, nodes_explored, best_cost
+
+
+def main():
+    """Compare MM against unidirectional A* on the 8Puzzlecomplete test states."""
+    initial_states = [
+        (1, 2, 3, 4, 5, 6, 7, 8, 0),
+        (1, 2, 3, 4, 5, 6, 7, 0, 8),
+        (1, 2, 3, 4, 5, 6, 0, 7, 8),
+        (1, 2, 3, 0, 4, 6, 7, 5, 8),
+        (8, 1, 3, 4, 0, 2, 7, 6, 5),
+        (8, 6, 7, 2, 5, 4, 3, 0, 1),  # One of the two hardest 8-puzzle boards (31 moves)
+    ]
+    print(f"{'state':<30} {'heuristic':<10} {'depth':>5} {'A*':>8} {'MM':>8}")
+    for state in initial_states:
+        for heuristic in ('misplaced', 'manhattan'):
+            _, a_star_nodes, depth = a_star_packed(state, heuristic)
+            _, mm_nodes, mm_depth = mm_search(state, heuristic)
+            assert depth == mm_depth
+            print(f"{str(state):<30} {heuristic:<10} {depth:>5} {a_star_nodes:>8} {mm_nodes:>8}")
+
+
+if __name__ == "__main__":
+    main()
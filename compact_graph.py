@@ -0,0 +1,216 @@
+from array import array
+from collections.abc import Mapping, Sequence as SequenceABC
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+import numpy as np
+
+from graph_csr import undirected_csr
+
+
+class NodeRecord:
+    """Read-only stand-in for GraphNode, created on demand from the arrays."""
+    __slots__ = ("id", "x", "y")
+
+    def __init__(self, node_id: str, x: float, y: float):
+        self.id = node_id
+        self.x = x
+        self.y = y
+
+    def get_position(self) -> Tuple[float, float]:
+        return self.x, self.y
+
+
+class SequentialIds(SequenceABC):
+    """The ids str(start), str(start + 1), ... without storing a string per node."""
+
+    def __init__(self, start: int, count: int):
+        self.start = start
+        self.count = count
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [str(self.start + j) for j in range(*i.indices(self.count))]
+        if i < 0:
+            i += self.count
+        if not 0 <= i < self.count:
+            raise IndexError(i)
+        return str(self.start + i)
+
+    def __iter__(self) -> Iterator[str]:
+        return map(str, range(self.start, self.start + self.count))
+
+
+class _SequentialIndex(Mapping):
+    """index_of for SequentialIds: parses the id instead of hashing it."""
+
+    def __init__(self, ids: SequentialIds):
+        self.ids = ids
+
+    def __getitem__(self, node_id: str) -> int:
+        try:
+            i = int(node_id) - self.ids.start
+        except (TypeError, ValueError):
+            raise KeyError(node_id) from None
+        # Reject non-canonical spellings such as "007" or " 7"
+        if not 0 <= i < self.ids.count or str(i + self.ids.start) != node_id:
+            raise KeyError(node_id)
+        return i
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.ids)
+
+    def __len__(self) -> int:
+        return self.ids.count
+
+
+class _NodeView(Mapping):
+    """graph.nodes for a CompactGraph: iterates ids and looks up NodeRecords."""
+
+    def __init__(self, graph: 'CompactGraph'):
+        self._graph = graph
+
+    def __getitem__(self, node_id: str) -> NodeRecord:
+        graph = self._graph
+        i = graph.index_of[node_id]
+        # Coordinates move from the build arrays to xs/ys when the graph is frozen
+        xs, ys = (graph.xs, graph.ys) if graph.frozen else (graph._xs, graph._ys)
+        return NodeRecord(node_id, float(xs[i]), float(ys[i]))
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._graph.ids)
+
+    def __len__(self) -> int:
+        return len(self._graph.ids)
+
+
+class CompactGraph:
+    """Array-backed drop-in for UniformCSlab4.Graph.
+
+    Nodes and edges are added with the same add_node/add_edge calls, into
+    flat typed arrays. freeze() (run automatically on the first neighbors()
+    call) turns the edge list into CSR form: neighbor indices in int32 and
+    weights in float64 sliced by indptr, with float32 coordinates. That is
+    a few dozen bytes per edge instead of a dict entry per GraphNode pair,
+    and searches written against neighbors() run on it unchanged.
+    """
+
+    def __init__(self):
+        self.ids: List[str] = []
+        self.index_of: Dict[str, int] = {}
+        self._xs = array('f')
+        self._ys = array('f')
+        self._src = array('i')
+        self._dst = array('i')
+        self._weights = array('d')
+        self.frozen = False
+        self.version = 0
+        self.nodes = _NodeView(self)
+
+    def add_node(self, node_id: str, x: float, y: float):
+        self._check_mutable()
+        i = self.index_of.get(node_id)
+        if i is None:
+            self.index_of[node_id] = len(self.ids)
+            self.ids.append(node_id)
+            self._xs.append(x)
+            self._ys.append(y)
+        else:
+            self._xs[i], self._ys[i] = x, y
+        self.version += 1
+
+    def add_edge(self, from_id: str, to_id: str, weight: float):
+        self._check_mutable()
+        if from_id in self.index_of and to_id in self.index_of:
+            self._src.append(self.index_of[from_id])
+            self._dst.append(self.index_of[to_id])
+            self._weights.append(weight)
+            self.version += 1
+
+    def _check_mutable(self):
+        if self.frozen:
+            raise RuntimeError("CompactGraph is frozen; nodes and edges can only be added before freeze()")
+
+    def freeze(self) -> 'CompactGraph':
+        """Build the CSR arrays and drop the edge lists; the graph is read-only afterwards."""
+        if self.frozen:
+            return self
+        # Like repeated GraphNode.add_neighbor calls, a repeated edge keeps its
+        # first position in each neighbor list and takes the last weight given
+        indptr, indices, weights = undirected_csr(np.frombuffer(self._src, dtype=np.int32),
+                                                  np.frombuffer(self._dst, dtype=np.int32), len(self.ids),
+                                                  np.frombuffer(self._weights, dtype=np.float64))
+        self._set_csr(np.frombuffer(self._xs, dtype=np.float32).copy(),
+                      np.frombuffer(self._ys, dtype=np.float32).copy(),
+                      indptr, indices.astype(np.int32, copy=False), weights)
+        self._src, self._dst, self._weights = array('i'), array('i'), array('d')
+        return self
+
+    def _set_ids(self, ids: Sequence[str]):
+        if isinstance(ids, SequentialIds):
+            self.ids, self.index_of = ids, _SequentialIndex(ids)
+        else:
+            self.ids = list(ids)
+            self.index_of = {node_id: i for i, node_id in enumerate(self.ids)}
+
+    def _set_csr(self, xs: np.ndarray, ys: np.ndarray, indptr: np.ndarray, indices: np.ndarray,
+                 weights: np.ndarray):
+        self.xs, self.ys = xs, ys
+        self.indptr, self.indices, self.weights = indptr, indices, weights
+        self._indptr_view = memoryview(indptr)
+        self._indices_view = memoryview(indices)
+        self._weights_view = memoryview(weights)
+        self.frozen = True
+        self.version += 1
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.ids)
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.indices) // 2 if self.frozen else len(self._src)
+
+    def neighbors(self, node_id: str) -> Iterator[Tuple[str, float]]:
+        """(neighbor id, edge weight) pairs, the interface the search engines use."""
+        if not self.frozen:
+            self.freeze()
+        i = self.index_of[node_id]
+        lo, hi = self._indptr_view[i], self._indptr_view[i + 1]
+        ids = self.ids
+        return zip([ids[j] for j in self._indices_view[lo:hi]], self._weights_view[lo:hi])
+
+    @classmethod
+    def from_arrays(cls, ids: Sequence[str], xs: np.ndarray, ys: np.ndarray,
+                    src: np.ndarray, dst: np.ndarray, weights: np.ndarray) -> 'CompactGraph':
+        """Bulk-load nodes and (src, dst) index pairs without per-edge calls, then freeze."""
+        graph = cls()
+        graph._set_ids(ids)
+        graph._xs.frombytes(np.asarray(xs, dtype=np.float32).tobytes())
+        graph._ys.frombytes(np.asarray(ys, dtype=np.float32).tobytes())
+        graph._src.frombytes(np.asarray(src, dtype=np.int32).tobytes())
+        graph._dst.frombytes(np.asarray(dst, dtype=np.int32).tobytes())
+        graph._weights.frombytes(np.asarray(weights, dtype=np.float64).tobytes())
+        return graph.freeze()
+
+    @classmethod
+    def from_csr(cls, ids: Sequence[str], xs: np.ndarray, ys: np.ndarray, indptr: np.ndarray,
+                 indices: np.ndarray, weights: np.ndarray) -> 'CompactGraph':
+        """Wrap ready-made CSR arrays (possibly memory-mapped) as a frozen graph, without copying."""
+        graph = cls()
+        graph._set_ids(ids)
+        graph._set_csr(xs, ys, indptr, indices, weights)
+        return graph
+
+    @classmethod
+    def from_graph(cls, graph) -> 'CompactGraph':
+        """Copy any graph with nodes (id -> node with x, y) and neighbors() into compact form."""
+        compact = cls()
+        for node_id, node in graph.nodes.items():
+            compact.add_node(node_id, node.x, node.y)
+        for node_id in graph.nodes:
+            for neighbor_id, weight in graph.neighbors(node_id):
+                compact.add_edge(node_id, neighbor_id, weight)
+        return compact.freeze()
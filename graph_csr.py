@@ -0,0 +1,343 @@
+import argparse
+import time
+from collections import deque
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Flat buffers: per-item loops here, and in the other search modules, read
+# NumPy arrays through memoryviews and keep flags in bytearrays. Indexing
+# those returns plain Python ints and floats without copying, far faster
+# than the NumPy scalar that indexing an array element by element creates.
+
+
+def slice_positions(starts: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """The positions of the slices [starts[i], starts[i] + counts[i]) laid end to end."""
+    offsets = np.cumsum(counts) - counts
+    return np.arange(counts.sum()) + np.repeat(starts - offsets, counts)
+
+
+def undirected_csr(src: np.ndarray, dst: np.ndarray, n: int, weights: Optional[np.ndarray] = None
+                   ) -> Tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]:
+    """CSR indptr, indices and weights for n nodes, storing each edge in both directions.
+
+    Self-loops are dropped. A repeated edge keeps its first position in each
+    neighbor list and takes the last weight given, so each node's neighbors
+    keep the order in which its edges first appear.
+    """
+    src = np.asarray(src, dtype=np.int64)
+    dst = np.asarray(dst, dtype=np.int64)
+    keep = src != dst
+    src, dst = src[keep], dst[keep]
+    pair_keys = np.minimum(src, dst) * n + np.maximum(src, dst)
+    _, first, inverse = np.unique(pair_keys, return_index=True, return_inverse=True)
+    order = np.argsort(first, kind="stable")
+    if weights is not None:
+        last_weight = np.empty(len(first))
+        last_weight[inverse.reshape(-1)] = np.asarray(weights, dtype=np.float64)[keep]
+        weights = last_weight[order]
+    src, dst = src[first[order]], dst[first[order]]
+
+    # Interleave both directions so a stable sort by source keeps edge order
+    both_src = np.empty(2 * len(src), dtype=np.int64)
+    both_dst = np.empty(2 * len(src), dtype=np.int64)
+    both_src[0::2], both_src[1::2] = src, dst
+    both_dst[0::2], both_dst[1::2] = dst, src
+    by_source = np.argsort(both_src, kind="stable")
+
+    index_dtype = np.int32 if n < 2 ** 31 else np.int64
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(both_src, minlength=n), out=indptr[1:])
+    if weights is not None:
+        weights = np.repeat(weights, 2)[by_source]
+    return indptr, both_dst[by_source].astype(index_dtype), weights
+
+
+class CSRGraph:
+    """Undirected graph in compressed sparse row form.
+
+    Node i's neighbors are indices[indptr[i]:indptr[i + 1]]. Nodes are the
+    integers 0..n-1; labels maps them back to the original node names.
+    """
+
+    def __init__(self, indptr: np.ndarray, indices: np.ndarray, labels: Sequence[Hashable]):
+        self.indptr = indptr
+        self.indices = indices
+        self.labels = list(labels)
+        self.index_of: Dict[Hashable, int] = {label: i for i, label in enumerate(self.labels)}
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.indptr) - 1
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.indices) // 2
+
+    def neighbors(self, node: int) -> np.ndarray:
+        return self.indices[self.indptr[node]:self.indptr[node + 1]]
+
+    @classmethod
+    def from_edge_list(cls, edges: Iterable[Tuple[Hashable, Hashable]],
+                       nodes: Optional[Iterable[Hashable]] = None) -> 'CSRGraph':
+        """Build from (u, v) pairs; nodes lists isolated nodes and fixes the label order."""
+        index_of: Dict[Hashable, int] = {}
+        labels: List[Hashable] = []
+
+        def intern(label):
+            idx = index_of.get(label)
+            if idx is None:
+                idx = index_of[label] = len(labels)
+                labels.append(label)
+            return idx
+
+        for label in nodes or ():
+            intern(label)
+        sources, targets = [], []
+        for u, v in edges:
+            sources.append(intern(u))
+            targets.append(intern(v))
+        src = np.asarray(sources, dtype=np.int64)
+        dst = np.asarray(targets, dtype=np.int64)
+        return cls.from_arrays(src, dst, labels)
+
+    @classmethod
+    def from_arrays(cls, src: np.ndarray, dst: np.ndarray, labels: Sequence[Hashable]) -> 'CSRGraph':
+        """Build from integer endpoint arrays; each edge is stored in both directions.
+
+        Self-loops and repeated edges are dropped. Each node's neighbors keep the
+        order in which its edges first appear.
+        """
+        indptr, indices, _ = undirected_csr(src, dst, len(labels))
+        return cls(indptr, indices, labels)
+
+    @classmethod
+    def from_networkx(cls, graph) -> 'CSRGraph':
+        """Convert a networkx graph, keeping its node and adjacency iteration order."""
+        labels = list(graph.nodes())
+        index_of = {label: i for i, label in enumerate(labels)}
+        indptr = np.zeros(len(labels) + 1, dtype=np.int64)
+        indices = []
+        for i, label in enumerate(labels):
+            indices.extend(index_of[neighbor] for neighbor in graph.neighbors(label) if neighbor != label)
+            indptr[i + 1] = len(indices)
+        index_dtype = np.int32 if len(labels) < 2 ** 31 else np.int64
+        return cls(indptr, np.asarray(indices, dtype=index_dtype), labels)
+
+    def adjacency_views(self) -> Tuple[memoryview, memoryview]:
+        """Zero-copy memoryviews of indptr/indices for per-item loops."""
+        return memoryview(np.ascontiguousarray(self.indptr)), memoryview(np.ascontiguousarray(self.indices))
+
+    def to_labels(self, path: Optional[Sequence[int]]) -> Optional[List[Hashable]]:
+        return None if path is None else [self.labels[i] for i in path]
+
+
+def _walk_back(parent: Sequence[int], node: int) -> List[int]:
+    path = []
+    while node != -1:
+        path.append(int(node))
+        node = parent[node]
+    path.reverse()
+    return path
+
+
+def bfs_csr(graph: CSRGraph, start: Hashable, end: Hashable, stats: Optional[Dict] = None):
+    """Breadth-first search over the CSR arrays; returns the label path or None."""
+    source, target = graph.index_of[start], graph.index_of[end]
+    if source == target:
+        return [start]
+    indptr, indices = graph.adjacency_views()
+    parent = memoryview(np.full(graph.num_nodes, -1, dtype=np.int64))
+    visited = bytearray(graph.num_nodes)
+    visited[source] = 1
+    queue = deque([source])
+    expanded = 0
+
+    try:
+        while queue:
+            current = queue.popleft()
+            expanded += 1
+            for neighbor in indices[indptr[current]:indptr[current + 1]]:
+                if visited[neighbor]:
+                    continue
+                visited[neighbor] = 1
+                parent[neighbor] = current
+                if neighbor == target:
+                    return graph.to_labels(_walk_back(parent, target))
+                queue.append(neighbor)
+        return None
+    finally:
+        if stats is not None:
+            stats["expanded"] = expanded
+
+
+def dfs_csr(graph: CSRGraph, start: Hashable, end: Hashable, stats: Optional[Dict] = None):
+    """Depth-first search with an explicit stack, visiting neighbors in stored order."""
+    source, target = graph.index_of[start], graph.index_of[end]
+    indptr, indices = graph.adjacency_views()
+    visited = bytearray(graph.num_nodes)
+    visited[source] = 1
+    # Each frame is (node, position of the next neighbor to try)
+    stack = [[source, indptr[source]]]
+    expanded = 1
+
+    try:
+        if source == target:
+            return [start]
+        while stack:
+            frame = stack[-1]
+            node, pos = frame
+            if pos == indptr[node + 1]:
+                stack.pop()
+                continue
+            frame[1] = pos + 1
+            neighbor = indices[pos]
+            if visited[neighbor]:
+                continue
+            visited[neighbor] = 1
+            if neighbor == target:
+                return graph.to_labels([f[0] for f in stack] + [neighbor])
+            expanded += 1
+            stack.append([neighbor, indptr[neighbor]])
+        return None
+    finally:
+        if stats is not None:
+            stats["expanded"] = expanded
+
+
+def bidirectional_bfs_csr(graph: CSRGraph, start: Hashable, end: Hashable, stats: Optional[Dict] = None):
+    """Level-by-level BFS from both ends, always growing the smaller frontier."""
+    source, target = graph.index_of[start], graph.index_of[end]
+    if source == target:
+        return [start]
+    indptr, indices = graph.adjacency_views()
+    n = graph.num_nodes
+    parents = (memoryview(np.full(n, -1, dtype=np.int64)), memoryview(np.full(n, -1, dtype=np.int64)))
+    # depths[s][v] is v's distance from that side's root, or -1 while unseen
+    depths = (memoryview(np.full(n, -1, dtype=np.int32)), memoryview(np.full(n, -1, dtype=np.int32)))
+    depths[0][source] = depths[1][target] = 0
+    frontiers = [[source], [target]]
+    expanded = 0
+
+    try:
+        while frontiers[0] and frontiers[1]:
+            which = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+            parent, depth, other_depth = parents[which], depths[which], depths[1 - which]
+            level = depth[frontiers[which][0]] + 1
+            next_frontier = []
+            meeting = None
+            for node in frontiers[which]:
+                expanded += 1
+                for neighbor in indices[indptr[node]:indptr[node + 1]]:
+                    if depth[neighbor] != -1:
+                        continue
+                    if other_depth[neighbor] != -1:
+                        # Finish the level and keep the edge closest to the other root,
+                        # which makes the joined path a shortest one
+                        if meeting is None or other_depth[neighbor] < other_depth[meeting[1]]:
+                            meeting = (node, neighbor)
+                        continue
+                    depth[neighbor] = level
+                    parent[neighbor] = node
+                    next_frontier.append(neighbor)
+            if meeting is not None:
+                return graph.to_labels(_join_paths(parents, which, *meeting))
+            frontiers[which] = next_frontier
+        return None
+    finally:
+        if stats is not None:
+            stats["expanded"] = expanded
+
+
+def bidirectional_bfs_masks(graph: CSRGraph, start: Hashable, end: Hashable, stats: Optional[Dict] = None):
+    """Bidirectional BFS that expands each frontier level as whole NumPy arrays.
+
+    Every level gathers all neighbor slices of the frontier at once and
+    filters them against per-side boolean visited masks, so the per-edge
+    work happens in NumPy rather than the interpreter. Explores the same
+    levels as bidirectional_bfs_csr.
+    """
+    source, target = graph.index_of[start], graph.index_of[end]
+    if source == target:
+        return [start]
+    n = graph.num_nodes
+    indptr, indices = graph.indptr, graph.indices
+    parents = (np.full(n, -1, dtype=np.int64), np.full(n, -1, dtype=np.int64))
+    depths = (np.full(n, -1, dtype=np.int32), np.full(n, -1, dtype=np.int32))
+    seen = (np.zeros(n, dtype=bool), np.zeros(n, dtype=bool))
+    seen[0][source] = seen[1][target] = True
+    depths[0][source] = depths[1][target] = 0
+    frontiers = [np.array([source], dtype=np.int64), np.array([target], dtype=np.int64)]
+    levels = [0, 0]
+    expanded = 0
+
+    try:
+        while len(frontiers[0]) and len(frontiers[1]):
+            which = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+            other = 1 - which
+            frontier = frontiers[which]
+            expanded += len(frontier)
+
+            # Concatenate indices[indptr[v]:indptr[v + 1]] for every frontier node v
+            starts = indptr[frontier]
+            counts = indptr[frontier + 1] - starts
+            neighbors = indices[slice_positions(starts, counts)].astype(np.int64)
+            sources = np.repeat(frontier, counts)
+
+            touching = np.flatnonzero(seen[other][neighbors])
+            if len(touching):
+                best = touching[np.argmin(depths[other][neighbors[touching]])]
+                return graph.to_labels(_join_paths(parents, which, sources[best], neighbors[best]))
+
+            fresh = ~seen[which][neighbors]
+            neighbors, sources = neighbors[fresh], sources[fresh]
+            # With repeated neighbors any one of their frontier parents is a valid choice
+            parents[which][neighbors] = sources
+            seen[which][neighbors] = True
+            levels[which] += 1
+            depths[which][neighbors] = levels[which]
+            frontiers[which] = np.unique(neighbors)
+        return None
+    finally:
+        if stats is not None:
+            stats["expanded"] = expanded
+
+
+def _join_paths(parents, which: int, node: int, neighbor: int) -> List[int]:
+    """Path through the edge node-neighbor, where node was reached by side which."""
+    forward_end, backward_end = (node, neighbor) if which == 0 else (neighbor, node)
+    path = _walk_back(parents[0], forward_end)
+    path.extend(reversed(_walk_back(parents[1], backward_end)))
+    return path
+
+
+def main():
+    """Compare BFS against both bidirectional variants on large random graphs."""
+    parser = argparse.ArgumentParser(description="Benchmark CSR BFS variants on random graphs.")
+    parser.add_argument("--nodes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--degree", type=float, default=4.0, help="Average node degree")
+    parser.add_argument("--queries", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    searches = [("bfs", bfs_csr), ("bidirectional", bidirectional_bfs_csr),
+                ("bidirectional_masks", bidirectional_bfs_masks)]
+    rng = np.random.default_rng(args.seed)
+    print(f"{'nodes':>9} {'search':<20} {'seconds':>9} {'expanded':>10}")
+    for n in args.nodes:
+        m = int(n * args.degree / 2)
+        graph = CSRGraph.from_arrays(rng.integers(0, n, m), rng.integers(0, n, m), range(n))
+        queries = rng.integers(0, n, (args.queries, 2)).tolist()
+        for name, search in searches:
+            seconds = expanded = 0
+            for start, end in queries:
+                stats = {}
+                began = time.perf_counter()
+                search(graph, start, end, stats)
+                seconds += time.perf_counter() - began
+                expanded += stats["expanded"]
+            print(f"{n:>9} {name:<20} {seconds / len(queries):>9.4f} {expanded // len(queries):>10}")
+
+
+if __name__ == "__main__":
+    main()
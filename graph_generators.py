@@ -0,0 +1,143 @@
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+
+from compact_graph import CompactGraph, SequentialIds
+from graph_csr import slice_positions
+
+# Random geometric graphs for UniformCSlab4-style searches. Points are
+# bucketed into a uniform grid of square cells, so candidate neighbors come
+# from a few adjacent cells instead of every other node, and all distance
+# work happens on whole NumPy arrays.
+
+# Cell offsets covering each unordered pair of neighboring cells exactly once
+_HALF_NEIGHBORHOOD = ((0, 0), (1, 0), (-1, 1), (0, 1), (1, 1))
+
+
+class _CellGrid:
+    """Points sorted by grid cell, with each cell's slice of the sorted order."""
+
+    def __init__(self, xs: np.ndarray, ys: np.ndarray, cell: float):
+        span_x, span_y = float(np.ptp(xs)), float(np.ptp(ys))
+        # Widen the cells if the grid would have far more cells than points
+        while (span_x // cell + 1) * (span_y // cell + 1) > 4 * len(xs) + 16:
+            cell *= 2
+        self.cell = cell
+        self.cols = int(span_x // cell) + 1
+        self.rows = int(span_y // cell) + 1
+        self.cx = ((xs - xs.min()) // cell).astype(np.int64)
+        self.cy = ((ys - ys.min()) // cell).astype(np.int64)
+        cell_ids = self.cy * self.cols + self.cx
+        self.order = np.argsort(cell_ids, kind="stable")
+        self.cell_start = np.searchsorted(cell_ids[self.order], np.arange(self.rows * self.cols + 1))
+
+    def pairs(self, points: np.ndarray, dx: int, dy: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Every (point, other) with other in the cell offset by (dx, dy) from point's cell."""
+        tx, ty = self.cx[points] + dx, self.cy[points] + dy
+        inside = (tx >= 0) & (tx < self.cols) & (ty >= 0) & (ty < self.rows)
+        points = points[inside]
+        cells = ty[inside] * self.cols + tx[inside]
+        lo, hi = self.cell_start[cells], self.cell_start[cells + 1]
+        counts = hi - lo
+        return np.repeat(points, counts), self.order[slice_positions(lo, counts)]
+
+
+def radius_edges(xs: np.ndarray, ys: np.ndarray, radius: float) -> Tuple[np.ndarray, np.ndarray]:
+    """All pairs i < j within radius of each other."""
+    if not radius > 0:
+        raise ValueError(f"radius must be positive, got {radius}")
+    grid = _CellGrid(xs, ys, radius)
+    everyone = np.arange(len(xs))
+    sources, targets = [], []
+    for dx, dy in _HALF_NEIGHBORHOOD:
+        src, dst = grid.pairs(everyone, dx, dy)
+        keep = np.hypot(xs[src] - xs[dst], ys[src] - ys[dst]) <= radius
+        if dx == dy == 0:
+            keep &= src < dst
+        sources.append(src[keep])
+        targets.append(dst[keep])
+    return np.concatenate(sources), np.concatenate(targets)
+
+
+def knn_edges(xs: np.ndarray, ys: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Each point joined to its k nearest others (so some nodes end up with more)."""
+    n = len(xs)
+    k = min(k, n - 1)
+    if k <= 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    # About k / 2 points per cell for uniformly spread points: the circle the
+    # 3x3 block guarantees then still holds about 1.6 k points on average
+    area = float(np.ptp(xs) * np.ptp(ys))
+    grid = _CellGrid(xs, ys, max(np.sqrt(area * k / (2 * n)), 1e-9))
+    cell = grid.cell
+    pending = np.arange(n)
+    sources, targets = [], []
+    reach = 1
+    while len(pending):
+        # Cells within reach of a point's cell hold every point closer than reach * cell
+        src_parts, dst_parts = [], []
+        for dy in range(-reach, reach + 1):
+            for dx in range(-reach, reach + 1):
+                src, dst = grid.pairs(pending, dx, dy)
+                keep = src != dst
+                src_parts.append(src[keep])
+                dst_parts.append(dst[keep])
+        src, dst = np.concatenate(src_parts), np.concatenate(dst_parts)
+        dist = np.hypot(xs[src] - xs[dst], ys[src] - ys[dst])
+        src_ok = np.bincount(src[dist <= reach * cell], minlength=n)
+        resolved = np.zeros(n, dtype=bool)
+        # Grids this coarse cover everything, so whatever was found is final
+        resolved[pending] = (src_ok[pending] >= k) | (reach >= max(grid.cols, grid.rows))
+
+        keep = resolved[src]
+        src, dst, dist = src[keep], dst[keep], dist[keep]
+        # Sort by point, then distance, and take the first k of each group. Positive
+        # float32 bit patterns order like the values, so one int64 key does both
+        # levels (np.lexsort is an order of magnitude slower here)
+        by_point = np.argsort((src << 32) | dist.astype(np.float32).view(np.uint32))
+        src, dst = src[by_point], dst[by_point]
+        group_start = np.searchsorted(src, src)
+        nearest = np.arange(len(src)) - group_start < k
+        sources.append(src[nearest])
+        targets.append(dst[nearest])
+
+        pending = pending[~resolved[pending]]
+        reach += 1
+    return np.concatenate(sources), np.concatenate(targets)
+
+
+def random_geometric_graph(num_nodes: int, radius: Optional[float] = None, k: Optional[int] = None,
+                           width: float = 1000.0, height: float = 1000.0, padding: float = 0.0,
+                           seed: Optional[int] = None, decimals: Optional[int] = 2,
+                           graph_factory: Callable = CompactGraph):
+    """Uniformly scattered nodes joined within radius or to their k nearest neighbors.
+
+    Nodes are named "0".."n-1" and edge weights are Euclidean lengths,
+    rounded to decimals places like the lab GUI's labels. graph_factory is
+    any class with add_node/add_edge (UniformCSlab4.Graph or CompactGraph);
+    CompactGraph is filled straight from the arrays.
+    """
+    if (radius is None) == (k is None):
+        raise ValueError("Give exactly one of radius or k")
+    rng = np.random.default_rng(seed)
+    xs = rng.uniform(padding, width - padding, num_nodes)
+    ys = rng.uniform(padding, height - padding, num_nodes)
+    if num_nodes == 0:
+        src = dst = np.empty(0, dtype=np.int64)
+    elif radius is not None:
+        src, dst = radius_edges(xs, ys, radius)
+    else:
+        src, dst = knn_edges(xs, ys, k)
+    weights = np.hypot(xs[src] - xs[dst], ys[src] - ys[dst])
+    if decimals is not None:
+        weights = np.round(weights, decimals)
+
+    ids = SequentialIds(0, num_nodes)
+    if graph_factory is CompactGraph:
+        return CompactGraph.from_arrays(ids, xs, ys, src, dst, weights)
+    graph = graph_factory()
+    for node_id, x, y in zip(ids, xs.tolist(), ys.tolist()):
+        graph.add_node(node_id, x, y)
+    for i, j, weight in zip(src.tolist(), dst.tolist(), weights.tolist()):
+        graph.add_edge(ids[i], ids[j], weight)
+    return graph
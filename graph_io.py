@@ -0,0 +1,207 @@
+import argparse
+import io
+import os
+import struct
+import zipfile
+from array import array
+from typing import Dict, Iterator, Optional, TextIO, Union
+
+import numpy as np
+
+from compact_graph import CompactGraph, SequentialIds
+
+# Binary graph files are uncompressed .npz archives of the CompactGraph
+# arrays. Because the members are stored, not deflated, each one is a plain
+# .npy file at a fixed offset inside the archive and can be memory-mapped in
+# place, so loading costs a few header reads however large the graph is.
+# save_graph pads each member's local header so its array data starts on a
+# 64-byte boundary, as NumPy expects for aligned, zero-copy access.
+
+GRAPH_ARRAYS = ("xs", "ys", "indptr", "indices", "weights")
+ALIGNMENT = 64
+PADDING_EXTRA_ID = 0xCAFE  # Unregistered zip extra-field id; readers skip unknown ids
+
+
+def save_graph(graph, path: str):
+    """Write a graph (CompactGraph, or anything CompactGraph.from_graph accepts) to path."""
+    if not isinstance(graph, CompactGraph):
+        graph = CompactGraph.from_graph(graph)
+    graph.freeze()
+    arrays = {"xs": graph.xs, "ys": graph.ys, "indptr": graph.indptr, "indices": graph.indices,
+              "weights": graph.weights}
+    id_start = _sequential_start(graph.ids)
+    if id_start is None:
+        arrays["ids"] = np.array(graph.ids, dtype=str)
+    else:
+        # Ids like "0".."n-1" are stored as their first value, so loading skips building n strings
+        arrays["id_start"] = np.array(id_start, dtype=np.int64)
+    tmp_path = path + ".tmp"
+    with zipfile.ZipFile(tmp_path, "w", zipfile.ZIP_STORED, allowZip64=True) as archive:
+        for name, values in arrays.items():
+            write_aligned_member(archive, name + ".npy", np.asarray(values, order="C"))
+    os.replace(tmp_path, path)
+
+
+def _sequential_start(ids) -> Optional[int]:
+    """start if ids are exactly str(start), str(start + 1), ..., else None."""
+    if isinstance(ids, SequentialIds):
+        return ids.start
+    if not ids or not ids[0].isdigit() or str(int(ids[0])) != ids[0]:
+        return None
+    start = int(ids[0])
+    return start if all(node_id == str(start + i) for i, node_id in enumerate(ids)) else None
+
+
+def write_aligned_member(archive: zipfile.ZipFile, member: str, values: np.ndarray):
+    """Store one array as an uncompressed .npy member with its data 64-byte aligned."""
+    header = io.BytesIO()
+    np.lib.format.write_array_header_1_0(header, np.lib.format.header_data_from_array_1_0(values))
+    info = zipfile.ZipInfo(member, date_time=(1980, 1, 1, 0, 0, 0))
+    info.compress_type = zipfile.ZIP_STORED
+    info.file_size = header.tell() + values.nbytes
+    # Same rule zipfile applies when opening the member for writing
+    zip64 = info.file_size * 1.05 > zipfile.ZIP64_LIMIT
+    # Local header: 30 fixed bytes, the name, our padding field, then the
+    # 20-byte zip64 field if any; the .npy header itself is a multiple of 64
+    start = archive.start_dir + 30 + len(member.encode()) + 4 + (20 if zip64 else 0)
+    padding = -start % ALIGNMENT
+    info.extra = struct.pack("<HH", PADDING_EXTRA_ID, padding) + bytes(padding)
+    with archive.open(info, "w", force_zip64=zip64) as out:
+        out.write(header.getvalue())
+        out.write(values.reshape(-1).view(np.uint8))
+
+
+def npz_memmaps(path: str) -> Dict[str, np.ndarray]:
+    """Memory-map every stored .npy member of an .npz archive."""
+    arrays = {}
+    with zipfile.ZipFile(path) as archive, open(path, "rb") as raw:
+        for info in archive.infolist():
+            if info.compress_type != zipfile.ZIP_STORED:
+                raise ValueError(f"{path}: member {info.filename} is compressed and cannot be mapped")
+            # Local file header: 30 fixed bytes, then the name and extra field
+            raw.seek(info.header_offset + 26)
+            name_len, extra_len = np.frombuffer(raw.read(4), dtype="<u2")
+            raw.seek(info.header_offset + 30 + int(name_len) + int(extra_len))
+            version = np.lib.format.read_magic(raw)
+            if version == (1, 0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(raw)
+            else:
+                shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(raw)
+            name = info.filename[:-4] if info.filename.endswith(".npy") else info.filename
+            if dtype.hasobject:
+                raise ValueError(f"{path}: member {name} holds Python objects")
+            count = int(np.prod(shape))
+            if count * dtype.itemsize < 4096:
+                # Not worth a mapping; this also covers scalars and empty arrays
+                data = np.frombuffer(raw.read(count * dtype.itemsize), dtype=dtype)
+                arrays[name] = data.reshape(shape, order="F" if fortran_order else "C")
+            else:
+                arrays[name] = np.memmap(path, dtype=dtype, mode="r", offset=raw.tell(), shape=shape,
+                                         order="F" if fortran_order else "C")
+    return arrays
+
+
+def load_graph(path: str, mmap: bool = True) -> CompactGraph:
+    """Read a graph written by save_graph; with mmap the big arrays stay on disk until touched."""
+    if mmap:
+        arrays = npz_memmaps(path)
+    else:
+        with np.load(path) as archive:
+            arrays = {name: archive[name] for name in archive.files}
+    missing = [name for name in GRAPH_ARRAYS if name not in arrays]
+    if missing:
+        raise ValueError(f"{path} is not a saved graph (missing {', '.join(missing)})")
+    if "id_start" in arrays:
+        ids = SequentialIds(int(arrays["id_start"]), len(arrays["xs"]))
+    elif "ids" in arrays:
+        ids = arrays["ids"].tolist()
+    else:
+        raise ValueError(f"{path} is not a saved graph (no node ids)")
+    return CompactGraph.from_csr(ids, arrays["xs"], arrays["ys"],
+                                 arrays["indptr"], arrays["indices"], arrays["weights"])
+
+
+def _lines(source: Union[str, TextIO]) -> Iterator[str]:
+    """Yield lines one at a time from a path or an open text file."""
+    if isinstance(source, str):
+        with open(source) as handle:
+            yield from handle
+    else:
+        yield from source
+
+
+def read_edge_list(source: Union[str, TextIO], default_weight: float = 1.0) -> CompactGraph:
+    """Stream "u v [weight]" lines into a CompactGraph.
+
+    Blank lines and lines starting with # or % are skipped. Node ids are the
+    tokens as written; nodes have no coordinates, so all sit at (0, 0).
+    """
+    index_of: Dict[str, int] = {}
+    src, dst, weights = array('i'), array('i'), array('d')
+    for line_no, line in enumerate(_lines(source), 1):
+        fields = line.split()
+        if not fields or fields[0][0] in "#%":
+            continue
+        if len(fields) < 2:
+            raise ValueError(f"line {line_no}: expected 'u v [weight]', got {line.strip()!r}")
+        for name, column in ((fields[0], src), (fields[1], dst)):
+            column.append(index_of.setdefault(name, len(index_of)))
+        weights.append(float(fields[2]) if len(fields) > 2 else default_weight)
+    n = len(index_of)
+    return CompactGraph.from_arrays(list(index_of), np.zeros(n), np.zeros(n), src, dst, weights)
+
+
+def read_dimacs(graph_source: Union[str, TextIO], coord_source: Optional[Union[str, TextIO]] = None) -> CompactGraph:
+    """Stream a DIMACS shortest-path graph (.gr) and optional coordinates (.co).
+
+    .gr files hold "p sp <nodes> <arcs>" and "a <u> <v> <weight>" lines; .co
+    files hold "v <id> <x> <y>" lines. Ids are 1-based and kept as strings.
+    Arcs are merged into undirected edges; road networks list both
+    directions, and when the two weights differ the later arc wins.
+    """
+    n = None
+    src, dst, weights = array('i'), array('i'), array('d')
+    for line_no, line in enumerate(_lines(graph_source), 1):
+        # Strip first, so blank lines ending in "\r\n" or holding spaces are skipped too
+        line = line.strip()
+        kind = line[:1]
+        if kind == "a":
+            _, u, v, weight = line.split()
+            src.append(int(u) - 1)
+            dst.append(int(v) - 1)
+            weights.append(float(weight))
+        elif kind == "p":
+            n = int(line.split()[2])
+        elif kind not in ("c", ""):
+            raise ValueError(f"line {line_no}: unexpected DIMACS line {line!r}")
+    if n is None:
+        raise ValueError("DIMACS graph has no 'p sp <nodes> <arcs>' line")
+
+    xs = np.zeros(n)
+    ys = np.zeros(n)
+    if coord_source is not None:
+        for line in _lines(coord_source):
+            if line[:1] == "v":
+                _, node, x, y = line.split()
+                xs[int(node) - 1] = float(x)
+                ys[int(node) - 1] = float(y)
+    return CompactGraph.from_arrays(SequentialIds(1, n), xs, ys, src, dst, weights)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert an edge list or DIMACS graph to the binary .npz format.")
+    parser.add_argument("input", help="Edge list, or DIMACS .gr file")
+    parser.add_argument("-o", "--output", required=True, help="Output .npz path")
+    parser.add_argument("--format", choices=("edges", "dimacs"), default=None,
+                        help="Input format (default: dimacs for .gr files, else edges)")
+    parser.add_argument("--coords", help="DIMACS .co coordinate file")
+    args = parser.parse_args()
+
+    fmt = args.format or ("dimacs" if args.input.endswith(".gr") else "edges")
+    graph = read_dimacs(args.input, args.coords) if fmt == "dimacs" else read_edge_list(args.input)
+    save_graph(graph, args.output)
+    print(f"{graph.num_nodes} nodes, {graph.num_edges} edges -> {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+import heapq
+import itertools
+from collections import deque
+from typing import Callable, Dict, Hashable, List, NamedTuple, Optional, Tuple
+
+# GUI-free searches over any graph exposing neighbors(node_id), which yields
+# (neighbor_id, edge weight) pairs, such as UniformCSlab4.Graph.
+
+INF = float('inf')
+
+
+class SearchResult(NamedTuple):
+    path: Optional[List[Hashable]]  # Node ids from start to goal, or None if unreachable
+    cost: float
+    expanded: int
+
+
+def _walk_back(parent: Dict[Hashable, Optional[Hashable]], node: Hashable) -> List[Hashable]:
+    path = []
+    while node is not None:
+        path.append(node)
+        node = parent[node]
+    path.reverse()
+    return path
+
+
+def dijkstra(graph, start: Hashable, goal: Hashable,
+             heuristic: Optional[Callable[[Hashable], float]] = None) -> SearchResult:
+    """Lowest-cost path from start to goal; A* when given an admissible, consistent heuristic.
+
+    Improving a node's cost pushes a fresh heap entry and leaves the old one
+    behind (lazy deletion); stale entries are skipped when popped. A counter
+    breaks cost ties so node ids themselves are never compared.
+    """
+    g: Dict[Hashable, float] = {start: 0.0}
+    parent: Dict[Hashable, Optional[Hashable]] = {start: None}
+    closed = set()
+    counter = itertools.count()
+    heap: List[Tuple[float, int, Hashable]] = [(heuristic(start) if heuristic else 0.0, next(counter), start)]
+    expanded = 0
+
+    while heap:
+        _, _, node = heapq.heappop(heap)
+        if node in closed:
+            continue
+        closed.add(node)
+        expanded += 1
+        if node == goal:
+            return SearchResult(_walk_back(parent, goal), g[goal], expanded)
+        for neighbor, weight in graph.neighbors(node):
+            new_g = g[node] + weight
+            if neighbor in closed or new_g >= g.get(neighbor, INF):
+                continue
+            g[neighbor] = new_g
+            parent[neighbor] = node
+            priority = new_g + heuristic(neighbor) if heuristic else new_g
+            heapq.heappush(heap, (priority, next(counter), neighbor))
+
+    return SearchResult(None, INF, expanded)
+
+
+def breadth_first_search(graph, start: Hashable, goal: Hashable) -> SearchResult:
+    """Fewest-edges path; cost is the number of edges, ignoring weights."""
+    parent: Dict[Hashable, Optional[Hashable]] = {start: None}
+    queue = deque([start])
+    expanded = 0
+
+    while queue:
+        node = queue.popleft()
+        expanded += 1
+        if node == goal:
+            path = _walk_back(parent, goal)
+            return SearchResult(path, len(path) - 1, expanded)
+        for neighbor, _ in graph.neighbors(node):
+            if neighbor not in parent:
+                parent[neighbor] = node
+                queue.append(neighbor)
+
+    return SearchResult(None, INF, expanded)
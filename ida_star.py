@@ -0,0 +1,152 @@
+from typing import List, Optional, Sequence, Tuple
+
+from puzzle_engine import board_width, goal_state, is_solvable, neighbor_table, tile_cost_tables
+
+FOUND = -1
+
+
+def _line_conflicts(goal_lines: Sequence[int], goal_offsets: Sequence[int], line_tiles: Sequence[int],
+                    line: int) -> int:
+    """Linear-conflict penalty for one row or column.
+
+    Tiles that sit in their goal line but in the wrong relative order must
+    leave the line; the fewest such tiles is len(seq) - LIS(seq), and each
+    costs two extra moves on top of Manhattan distance.
+    """
+    seq = [goal_offsets[tile] for tile in line_tiles if tile and goal_lines[tile] == line]
+    if len(seq) < 2:
+        return 0
+    longest = [1] * len(seq)
+    for i in range(1, len(seq)):
+        for j in range(i):
+            if seq[j] < seq[i] and longest[j] + 1 > longest[i]:
+                longest[i] = longest[j] + 1
+    return 2 * (len(seq) - max(longest))
+
+
+def manhattan_linear_conflict(state: Sequence[int], width: Optional[int] = None) -> int:
+    """Manhattan distance plus linear conflicts; admissible for any board width."""
+    width = width or board_width(state)
+    cost = tile_cost_tables(width)['manhattan']
+    goal_rows, goal_cols = _goal_lines(width)
+    total = sum(cost[tile][idx] for idx, tile in enumerate(state))
+    for line in range(width):
+        total += _line_conflicts(goal_rows, goal_cols, state[line * width:(line + 1) * width], line)
+        total += _line_conflicts(goal_cols, goal_rows, state[line::width], line)
+    return total
+
+
+def _goal_lines(width: int) -> Tuple[List[int], List[int]]:
+    goal_rows = [0] * (width * width)
+    goal_cols = [0] * (width * width)
+    for idx, tile in enumerate(goal_state(width)):
+        goal_rows[tile], goal_cols[tile] = divmod(idx, width)
+    return goal_rows, goal_cols
+
+
+def ida_star(initial_state: Sequence[int], width: Optional[int] = None):
+    """IDA* with Manhattan distance plus linear conflicts.
+
+    Works on a single mutable board with in-place move/unmove, so memory is
+    linear in the solution depth. Returns (path, nodes_explored, depth) in the
+    same format as a_star; path is the list of state tuples from start to goal.
+    """
+    width = width or board_width(initial_state)
+    if not is_solvable(initial_state, width):
+        return None, 0, 0
+    goal = list(goal_state(width))
+    neighbors = neighbor_table(width)
+    cost = tile_cost_tables(width)['manhattan']
+    goal_rows, goal_cols = _goal_lines(width)
+
+    board = list(initial_state)
+    blank = board.index(0)
+    row_lc = [_line_conflicts(goal_rows, goal_cols, board[r * width:(r + 1) * width], r) for r in range(width)]
+    col_lc = [_line_conflicts(goal_cols, goal_rows, board[c::width], c) for c in range(width)]
+    manhattan = sum(cost[tile][idx] for idx, tile in enumerate(board))
+    moves: List[int] = []  # blank cell after each move
+    nodes_explored = 0
+
+    def search(g, bound, blank, prev_blank, manhattan, conflicts):
+        nonlocal nodes_explored
+        nodes_explored += 1
+        f = g + manhattan + conflicts
+        if f > bound:
+            return f
+        if board == goal:
+            return FOUND
+
+        next_bound = float('inf')
+        for cell in neighbors[blank]:
+            if cell == prev_blank:
+                continue  # never undo the previous move
+            tile = board[cell]
+            board[blank], board[cell] = tile, 0
+            new_manhattan = manhattan + cost[tile][blank] - cost[tile][cell]
+
+            lines, a, b, old_a, old_b = _recount_lines(board, width, goal_rows, goal_cols, row_lc, col_lc,
+                                                       cell, blank)
+            new_conflicts = conflicts - old_a - old_b + lines[a] + lines[b]
+
+            moves.append(cell)
+            result = search(g + 1, bound, cell, blank, new_manhattan, new_conflicts)
+            if result == FOUND:
+                return FOUND
+            moves.pop()
+
+            lines[a], lines[b] = old_a, old_b
+            board[blank], board[cell] = 0, tile
+            if result < next_bound:
+                next_bound = result
+        return next_bound
+
+    conflicts = sum(row_lc) + sum(col_lc)
+    if _deepen(search, manhattan + conflicts, blank, manhattan, conflicts):
+        return _replay(initial_state, moves), nodes_explored, len(moves)
+    return None, nodes_explored, 0
+
+
+def _recount_lines(board: List[int], width: int, goal_rows: Sequence[int], goal_cols: Sequence[int],
+                   row_lc: List[int], col_lc: List[int], cell: int, blank: int):
+    """Refresh the conflicts of the two lines a tile just moved between.
+
+    Only the row (or column) the tile left and the one it entered can change,
+    so those two entries are recomputed in place. Returns the updated list, the
+    two line indices and their old penalties so the caller can restore them.
+    """
+    cell_row, cell_col = divmod(cell, width)
+    blank_row, blank_col = divmod(blank, width)
+    if cell_row != blank_row:
+        lines, a, b = row_lc, cell_row, blank_row
+        old_a, old_b = lines[a], lines[b]
+        lines[a] = _line_conflicts(goal_rows, goal_cols, board[a * width:(a + 1) * width], a)
+        lines[b] = _line_conflicts(goal_rows, goal_cols, board[b * width:(b + 1) * width], b)
+    else:
+        lines, a, b = col_lc, cell_col, blank_col
+        old_a, old_b = lines[a], lines[b]
+        lines[a] = _line_conflicts(goal_cols, goal_rows, board[a::width], a)
+        lines[b] = _line_conflicts(goal_cols, goal_rows, board[b::width], b)
+    return lines, a, b, old_a, old_b
+
+
+def _deepen(search, bound: int, blank: int, manhattan: int, conflicts: int) -> bool:
+    """Raise the f bound until search finds the goal; False once nothing is left."""
+    while True:
+        result = search(0, bound, blank, -1, manhattan, conflicts)
+        if result == FOUND:
+            return True
+        if result == float('inf'):
+            return False
+        bound = result
+
+
+def _replay(initial_state: Sequence[int], moves: Sequence[int]) -> List[Tuple[int, ...]]:
+    """Turn the list of blank cells back into the sequence of states."""
+    board = list(initial_state)
+    blank = board.index(0)
+    path = [tuple(board)]
+    for cell in moves:
+        board[blank], board[cell] = board[cell], 0
+        blank = cell
+        path.append(tuple(board))
+    return path
@@ -0,0 +1,136 @@
+import heapq
+import random
+from typing import Callable, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from graph_search import SearchResult, dijkstra
+
+# Landmark (ALT) preprocessing for repeated shortest-path queries on a
+# UniformCSlab4.Graph: A* with Landmarks and the Triangle inequality.
+#
+# For a landmark L and any nodes v, t of an undirected graph,
+# |d(L, t) - d(L, v)| <= d(v, t), so the largest such gap over all landmarks
+# is an admissible heuristic for reaching t from v.
+
+INF = float('inf')
+# Stored in place of inf in the distance table: two unreachable entries then
+# differ by 0 (no information) instead of producing inf - inf = nan
+UNREACHED = 1e300
+
+
+def dijkstra_distances(neighbors: Callable[[int], Iterable[Tuple[int, float]]], n: int, source: int) -> np.ndarray:
+    """Distances from source to every node index 0..n-1 (inf where unreachable).
+
+    neighbors(i) yields (neighbor index, edge weight) pairs.
+    """
+    best = [INF] * n
+    best[source] = 0.0
+    heap = [(0.0, source)]
+    while heap:
+        d, node = heapq.heappop(heap)
+        if d > best[node]:
+            continue  # Stale entry
+        for neighbor, weight in neighbors(node):
+            new_d = d + weight
+            if new_d < best[neighbor]:
+                best[neighbor] = new_d
+                heapq.heappush(heap, (new_d, neighbor))
+    return np.array(best)
+
+
+def _index_neighbors(graph, node_ids: Sequence[str],
+                     index_of: Mapping[str, int]) -> Callable[[int], Iterable[Tuple[int, float]]]:
+    """neighbors(i) by node index, straight from the CSR arrays when the graph has them."""
+    if getattr(graph, "frozen", False):
+        # A frozen CompactGraph: slice its arrays instead of going through node ids
+        indptr, indices, weights = (memoryview(np.ascontiguousarray(values))
+                                    for values in (graph.indptr, graph.indices, graph.weights))
+        return lambda i: zip(indices[indptr[i]:indptr[i + 1]], weights[indptr[i]:indptr[i + 1]])
+    return lambda i: [(index_of[neighbor], weight) for neighbor, weight in graph.neighbors(node_ids[i])]
+
+
+class LandmarkIndex:
+    """Landmark distance tables for one graph, rebuilt whenever the graph changes.
+
+    Landmarks are chosen farthest-first: each new landmark is the node whose
+    distance to the closest existing landmark is largest, which spreads them
+    over the periphery where the bounds are tightest. Every query checks
+    graph.version and rebuilds first if nodes or edges were added since.
+    """
+
+    def __init__(self, graph, num_landmarks: int = 8, seed: Optional[int] = None):
+        self.graph = graph
+        self.num_landmarks = num_landmarks
+        self.seed = seed
+        self.version = None
+        self.rebuild()
+
+    def rebuild(self):
+        """Run one Dijkstra per landmark over the live graph."""
+        if getattr(self.graph, "frozen", False):
+            # A frozen CompactGraph already maps ids to indices, and can no longer change
+            self.node_ids, self.index_of = self.graph.ids, self.graph.index_of
+        else:
+            self.node_ids = list(self.graph.nodes)
+            self.index_of = {node_id: i for i, node_id in enumerate(self.node_ids)}
+        self.landmarks: List[int] = []
+        # Row v holds d(L, v) for every landmark L
+        self.distances = np.empty((len(self.node_ids), 0))
+
+        n = len(self.node_ids)
+        if n and self.num_landmarks > 0:
+            neighbors = _index_neighbors(self.graph, self.node_ids, self.index_of)
+            closest = np.full(n, INF)
+            candidate = random.Random(self.seed).randrange(n)
+            columns = []
+            for _ in range(min(self.num_landmarks, n)):
+                dist = dijkstra_distances(neighbors, n, candidate)
+                if not columns:
+                    # The random seed node is only used to find a peripheral starting landmark
+                    reachable = np.flatnonzero(np.isfinite(dist))
+                    candidate = int(reachable[np.argmax(dist[reachable])])
+                    dist = dijkstra_distances(neighbors, n, candidate)
+                self.landmarks.append(candidate)
+                columns.append(dist)
+                np.minimum(closest, dist, out=closest)
+                # Unreached nodes (inf) come first, so other components get landmarks too
+                candidate = int(np.argmax(closest))
+                if closest[candidate] == 0:
+                    break
+            self.distances = np.ascontiguousarray(np.stack(columns, axis=1))
+            self.distances[np.isinf(self.distances)] = UNREACHED
+        # Flat view of the table; slicing it reads one row as plain floats without copying
+        self._flat = memoryview(self.distances.reshape(-1))
+        self.version = self.graph.version
+
+    def is_stale(self) -> bool:
+        return self.version != self.graph.version
+
+    def lower_bound(self, goal: int) -> Callable[[int], float]:
+        """Admissible estimate of the distance to goal, as a function of a node index.
+
+        Each call reads only that node's row, so a query costs O(L) per node
+        A* actually reaches instead of a pass over the whole table.
+        """
+        if not self.landmarks:
+            return lambda node: 0.0
+        flat, count = self._flat, len(self.landmarks)
+        goal_row = flat[goal * count:(goal + 1) * count].tolist()
+
+        def bound(node: int) -> float:
+            start = node * count
+            gap = max([abs(to_goal - to_node) for to_goal, to_node in zip(goal_row, flat[start:start + count])])
+            # A gap of UNREACHED means a landmark reaches exactly one of the two nodes
+            return INF if gap >= UNREACHED / 2 else gap
+        return bound
+
+    def shortest_path(self, start_id: str, goal_id: str) -> SearchResult:
+        """A* with landmark bounds on the live graph."""
+        if self.is_stale():
+            self.rebuild()
+        h = self.lower_bound(self.index_of[goal_id])
+        if h(self.index_of[start_id]) == INF:
+            return SearchResult(None, INF, 0)  # Some landmark reaches exactly one of them
+        index_of = self.index_of
+        return dijkstra(self.graph, start_id, goal_id, heuristic=lambda node_id: h(index_of[node_id]))
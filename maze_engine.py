@@ -0,0 +1,195 @@
+from collections import deque
+from typing import Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Headless grid-maze search. Cells are (row, col); open cells are 1 (or True)
+# and walls 0, as in MazePathFinder. Internally the grid is padded with a
+# one-cell wall border and flattened, so a cell is a single integer index
+# and its neighbors are index + offset with no bounds checks.
+
+Cell = Tuple[int, int]
+NO_PARENT = -1
+
+
+class MazeSearchResult(NamedTuple):
+    path: Optional[List[Cell]]  # Cells from start to end, or None if unreachable
+    explored: int  # Cells ever added to the frontier, start included
+    expanded: int  # Cells taken off the frontier
+
+
+class Maze:
+    """A grid of open cells and walls, flattened for fast searches."""
+
+    def __init__(self, grid):
+        self.grid = np.asarray(grid).astype(bool, copy=False)
+        if self.grid.ndim != 2:
+            raise ValueError("A maze must be a 2-D grid")
+        self.height, self.width = self.grid.shape
+        self.stride = self.width + 2
+        padded = np.zeros((self.height + 2, self.stride), dtype=np.uint8)
+        padded[1:-1, 1:-1] = self.grid
+        self.open = bytearray(padded.tobytes())
+        # Right, down, left, up: the order MazePathFinder has always tried moves in
+        self.offsets = (1, self.stride, -1, -self.stride)
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.height, self.width
+
+    def index(self, cell: Cell) -> int:
+        row, col = cell
+        if not (0 <= row < self.height and 0 <= col < self.width):
+            raise ValueError(f"Cell {cell} is outside the {self.height}x{self.width} maze")
+        return (row + 1) * self.stride + col + 1
+
+    def cell(self, index: int) -> Cell:
+        row, col = divmod(index, self.stride)
+        return row - 1, col - 1
+
+    def is_open(self, cell: Cell) -> bool:
+        return bool(self.open[self.index(cell)])
+
+    def path_from_parents(self, parent, end: int) -> List[Cell]:
+        path = []
+        while end != NO_PARENT:
+            path.append(self.cell(end))
+            end = parent[end]
+        path.reverse()
+        return path
+
+
+def _search_events(maze: Maze, start: Cell, end: Cell, depth_first: bool, trace: bool):
+    """Shared BFS/DFS loop; a generator that yields events only when trace is set.
+
+    Events are ("frontier", cell) when a cell is queued, ("expand", cell) when
+    it is taken off the frontier and ("path", cells) once the end is reached.
+    The search result is the generator's return value.
+    """
+    source, target = maze.index(start), maze.index(end)
+    if not maze.open[source]:
+        return MazeSearchResult(None, 0, 0)
+    open_cells, offsets = maze.open, maze.offsets
+    visited = bytearray(len(open_cells))
+    index_dtype = np.int32 if len(open_cells) < 2 ** 31 else np.int64
+    parent = memoryview(np.full(len(open_cells), NO_PARENT, dtype=index_dtype))
+    visited[source] = 1
+    frontier = deque([source])
+    take = frontier.pop if depth_first else frontier.popleft
+    explored, expanded = 1, 0
+    if trace:
+        yield "frontier", start
+
+    while frontier:
+        current = take()
+        expanded += 1
+        if trace:
+            yield "expand", maze.cell(current)
+        if current == target:
+            path = maze.path_from_parents(parent, target)
+            if trace:
+                yield "path", path
+            return MazeSearchResult(path, explored, expanded)
+        for offset in offsets:
+            neighbor = current + offset
+            # Border cells are walls, so no bounds checks are needed
+            if open_cells[neighbor] and not visited[neighbor]:
+                visited[neighbor] = 1
+                parent[neighbor] = current
+                frontier.append(neighbor)
+                explored += 1
+                if trace:
+                    yield "frontier", maze.cell(neighbor)
+
+    return MazeSearchResult(None, explored, expanded)
+
+
+def _run(events) -> MazeSearchResult:
+    # Untraced generators never yield, so the first next() finishes the search
+    try:
+        while True:
+            next(events)
+    except StopIteration as stop:
+        return stop.value
+
+
+def bfs(maze: Maze, start: Cell, end: Cell) -> MazeSearchResult:
+    """Breadth-first search; the path is a shortest one."""
+    return _run(_search_events(maze, start, end, depth_first=False, trace=False))
+
+
+def dfs(maze: Maze, start: Cell, end: Cell) -> MazeSearchResult:
+    """Depth-first search with an explicit stack; cells are marked when pushed."""
+    return _run(_search_events(maze, start, end, depth_first=True, trace=False))
+
+
+def bfs_events(maze: Maze, start: Cell, end: Cell) -> Iterator[Tuple[str, object]]:
+    """BFS as a stream of frontier/expand/path events, for step-by-step viewers."""
+    return _search_events(maze, start, end, depth_first=False, trace=True)
+
+
+def dfs_events(maze: Maze, start: Cell, end: Cell) -> Iterator[Tuple[str, object]]:
+    """DFS as a stream of frontier/expand/path events, for step-by-step viewers."""
+    return _search_events(maze, start, end, depth_first=True, trace=True)
+
+
+def wavefront_distances(maze: Maze, sources: Sequence[Cell], stop_at: Optional[Cell] = None) -> np.ndarray:
+    """Steps from the nearest source to every cell (-1 where unreachable), one level at a time.
+
+    Each level grows the whole frontier at once. The frontier is an array of
+    flat padded indices, so shifting it one cell in every direction is just
+    frontier + offset, and the open and not-yet-reached masks are applied by
+    fancy indexing. That is mask dilation limited to the cells that can
+    change, so a level costs O(frontier) rather than O(grid). With stop_at
+    the fill ends as soon as that cell is reached.
+    """
+    open_cells = np.frombuffer(maze.open, dtype=bool)
+    dist = np.full(len(open_cells), -1, dtype=np.int32)
+    slot = np.empty(len(open_cells), dtype=np.int64)
+    frontier = np.unique(np.array([maze.index(cell) for cell in sources], dtype=np.int64))
+    frontier = frontier[open_cells[frontier]]
+    dist[frontier] = 0
+    offsets = np.array(maze.offsets, dtype=np.int64)
+    target = maze.index(stop_at) if stop_at is not None else None
+    level = 0
+
+    while len(frontier) and (target is None or dist[target] < 0):
+        level += 1
+        # The padded border is walls, so no shifted index leaves the grid
+        grown = (frontier[:, None] + offsets).ravel()
+        grown = grown[open_cells[grown] & (dist[grown] < 0)]
+        dist[grown] = level
+        # Neighboring frontier cells can reach the same cell; keep its last
+        # copy, found by scattering positions and reading back who won
+        positions = np.arange(len(grown))
+        slot[grown] = positions
+        frontier = grown[slot[grown] == positions]
+
+    return dist.reshape(maze.height + 2, maze.stride)[1:-1, 1:-1].copy()
+
+
+def descend_path(dist: np.ndarray, start: Cell) -> Optional[List[Cell]]:
+    """Follow decreasing distances from start down to a source (distance 0)."""
+    height, width = dist.shape
+    row, col = start
+    if dist[row, col] < 0:
+        return None
+    path = [(row, col)]
+    while dist[row, col] > 0:
+        target = dist[row, col] - 1
+        # Right, down, left, up, matching the queue-based searches' move order
+        for dr, dc in ((0, 1), (1, 0), (0, -1), (-1, 0)):
+            r, c = row + dr, col + dc
+            if 0 <= r < height and 0 <= c < width and dist[r, c] == target:
+                row, col = r, c
+                break
+        path.append((row, col))
+    return path
+
+
+def wavefront_bfs(maze: Maze, start: Cell, end: Cell) -> MazeSearchResult:
+    """Shortest path from a wavefront grown out of end until it covers start."""
+    dist = wavefront_distances(maze, [end], stop_at=start)
+    path = descend_path(dist, start)
+    reached = int(np.count_nonzero(dist >= 0))
+    return MazeSearchResult(path, reached, reached)
@@ -0,0 +1,286 @@
+import argparse
+import os
+import random
+import struct
+import time
+import zipfile
+import zlib
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+from graph_io import npz_memmaps, write_aligned_member
+from maze_engine import Cell, Maze, bfs, dfs, wavefront_bfs
+
+# Perfect-maze generators and maze files. A maze of rows x cols cells is a
+# (2 * rows + 1) x (2 * cols + 1) uint8 grid in MazePathFinder's layout:
+# cell (r, c) sits at (2r + 1, 2c + 1), the squares between cells are walls
+# or passages, and the outer ring is wall. Generators work on flat indices
+# into a memoryview of the NumPy grid with explicit stacks and lists, so
+# they write straight into the array and never recurse.
+
+
+def _blank(rows: int, cols: int) -> Tuple[np.ndarray, memoryview, int]:
+    if rows < 1 or cols < 1:
+        raise ValueError("A maze needs at least one row and one column of cells")
+    grid = np.zeros((2 * rows + 1, 2 * cols + 1), dtype=np.uint8)
+    return grid, memoryview(grid.reshape(-1)), grid.shape[1]
+
+
+def _cell_states(grid: np.ndarray, width: int) -> bytearray:
+    """1 for every cell position, 0 elsewhere, with a zero tail two rows long.
+
+    A step of two squares from an edge cell lands on a wall position, past
+    the last row into the tail, or above the first row at a negative index
+    that Python wraps into the same tail, so moves need no bounds checks.
+    """
+    states = np.zeros(grid.size + 2 * width, dtype=np.uint8)
+    states[:grid.size].reshape(grid.shape)[1::2, 1::2] = 1
+    return bytearray(states.tobytes())
+
+
+def recursive_backtracker(rows: int, cols: int, seed: Optional[int] = None) -> np.ndarray:
+    """Depth-first carving with an explicit stack: long, winding corridors."""
+    grid, cells, width = _blank(rows, cols)
+    unvisited = _cell_states(grid, width)
+    steps = (2, 2 * width, -2, -2 * width)
+    rng = random.Random(seed)
+    start = width + 1
+    cells[start] = 1
+    unvisited[start] = 0
+    stack = [start]
+
+    while stack:
+        current = stack[-1]
+        options = [step for step in steps if unvisited[current + step]]
+        if not options:
+            stack.pop()
+            continue
+        step = rng.choice(options)
+        nxt = current + step
+        cells[current + step // 2] = 1
+        cells[nxt] = 1
+        unvisited[nxt] = 0
+        stack.append(nxt)
+    return grid
+
+
+def kruskal(rows: int, cols: int, seed: Optional[int] = None) -> np.ndarray:
+    """Knock down walls in random order whenever they join two separate regions."""
+    grid, _, width = _blank(rows, cols)
+    grid[1::2, 1::2] = 1
+    rng = np.random.default_rng(seed)
+    cell_ids = np.arange(rows * cols).reshape(rows, cols)
+    # Every wall between two cells, as (cell, other cell, wall square)
+    right = (cell_ids[:, :-1].ravel(), cell_ids[:, 1:].ravel())
+    down = (cell_ids[:-1, :].ravel(), cell_ids[1:, :].ravel())
+    first = np.concatenate([right[0], down[0]])
+    second = np.concatenate([right[1], down[1]])
+    order = rng.permutation(len(first))
+    first, second = first[order], second[order]
+    # The wall square sits halfway between the two cells' grid positions
+    row_of, col_of = np.divmod(first, cols)
+    other_row, other_col = np.divmod(second, cols)
+    walls = (row_of + other_row + 1) * width + col_of + other_col + 1
+
+    parent = list(range(rows * cols))
+    opened = bytearray(len(walls))
+    for k, (a, b) in enumerate(zip(first.tolist(), second.tolist())):
+        # Union-find with path halving
+        while parent[a] != a:
+            parent[a] = a = parent[parent[a]]
+        while parent[b] != b:
+            parent[b] = b = parent[parent[b]]
+        if a != b:
+            parent[a] = b
+            opened[k] = 1
+    grid.reshape(-1)[walls[np.frombuffer(opened, dtype=bool)]] = 1
+    return grid
+
+
+def prim(rows: int, cols: int, seed: Optional[int] = None) -> np.ndarray:
+    """Grow one region from a random frontier cell at a time: short, branching dead ends."""
+    grid, cells, width = _blank(rows, cols)
+    outside = _cell_states(grid, width)  # 1 until a cell joins the frontier or the maze
+    inside = bytearray(len(outside))
+    steps = (2, 2 * width, -2, -2 * width)
+    rng = random.Random(seed)
+    frontier = []
+
+    def add(cell: int):
+        cells[cell] = 1
+        outside[cell] = 0
+        inside[cell] = 1
+        for step in steps:
+            if outside[cell + step]:
+                outside[cell + step] = 0
+                frontier.append(cell + step)
+
+    add(width + 1)
+    while frontier:
+        # Swap the chosen cell to the end so removing it is O(1)
+        k = rng.randrange(len(frontier))
+        frontier[k], frontier[-1] = frontier[-1], frontier[k]
+        cell = frontier.pop()
+        step = rng.choice([step for step in steps if inside[cell + step]])
+        cells[cell + step // 2] = 1
+        add(cell)
+    return grid
+
+
+GENERATORS: Dict[str, Callable[[int, int, Optional[int]], np.ndarray]] = {
+    "backtracker": recursive_backtracker,
+    "kruskal": kruskal,
+    "prim": prim,
+}
+
+
+def open_corners(grid: np.ndarray) -> Tuple[Cell, Cell]:
+    """The first and last open cells in row-major order, the default start and end."""
+    open_cells = np.flatnonzero(grid)
+    if not len(open_cells):
+        raise ValueError("The maze has no open cells")
+    width = grid.shape[1]
+    first, last = divmod(int(open_cells[0]), width), divmod(int(open_cells[-1]), width)
+    return first, last
+
+
+# Maze files are .png images (white = open) or uncompressed .npz archives
+# holding the grid packed eight cells to a byte, plus its shape. The .npz
+# members are laid out like graph_io's graph files, so they are
+# memory-mapped and unpacked straight from the page cache.
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def save_maze(grid: np.ndarray, path: str):
+    """Write a maze grid to a .png image or a packed-bit .npz archive, by extension."""
+    grid = np.asarray(grid).astype(bool, copy=False)
+    if grid.ndim != 2:
+        raise ValueError("A maze must be a 2-D grid")
+    if path.lower().endswith(".png"):
+        write_png(grid, path)
+        return
+    arrays = {"bits": np.packbits(grid, axis=1), "shape": np.array(grid.shape, dtype=np.int64)}
+    tmp_path = path + ".tmp"
+    with zipfile.ZipFile(tmp_path, "w", zipfile.ZIP_STORED, allowZip64=True) as archive:
+        for name, values in arrays.items():
+            write_aligned_member(archive, name + ".npy", values)
+    os.replace(tmp_path, path)
+
+
+def load_maze(path: str) -> np.ndarray:
+    """Read a maze written by save_maze (or any suitable PNG) as a uint8 grid of 0s and 1s."""
+    if path.lower().endswith(".png"):
+        return read_png(path)
+    arrays = npz_memmaps(path)
+    if "bits" not in arrays or "shape" not in arrays:
+        raise ValueError(f"{path} is not a saved maze")
+    width = int(arrays["shape"][1])
+    return np.unpackbits(arrays["bits"], axis=1, count=width)
+
+
+def _png_chunk(kind: bytes, data: bytes) -> bytes:
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+
+def write_png(grid: np.ndarray, path: str):
+    """1-bit grayscale PNG, one pixel per cell: white for open, black for wall."""
+    height, width = grid.shape
+    rows = np.packbits(np.asarray(grid, dtype=bool), axis=1)
+    # Each scanline starts with its filter type; 0 leaves the bytes as they are
+    scanlines = np.hstack([np.zeros((height, 1), dtype=np.uint8), rows])
+    header = struct.pack(">IIBBBBB", width, height, 1, 0, 0, 0, 0)
+    with open(path, "wb") as out:
+        out.write(PNG_SIGNATURE)
+        out.write(_png_chunk(b"IHDR", header))
+        out.write(_png_chunk(b"IDAT", zlib.compress(scanlines.tobytes(), 6)))
+        out.write(_png_chunk(b"IEND", b""))
+
+
+def read_png(path: str) -> np.ndarray:
+    """Read a grayscale PNG (1- or 8-bit, not interlaced) as a grid; nonzero pixels are open.
+
+    Only the None, Sub and Up scanline filters are supported, which covers
+    write_png's output and most bitmaps saved for mazes.
+    """
+    with open(path, "rb") as handle:
+        data = handle.read()
+    if not data.startswith(PNG_SIGNATURE):
+        raise ValueError(f"{path} is not a PNG file")
+    header, compressed = _png_chunks(data)
+    if header is None:
+        raise ValueError(f"{path}: PNG has no IHDR chunk")
+    width, height, depth, color_type, _, _, interlace = header
+    if color_type != 0 or depth not in (1, 8) or interlace:
+        raise ValueError(f"{path}: only non-interlaced 1- or 8-bit grayscale PNGs are supported")
+
+    row_bytes = (width * depth + 7) // 8
+    raw = np.frombuffer(zlib.decompress(compressed), dtype=np.uint8)
+    raw = raw[:height * (row_bytes + 1)].reshape(height, row_bytes + 1)
+    rows = _unfilter(path, raw[:, 0], raw[:, 1:].copy())
+    if depth == 1:
+        return np.unpackbits(rows, axis=1, count=width)
+    return (rows != 0).astype(np.uint8)
+
+
+def _png_chunks(data: bytes) -> Tuple[Optional[tuple], bytes]:
+    """Split a PNG after its signature into the unpacked IHDR fields and the joined IDAT data."""
+    pos, header, compressed = len(PNG_SIGNATURE), None, []
+    while pos < len(data):
+        length, kind = struct.unpack(">I4s", data[pos:pos + 8])
+        body = data[pos + 8:pos + 8 + length]
+        if kind == b"IHDR":
+            header = struct.unpack(">IIBBBBB", body)
+        elif kind == b"IDAT":
+            compressed.append(body)
+        elif kind == b"IEND":
+            break
+        pos += 12 + length
+    return header, b"".join(compressed)
+
+
+def _unfilter(path: str, filters: np.ndarray, rows: np.ndarray) -> np.ndarray:
+    """Undo the per-scanline filters in place and return the rows."""
+    previous = np.zeros(rows.shape[1], dtype=np.uint8)
+    for i in range(len(rows)):
+        if filters[i] == 1:
+            # Sub adds the byte one pixel to the left; with one byte per pixel or
+            # less that is a running sum, and uint8 wraps mod 256 as PNG requires
+            np.cumsum(rows[i], dtype=np.uint8, out=rows[i])
+        elif filters[i] == 2:
+            rows[i] += previous
+        elif filters[i] != 0:
+            raise ValueError(f"{path}: PNG filter type {filters[i]} is not supported")
+        previous = rows[i]
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a maze, save it and time the maze searches on it.")
+    parser.add_argument("algorithm", choices=list(GENERATORS))
+    parser.add_argument("rows", type=int, help="Rows of cells (the grid is 2 * rows + 1 high)")
+    parser.add_argument("cols", type=int, help="Columns of cells")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("-o", "--output", help="Save to this .npz or .png path")
+    parser.add_argument("--bench", action="store_true", help="Time BFS, DFS and the wavefront between the corners")
+    args = parser.parse_args()
+
+    began = time.perf_counter()
+    grid = GENERATORS[args.algorithm](args.rows, args.cols, args.seed)
+    print(f"{args.algorithm}: {grid.shape[0]}x{grid.shape[1]} grid in {time.perf_counter() - began:.2f}s")
+    if args.output:
+        save_maze(grid, args.output)
+        print(f"saved to {args.output} ({os.path.getsize(args.output)} bytes)")
+    if args.bench:
+        maze = Maze(grid)
+        start, end = open_corners(grid)
+        for name, search in (("bfs", bfs), ("dfs", dfs), ("wavefront", wavefront_bfs)):
+            began = time.perf_counter()
+            result = search(maze, start, end)
+            print(f"{name}: path {len(result.path)} cells, {result.expanded} expanded, "
+                  f"{time.perf_counter() - began:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,33 +1,194 @@
+import argparse
 import tkinter as tk
 from tkinter import messagebox
-from collections import deque
+from typing import Iterable, Tuple
+
+import numpy as np
+
+from maze_engine import Cell, Maze, MazeSearchResult, bfs_events, descend_path, dfs_events, wavefront_distances
+from maze_generators import GENERATORS, load_maze, open_corners
+from search_animation import SPEEDS, SearchAnimation
+
+DEFAULT_MAZE = np.array([
+    [1, 0, 1, 1, 1],
+    [1, 1, 1, 0, 1],
+    [0, 0, 0, 1, 1],
+    [1, 1, 1, 1, 0],
+    [1, 0, 0, 1, 1]
+], dtype=np.uint8)
+
+RGB = Tuple[int, int, int]
+
+
+def render_frame(colors: np.ndarray, left: float, top: float, scale: float, width: int, height: int,
+                 background: RGB, grid_color: RGB) -> np.ndarray:
+    """The width x height pixels of the viewport onto an (rows, cols, 3) cell color buffer.
+
+    left and top are the viewport's corner in zoomed pixels and scale is
+    pixels per cell. Each pixel looks up the cell under it, so the cost is
+    one pass over the viewport however many cells the maze has. Cell borders
+    are drawn in grid_color once cells are big enough to tell apart.
+    """
+    rows, cols = colors.shape[:2]
+    frame = np.empty((height, width, 3), dtype=np.uint8)
+    frame[:] = background
+    ys, xs = top + np.arange(height), left + np.arange(width)
+    row_of, col_of = np.floor(ys / scale).astype(np.int64), np.floor(xs / scale).astype(np.int64)
+    # Pixels over the maze form one contiguous block, since row_of and col_of only increase
+    y0, y1 = np.searchsorted(row_of, [0, rows])
+    x0, x1 = np.searchsorted(col_of, [0, cols])
+    if y0 < y1 and x0 < x1:
+        row_of, col_of = row_of[y0:y1], col_of[x0:x1]
+        # Cull to the visible cells, then repeat rows and columns up to pixels
+        block = colors[row_of[0]:row_of[-1] + 1, col_of[0]:col_of[-1] + 1]
+        frame[y0:y1, x0:x1] = block[row_of - row_of[0]][:, col_of - col_of[0]]
+        if scale >= 8:
+            frame[y0:y1, x0:x1][ys[y0:y1] % scale < 1] = grid_color
+            frame[y0:y1, x0:x1][:, xs[x0:x1] % scale < 1] = grid_color
+    return frame
+
+
+class MazeView:
+    """Draws a maze as a single PhotoImage on a canvas, from an RGB buffer with one entry per cell.
+
+    Recoloring cells only writes into the buffer and asks for a redraw; any
+    number of changes within a frame share one redraw, which renders just
+    the visible part of the maze at the current zoom. The wheel zooms about
+    the pointer and dragging pans.
+    """
+    WALL = "black"
+    OPEN = "white"
+    BACKGROUND = (128, 128, 128)
+    GRID = (217, 217, 217)
+    ZOOM_STEP = 1.2
+    FRAME_MS = 16
+    LABEL_SCALE = 40  # Start/End labels are shown once cells are this many pixels wide
+
+    def __init__(self, canvas: tk.Canvas, maze: np.ndarray, marks):
+        self.canvas = canvas
+        self.maze = np.asarray(maze, dtype=bool)
+        self.marks = marks  # [(cell, color, text)] drawn over everything else, e.g. start and end
+        self.colors = np.empty(self.maze.shape + (3,), dtype=np.uint8)
+        self.image = tk.PhotoImage(master=canvas)
+        self.image_item = canvas.create_image(0, 0, anchor="nw", image=self.image)
+        self.label_items = [canvas.create_text(0, 0, text=text, fill="white") for _, _, text in marks]
+        self.left = self.top = 0.0
+        self.scale = 1.0
+        self.fitted = False
+        self.pending = None
+        self.drag_from = None
+        self.reset()
+
+        canvas.bind("<Configure>", self.on_resize)
+        canvas.bind("<MouseWheel>", self.on_wheel)  # Windows and macOS
+        canvas.bind("<Button-4>", lambda event: self.zoom_at(event.x, event.y, self.ZOOM_STEP))  # X11
+        canvas.bind("<Button-5>", lambda event: self.zoom_at(event.x, event.y, 1 / self.ZOOM_STEP))
+        canvas.bind("<ButtonPress-1>", self.start_pan)
+        canvas.bind("<B1-Motion>", self.pan)
+
+    def rgb(self, color: str) -> RGB:
+        red, green, blue = self.canvas.winfo_rgb(color)  # 16 bits per channel
+        return red >> 8, green >> 8, blue >> 8
+
+    def reset(self):
+        """Back to plain walls and open cells."""
+        self.colors[:] = self.rgb(self.WALL)
+        self.colors[self.maze] = self.rgb(self.OPEN)
+        self._paint_marks()
+        self.request_redraw()
+
+    def paint(self, cells: Iterable[Cell], color: str):
+        """Color a batch of cells; start and end keep their own colors."""
+        cells = np.array(list(cells), dtype=np.int64).reshape(-1, 2)
+        self.colors[cells[:, 0], cells[:, 1]] = self.rgb(color)
+        self._paint_marks()
+        self.request_redraw()
+
+    def paint_mask(self, mask: np.ndarray, colors):
+        """Color the cells where mask is set, from one RGB triple or one per masked cell."""
+        self.colors[mask] = colors
+        self._paint_marks()
+        self.request_redraw()
+
+    def _paint_marks(self):
+        for (row, col), color, _ in self.marks:
+            self.colors[row, col] = self.rgb(color)
+
+    def request_redraw(self):
+        if self.pending is None:
+            self.pending = self.canvas.after(self.FRAME_MS, self.redraw)
+
+    def redraw(self):
+        self.pending = None
+        width, height = self.canvas.winfo_width(), self.canvas.winfo_height()
+        if width <= 1 or height <= 1:  # Not laid out yet
+            width, height = int(self.canvas["width"]), int(self.canvas["height"])
+        frame = render_frame(self.colors, self.left, self.top, self.scale, width, height,
+                             self.BACKGROUND, self.GRID)
+        # Binary PPM is the one format Tk's photo image reads with no extra packages
+        self.image.configure(data=b"P6 %d %d 255\n" % (width, height) + frame.tobytes(), format="ppm")
+
+        state = "normal" if self.scale >= self.LABEL_SCALE else "hidden"
+        for item, ((row, col), _, _) in zip(self.label_items, self.marks):
+            self.canvas.coords(item, (col + 0.5) * self.scale - self.left, (row + 0.5) * self.scale - self.top)
+            self.canvas.itemconfigure(item, state=state)
+
+    def fit(self, width: int, height: int):
+        """Zoom so the whole maze fills the canvas, centered."""
+        rows, cols = self.maze.shape
+        self.scale = min(width / cols, height / rows)
+        self.left = (cols * self.scale - width) / 2
+        self.top = (rows * self.scale - height) / 2
+        self.request_redraw()
+
+    def on_resize(self, event):
+        if not self.fitted:
+            self.fit(event.width, event.height)
+            self.fitted = True
+        self.request_redraw()
+
+    def on_wheel(self, event):
+        self.zoom_at(event.x, event.y, self.ZOOM_STEP if event.delta > 0 else 1 / self.ZOOM_STEP)
+
+    def zoom_at(self, x: int, y: int, factor: float):
+        # Keep the point under the pointer in place
+        self.left = (self.left + x) * factor - x
+        self.top = (self.top + y) * factor - y
+        self.scale *= factor
+        self.request_redraw()
+
+    def start_pan(self, event):
+        self.drag_from = event.x, event.y
+
+    def pan(self, event):
+        x, y = self.drag_from
+        self.left -= event.x - x
+        self.top -= event.y - y
+        self.drag_from = event.x, event.y
+        self.request_redraw()
 
 
 class MazePathFinder:
-    def __init__(self, master):
+    def __init__(self, master, maze=None, start=None, end=None):
         self.master = master
         self.master.title("Maze Pathfinding Visualization")
 
-        # Maze configuration
-        self.maze = [
-            [1, 0, 1, 1, 1],
-            [1, 1, 1, 0, 1],
-            [0, 0, 0, 1, 1],
-            [1, 1, 1, 1, 0],
-            [1, 0, 0, 1, 1]
-        ]
-        self.start = (0, 0)
-        self.end = (4, 4)
+        # Maze configuration: any grid of 1 (open) and 0 (wall); start and end
+        # default to the first and last open cells
+        self.maze = np.asarray(DEFAULT_MAZE if maze is None else maze, dtype=np.uint8)
+        self.engine = Maze(self.maze)
+        first, last = open_corners(self.maze)
+        self.start = tuple(start) if start is not None else first
+        self.end = tuple(end) if end is not None else last
 
         # Create frames
         self.maze_frame = tk.Frame(master)
-        self.maze_frame.pack(padx=10, pady=10)
+        self.maze_frame.pack(padx=10, pady=10, expand=True, fill='both')
 
         self.control_frame = tk.Frame(master)
         self.control_frame.pack(padx=10, pady=10)
 
-        # Create maze grid buttons
-        self.grid_buttons = []
+        # Maze canvas
         self.create_maze_grid()
 
         # Buttons for algorithms
@@ -37,158 +198,113 @@ class MazePathFinder:
         self.dfs_button = tk.Button(self.control_frame, text='DFS Pathfinding', command=self.run_dfs_step)
         self.dfs_button.pack(side=tk.LEFT, padx=5)
 
+        self.wave_button = tk.Button(self.control_frame, text='Wavefront Distances', command=self.run_wavefront)
+        self.wave_button.pack(side=tk.LEFT, padx=5)
+
+        # Expanded cells per second; searches no longer run at one cell per 500 ms tick
+        tk.Label(self.control_frame, text="Speed").pack(side=tk.LEFT)
+        self.speed_var = tk.StringVar(value="Normal")
+        tk.OptionMenu(self.control_frame, self.speed_var, *SPEEDS).pack(side=tk.LEFT, padx=5)
+        self.animation = None
+
         # Result label
         self.result_label = tk.Label(self.control_frame, text="", font=("Arial", 10))
         self.result_label.pack(side=tk.LEFT, padx=10)
 
-        # Visualization variables
-        self.current_path = []
-        self.explored_nodes = set()
-
     def create_maze_grid(self):
-        """Create visual representation of the maze."""
-        for i in range(len(self.maze)):
-            row_buttons = []
-            for j in range(len(self.maze[0])):
-                # Color codes
-                bg_color = 'white' if self.maze[i][j] == 1 else 'black'
-
-                # Create button for each cell
-                btn = tk.Button(self.maze_frame, width=4, height=2, bg=bg_color,
-                                state='normal' if self.maze[i][j] == 1 else 'disabled')
-                btn.grid(row=i, column=j, padx=2, pady=2)
-                row_buttons.append(btn)
-            self.grid_buttons.append(row_buttons)
-
-        # Mark start and end points
-        self.grid_buttons[self.start[0]][self.start[1]].config(bg='green', text='Start')
-        self.grid_buttons[self.end[0]][self.end[1]].config(bg='red', text='End')
+        """Create visual representation of the maze: one canvas, whatever the maze size."""
+        self.canvas = tk.Canvas(self.maze_frame, width=600, height=600, highlightthickness=0)
+        self.canvas.pack(expand=True, fill='both')
+        self.view = MazeView(self.canvas, self.maze,
+                             [(self.start, 'green', 'Start'), (self.end, 'red', 'End')])
 
     def reset_grid(self):
-        """Reset grid to original state."""
-        for i in range(len(self.maze)):
-            for j in range(len(self.maze[0])):
-                bg_color = 'white' if self.maze[i][j] == 1 else 'black'
-                self.grid_buttons[i][j].config(bg=bg_color, text="")
-
-        # Recolor start and end
-        self.grid_buttons[self.start[0]][self.start[1]].config(bg='green', text='Start')
-        self.grid_buttons[self.end[0]][self.end[1]].config(bg='red', text='End')
-
-    def is_valid_move(self, x, y):
-        """Check if move is valid."""
-        return (0 <= x < len(self.maze) and
-                0 <= y < len(self.maze[0]) and
-                self.maze[x][y] == 1)
+        """Reset grid to original state, stopping any search still playing."""
+        if self.animation is not None:
+            self.animation.cancel()
+            self.animation = None
+        self.view.reset()
+        self.result_label.config(text="")
 
     def run_bfs_step(self):
         """Perform BFS with step-by-step visualization."""
-        self.reset_grid()
-        queue = deque([(self.start, [self.start])])
-        self.explored_nodes = set([self.start])
-        self.current_path = []
-
-        def bfs_step():
-            if not queue:
-                messagebox.showinfo("BFS", "No path found!")
-                return
-
-            (x, y), path = queue.popleft()
-
-            # Visualize explored node
-            if (x, y) != self.start and (x, y) != self.end:
-                self.grid_buttons[x][y].config(bg='yellow')
-
-            if (x, y) == self.end:
-                # Path found - visualize path
-                self.visualize_path(path)
-                return
-
-            # Possible moves: right, down, left, up
-            directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
-
-            for dx, dy in directions:
-                next_x, next_y = x + dx, y + dy
-
-                if self.is_valid_move(next_x, next_y) and (next_x, next_y) not in self.explored_nodes:
-                    queue.append(((next_x, next_y), path + [(next_x, next_y)]))
-                    self.explored_nodes.add((next_x, next_y))
-
-            if queue:
-                self.master.after(500, bfs_step)
-            else:
-                messagebox.showinfo("BFS", "No path found!")
-
-        # Start BFS visualization
-        bfs_step()
+        self.run_search("BFS", bfs_events(self.engine, self.start, self.end), 'yellow')
 
     def run_dfs_step(self):
         """Perform DFS with step-by-step visualization."""
-        self.reset_grid()
-        stack = [(self.start, [self.start])]
-        self.explored_nodes = set([self.start])
-        self.current_path = []
-
-        def dfs_step():
-            if not stack:
-                messagebox.showinfo("DFS", "No path found!")
-                return
+        self.run_search("DFS", dfs_events(self.engine, self.start, self.end), 'purple')
 
-            (x, y), path = stack.pop()
-
-            # Visualize explored node
-            if (x, y) != self.start and (x, y) != self.end:
-                self.grid_buttons[x][y].config(bg='purple')
-
-            if (x, y) == self.end:
-                # Path found - visualize path
-                self.visualize_path(path)
-                return
-
-            # Possible moves: right, down, left, up
-            directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
+    def run_wavefront(self):
+        """Shade every open cell by its distance to the exit and show the path down that distance map."""
+        self.reset_grid()
+        dist = wavefront_distances(self.engine, [self.end])
+        reached = dist >= 0
+        # Light cyan next to the exit, fading to dark cyan at the farthest cell
+        near, far = np.array(self.view.rgb('light cyan')), np.array(self.view.rgb('dark cyan'))
+        share = dist[reached] / max(int(dist.max()), 1)
+        self.view.paint_mask(reached, (near + np.outer(share, far - near)).astype(np.uint8))
+
+        path = descend_path(dist, self.start)
+        if path is None:
+            messagebox.showinfo("Wavefront", "No path found!")
+        else:
+            count = int(np.count_nonzero(reached))
+            self.visualize_path(MazeSearchResult(path, count, count))
+
+    def run_search(self, title, events, color):
+        """Play a search engine's events at the chosen speed, painting expanded cells once per frame."""
+        self.reset_grid()
+        expanded = []
 
-            for dx, dy in directions:
-                next_x, next_y = x + dx, y + dy
+        def on_event(kind, cell):
+            if kind == "expand":
+                expanded.append(cell)
 
-                if self.is_valid_move(next_x, next_y) and (next_x, next_y) not in self.explored_nodes:
-                    stack.append(((next_x, next_y), path + [(next_x, next_y)]))
-                    self.explored_nodes.add((next_x, next_y))
+        def on_frame():
+            if expanded:
+                self.view.paint(expanded, color)
+                expanded.clear()
 
-            if stack:
-                self.master.after(500, dfs_step)
+        def on_done(result: MazeSearchResult):
+            self.animation = None
+            if result.path is None:
+                messagebox.showinfo(title, "No path found!")
             else:
-                messagebox.showinfo("DFS", "No path found!")
+                self.visualize_path(result)
 
-        # Start DFS visualization
-        dfs_step()
+        self.animation = SearchAnimation(self.master, events, on_event, on_done, on_frame,
+                                         rate=SPEEDS[self.speed_var.get()]).start()
 
-    def visualize_path(self, path):
+    def visualize_path(self, result: MazeSearchResult):
         """Visualize the final path with color."""
         # Color the path blue
-        for x, y in path[1:-1]:
-            self.grid_buttons[x][y].config(bg='blue')
+        self.view.paint(result.path, 'blue')
 
         # Show result
-        result_text = f"Path Found! Length: {len(path)}, Explored Nodes: {len(self.explored_nodes)}"
+        result_text = f"Path Found! Length: {len(result.path)}, Explored Nodes: {result.explored}"
         self.result_label.config(text=result_text)
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Visualize BFS and DFS on a maze.")
+    parser.add_argument("maze", nargs="?", help="Maze file (.npz or .png) to load")
+    parser.add_argument("--generate", choices=list(GENERATORS), help="Generate a maze instead")
+    parser.add_argument("--size", type=int, nargs=2, default=(5, 5), metavar=("ROWS", "COLS"),
+                        help="Cells in a generated maze")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    maze = None
+    if args.generate:
+        maze = GENERATORS[args.generate](*args.size, args.seed)
+    elif args.maze:
+        maze = load_maze(args.maze)
+
     root = tk.Tk()
     root.title("Maze Pathfinding Visualization")
-    app = MazePathFinder(root)
+    app = MazePathFinder(root, maze)
     root.mainloop()
 
 
 if __name__ == '__main__':
     main()
-
-
-
-
-
-
-
-
-
@@ -7,6 +7,8 @@ import time
 import random
 from collections import deque
 
+from search_animation import INSTANT, SearchAnimation
+
 class Node:
     def __init__(self, position, g_cost=float('inf'), h_cost=0):
         self.position = position
@@ -24,10 +26,12 @@ class PathPlanningVisualizer:
         self.grid_size = grid_size
         self.cell_size = cell_size
         self.current_algorithm = None
-        self.open_set = []
+        self.open_set = set()  # Positions queued but not yet expanded
         self.closed_set = set()
         self.path = []
         self.step_delay = 100
+        self.animation = None
+        self.cell_items = {}  # (row, col) -> rectangle
         self.metrics = {
             'path_length': 0,
             'path_cost': 0,
@@ -88,6 +92,10 @@ class PathPlanningVisualizer:
         self.speed_scale.set(100)
         self.speed_scale.pack(side=tk.LEFT)
 
+        # Skip the animation and show the finished search at once
+        self.instant_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(control_frame, text="Instant", variable=self.instant_var).pack(side=tk.LEFT, padx=5)
+
         metrics_frame = ttk.LabelFrame(self.root, text="Algorithm Metrics")
         metrics_frame.pack(side=tk.TOP, fill=tk.X, padx=5, pady=5)
 
@@ -116,32 +124,38 @@ class PathPlanningVisualizer:
         self.canvas.bind("<Button-1>", self.on_canvas_click)
         self.draw_grid()
 
+    def cell_color(self, pos):
+        # Determine the color of the cell based on its state
+        i, j = pos
+        if self.grid[i][j] == 1:
+            return "black"
+        elif pos == self.start:
+            return "green"
+        elif pos == self.goal:
+            return "red"
+        elif pos in self.path:
+            return "blue"
+        elif pos in self.closed_set:
+            return "light blue"
+        elif pos in self.open_set:
+            return "yellow"
+        return "white"
+
     def draw_grid(self):
         self.canvas.delete("all")
+        self.cell_items.clear()
         for i in range(self.grid_size):
             for j in range(self.grid_size):
                 x1 = j * self.cell_size
                 y1 = i * self.cell_size
                 x2 = x1 + self.cell_size
                 y2 = y1 + self.cell_size
+                self.cell_items[(i, j)] = self.canvas.create_rectangle(
+                    x1, y1, x2, y2, fill=self.cell_color((i, j)), outline="gray")
 
-                # Determine the color of the cell based on its state
-                if self.grid[i][j] == 1:
-                    color = "black"
-                elif (i, j) == self.start:
-                    color = "green"
-                elif (i, j) == self.goal:
-                    color = "red"
-                elif (i, j) in self.closed_set:
-                    color = "light blue"
-                elif any(node.position == (i, j) for node in self.open_set):
-                    color = "yellow"
-                elif (i, j) in self.path:
-                    color = "blue"
-                else:
-                    color = "white"
-
-                self.canvas.create_rectangle(x1, y1, x2, y2, fill=color, outline="gray")
+    def refresh_cell(self, pos):
+        """Recolor one cell after its search state changed, reusing its rectangle."""
+        self.canvas.itemconfigure(self.cell_items[pos], fill=self.cell_color(pos))
 
     def generate_obstacles(self):
         self.clear_path()
@@ -151,8 +165,12 @@ class PathPlanningVisualizer:
                     self.grid[i][j] = 1 if random.random() < 0.3 else 0
         self.draw_grid()
 
-    def clear_path(self):
-        self.open_set = []
+    def reset_search(self):
+        """Forget the last search (stopping it if still playing) but keep the obstacles."""
+        if self.animation is not None:
+            self.animation.cancel()
+            self.animation = None
+        self.open_set = set()
         self.closed_set = set()
         self.path = []
         self.current_algorithm = None
@@ -160,7 +178,10 @@ class PathPlanningVisualizer:
         for key in self.metrics:
             self.metrics[key] = 0
         self.update_metrics()
+        self.draw_grid()
 
+    def clear_path(self):
+        self.reset_search()
         for i in range(self.grid_size):
             for j in range(self.grid_size):
                 if (i, j) != self.start and (i, j) != self.goal:
@@ -216,22 +237,30 @@ class PathPlanningVisualizer:
         self.update_metrics()
 
     def a_star_search(self, heuristic):
+        """A* as a stream of events: ("expand", pos), ("frontier", pos), then ("path", positions).
+
+        Returns the path, or [] if the goal cannot be reached. Drawing state
+        (open_set, closed_set, path) is kept up to date as it goes.
+        """
         start_node = Node(self.start, 0, heuristic(self.start, self.goal))
         open_list = []
         heapq.heappush(open_list, start_node)
-        self.open_set = [start_node]
+        self.open_set = {self.start}
         self.closed_set = set()
 
         while open_list:
             current_node = heapq.heappop(open_list)
-            # Remove the current node from open_set used for drawing.
-            self.open_set = [node for node in self.open_set if node.position != current_node.position]
+            if current_node.position in self.closed_set:
+                continue  # A costlier duplicate of a node already expanded
+            self.open_set.discard(current_node.position)
 
             if current_node.position == self.goal:
                 self.path = self.reconstruct_path(current_node)
+                yield "path", self.path
                 return self.path
 
             self.closed_set.add(current_node.position)
+            yield "expand", current_node.position
 
             for neighbor in self.get_neighbours(current_node.position):
                 if neighbor in self.closed_set:
@@ -240,31 +269,30 @@ class PathPlanningVisualizer:
                 neighbor_node = Node(neighbor, tentative_g, heuristic(neighbor, self.goal))
                 neighbor_node.parent = current_node
                 heapq.heappush(open_list, neighbor_node)
-                self.open_set.append(neighbor_node)
-
-            # Update the canvas to animate the search
-            self.draw_grid()
-            self.root.update()
-            time.sleep(self.speed_scale.get() / 1000.0)
+                self.open_set.add(neighbor)
+                yield "frontier", neighbor
 
         return []
 
     def bfs_search(self):
+        """Breadth-first search as a stream of events, like a_star_search."""
         start_node = Node(self.start, 0, 0)
         queue = deque([start_node])
         visited = set([self.start])
-        self.open_set = [start_node]
+        self.open_set = {self.start}
         self.closed_set = set()
 
         while queue:
             current_node = queue.popleft()
-            self.open_set = [node for node in self.open_set if node.position != current_node.position]
+            self.open_set.discard(current_node.position)
 
             if current_node.position == self.goal:
                 self.path = self.reconstruct_path(current_node)
+                yield "path", self.path
                 return self.path
 
             self.closed_set.add(current_node.position)
+            yield "expand", current_node.position
 
             for neighbor in self.get_neighbours(current_node.position):
                 if neighbor in visited:
@@ -273,35 +301,42 @@ class PathPlanningVisualizer:
                 neighbor_node = Node(neighbor, 0, 0)
                 neighbor_node.parent = current_node
                 queue.append(neighbor_node)
-                self.open_set.append(neighbor_node)
-
-            self.draw_grid()
-            self.root.update()
-            time.sleep(self.speed_scale.get() / 1000.0)
+                self.open_set.add(neighbor)
+                yield "frontier", neighbor
 
         return []
 
     def start_search(self):
-        self.clear_path()  # Clear any old search results
+        self.reset_search()  # Clear any old search results, keeping the obstacles
         start_time = time.time()
         algo = self.algo_var.get()
         if "Manhattan" in algo:
             heuristic = self.manhattan_distance
-            path = self.a_star_search(heuristic)
+            events = self.a_star_search(heuristic)
         elif "Euclidean" in algo:
             heuristic = self.euclidean_distance
-            path = self.a_star_search(heuristic)
+            events = self.a_star_search(heuristic)
         elif "Uniform" in algo:
             heuristic = lambda pos, goal: 0
-            path = self.a_star_search(heuristic)
+            events = self.a_star_search(heuristic)
         elif "BFS" in algo:
-            path = self.bfs_search()
+            events = self.bfs_search()
         else:
             # Default to A* using Manhattan
             heuristic = self.manhattan_distance
-            path = self.a_star_search(heuristic)
+            events = self.a_star_search(heuristic)
+
+        def on_event(kind, payload):
+            for pos in (payload if kind == "path" else [payload]):
+                self.refresh_cell(pos)
+
+        def on_done(path):
+            self.animation = None
+            self.calculate_metrics(path, start_time)
 
-        self.calculate_metrics(path, start_time)
+        # The scale is the delay per expanded node in milliseconds
+        rate = INSTANT if self.instant_var.get() else 1000.0 / self.speed_scale.get()
+        self.animation = SearchAnimation(self.root, events, on_event, on_done, rate=rate).start()
 
     def on_canvas_click(self, event):
         # Optional: implement interactive features (e.g., set start/goal, place obstacles)
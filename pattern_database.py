@@ -0,0 +1,188 @@
+import argparse
+import os
+from collections import deque
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from puzzle_engine import goal_state, neighbor_table
+
+# Disjoint tile groups per board width; the groups' costs add up admissibly
+# because each table only counts moves of its own tiles.
+DEFAULT_PARTITIONS: Dict[int, Tuple[Tuple[int, ...], ...]] = {
+    3: ((1, 2, 3, 4), (5, 6, 7, 8)),
+    4: ((1, 2, 3, 4, 7), (5, 6, 9, 10, 13), (8, 11, 12, 14, 15)),
+}
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "pattern_databases")
+UNSEEN = 255
+
+
+def table_size(cells: int, num_tiles: int) -> int:
+    """Number of ways to place num_tiles distinct tiles on cells cells."""
+    size = 1
+    for i in range(num_tiles):
+        size *= cells - i
+    return size
+
+
+def rank_positions(positions: Sequence[int], cells: int) -> int:
+    """Compact mixed-radix rank of distinct tile positions (a partial permutation)."""
+    rank = 0
+    for i, pos in enumerate(positions):
+        digit = pos
+        for earlier in positions[:i]:
+            if earlier < pos:
+                digit -= 1
+        rank = rank * (cells - i) + digit
+    return rank
+
+
+def rank_position_arrays(positions: Sequence[np.ndarray], cells: int) -> np.ndarray:
+    """rank_positions over arrays of positions, one array per tile."""
+    rank = np.zeros(len(positions[0]), dtype=np.int64)
+    for i, pos in enumerate(positions):
+        digit = pos.astype(np.int64)
+        for earlier in positions[:i]:
+            digit -= earlier < pos
+        rank = rank * (cells - i) + digit
+    return rank
+
+
+def build_pattern_table(width: int, tiles: Sequence[int]) -> np.ndarray:
+    """Retrograde 0-1 BFS from the goal, counting only moves of the pattern tiles.
+
+    The table is indexed by rank_positions of the pattern tiles followed by the blank.
+    """
+    cells = width * width
+    k = len(tiles)
+    neighbors = neighbor_table(width)
+    goal_index = {tile: idx for idx, tile in enumerate(goal_state(width))}
+
+    # States are packed as 4 bits per pattern tile position plus 4 bits for the blank
+    blank_shift = 4 * k
+    shifts = [4 * i for i in range(k)]
+    dist = bytearray([UNSEEN]) * (1 << (4 * (k + 1)))
+
+    start = sum(goal_index[tile] << shifts[i] for i, tile in enumerate(tiles))
+    start |= goal_index[0] << blank_shift
+    dist[start] = 0
+    queue = deque([start])
+
+    while queue:
+        state = queue.popleft()
+        cost = dist[state]
+        blank = state >> blank_shift
+        positions = [(state >> shift) & 0xF for shift in shifts]
+
+        for cell in neighbors[blank]:
+            if cell in positions:
+                # A pattern tile slides into the blank: one counted move
+                i = positions.index(cell)
+                new_state = (state - (cell << shifts[i]) + (blank << shifts[i])
+                             - (blank << blank_shift) + (cell << blank_shift))
+                new_cost = cost + 1
+                if new_cost < dist[new_state]:
+                    dist[new_state] = new_cost
+                    queue.append(new_state)
+            else:
+                # Any other tile moving is free for this pattern
+                new_state = state - (blank << blank_shift) + (cell << blank_shift)
+                if cost < dist[new_state]:
+                    dist[new_state] = cost
+                    queue.appendleft(new_state)
+
+    # Keep the blank in the key: taking the minimum over blank positions would
+    # still be admissible but not consistent, and a_star closes states on first expansion
+    states = np.flatnonzero(np.frombuffer(dist, dtype=np.uint8) != UNSEEN)
+    positions = [(states >> shift) & 0xF for shift in shifts + [blank_shift]]
+    table = np.full(table_size(cells, k + 1), UNSEEN, dtype=np.uint8)
+    table[rank_position_arrays(positions, cells)] = np.frombuffer(dist, dtype=np.uint8)[states]
+    return table
+
+
+class PatternDatabase:
+    """A single pattern table, memory-mapped from disk once built."""
+
+    def __init__(self, width: int, tiles: Sequence[int], table: np.ndarray):
+        self.width = width
+        self.cells = width * width
+        self.tiles = tuple(tiles)
+        self.key_tiles = self.tiles + (0,)
+        self.table = table
+        self._lookup = memoryview(table)
+
+    @staticmethod
+    def path_for(width: int, tiles: Sequence[int], cache_dir: str) -> str:
+        name = "pdb_{0}x{0}_{1}_blank.npy".format(width, "-".join(str(tile) for tile in tiles))
+        return os.path.join(cache_dir, name)
+
+    @classmethod
+    def load_or_build(cls, width: int, tiles: Sequence[int],
+                      cache_dir: str = DEFAULT_CACHE_DIR) -> 'PatternDatabase':
+        path = cls.path_for(width, tiles, cache_dir)
+        if not os.path.exists(path):
+            os.makedirs(cache_dir, exist_ok=True)
+            table = build_pattern_table(width, tiles)
+            # Write to a temporary name first so a concurrent reader never sees a partial file
+            tmp_path = path + ".tmp.npy"
+            np.save(tmp_path, table)
+            os.replace(tmp_path, path)
+        return cls(width, tiles, np.load(path, mmap_mode="r"))
+
+    def lookup(self, tile_positions: Sequence[int]) -> int:
+        """Cost for a board given as tile -> cell index."""
+        return self._lookup[rank_positions([tile_positions[tile] for tile in self.key_tiles], self.cells)]
+
+
+class AdditivePDB:
+    """Sum of disjoint pattern databases; usable as a heuristic_func for a_star."""
+
+    def __init__(self, width: int = 3, partition: Optional[Sequence[Sequence[int]]] = None,
+                 cache_dir: str = DEFAULT_CACHE_DIR):
+        self.width = width
+        self.cells = width * width
+        partition = partition or DEFAULT_PARTITIONS[width]
+        self.databases = [PatternDatabase.load_or_build(width, tiles, cache_dir) for tiles in partition]
+
+    @classmethod
+    def from_databases(cls, databases: Sequence[PatternDatabase]) -> 'AdditivePDB':
+        """Wrap tables that are already in memory (e.g. attached from shared memory)."""
+        pdb = cls.__new__(cls)
+        pdb.width = databases[0].width
+        pdb.cells = databases[0].cells
+        pdb.databases = list(databases)
+        return pdb
+
+    def __call__(self, state: Sequence[int]) -> int:
+        tile_positions = [0] * self.cells
+        for idx, tile in enumerate(state):
+            tile_positions[tile] = idx
+        return sum(database.lookup(tile_positions) for database in self.databases)
+
+
+_loaded: Dict[Tuple, AdditivePDB] = {}
+
+
+def get_pdb(width: int = 3, partition: Optional[Sequence[Sequence[int]]] = None,
+            cache_dir: str = DEFAULT_CACHE_DIR) -> AdditivePDB:
+    """Process-wide cached AdditivePDB so tables are mapped at most once per process."""
+    key = (width, tuple(map(tuple, partition or DEFAULT_PARTITIONS[width])), cache_dir)
+    if key not in _loaded:
+        _loaded[key] = AdditivePDB(width, partition, cache_dir)
+    return _loaded[key]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build additive pattern databases for sliding-tile puzzles.")
+    parser.add_argument("--width", type=int, default=3, choices=sorted(DEFAULT_PARTITIONS))
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR)
+    args = parser.parse_args()
+
+    pdb = get_pdb(args.width, cache_dir=args.cache_dir)
+    for database in pdb.databases:
+        print(f"Tiles {database.tiles}: {database.table.size} entries, max cost {int(database.table.max())}")
+        print(f"  {PatternDatabase.path_for(args.width, database.tiles, args.cache_dir)}")
+
+
+if __name__ == "__main__":
+    main()
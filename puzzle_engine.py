@@ -0,0 +1,279 @@
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+# Board-size-parametric core for sliding-tile puzzles. States are flat tuples
+# read row by row with 0 as the blank; the goal has the blank in the last cell.
+#
+# Packed boards: each tile takes 4 bits and cell 0 sits in the highest nibble,
+# so comparing two codes orders them exactly like the state tuples. Four bits
+# per tile covers boards up to 4x4.
+SIZE = 3
+CELLS = SIZE * SIZE
+GOAL_STATE = (1, 2, 3, 4, 5, 6, 7, 8, 0)
+NO_PARENT = -1
+SMALL_INVERSION_COUNT = 16
+
+
+def board_width(state: Sequence[int]) -> int:
+    """Width of a square board given as a flat state."""
+    width = int(round(len(state) ** 0.5))
+    if width * width != len(state):
+        raise ValueError(f"State of length {len(state)} is not a square board")
+    return width
+
+
+@lru_cache(maxsize=None)
+def goal_state(width: int) -> Tuple[int, ...]:
+    """Tiles 1..n-1 in order with the blank in the last cell."""
+    cells = width * width
+    return tuple(range(1, cells)) + (0,)
+
+
+@lru_cache(maxsize=None)
+def neighbor_table(width: int) -> Tuple[Tuple[int, ...], ...]:
+    """Cells adjacent to each cell of a width x width board, in Up, Down, Left, Right order."""
+    table = []
+    for idx in range(width * width):
+        row, col = divmod(idx, width)
+        moves = []
+        for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+            new_row, new_col = row + dr, col + dc
+            if 0 <= new_row < width and 0 <= new_col < width:
+                moves.append(new_row * width + new_col)
+        table.append(tuple(moves))
+    return tuple(table)
+
+
+@lru_cache(maxsize=None)
+def tile_cost_tables(width: int) -> Dict[str, List[List[int]]]:
+    """Per-tile, per-cell costs; both heuristics are sums of these over the board."""
+    cells = width * width
+    goal_idx = {tile: idx for idx, tile in enumerate(goal_state(width))}
+    misplaced = [[0] * cells for _ in range(cells)]
+    manhattan = [[0] * cells for _ in range(cells)]
+    for tile in range(1, cells):
+        goal_row, goal_col = divmod(goal_idx[tile], width)
+        for idx in range(cells):
+            row, col = divmod(idx, width)
+            misplaced[tile][idx] = int(idx != goal_idx[tile])
+            manhattan[tile][idx] = abs(row - goal_row) + abs(col - goal_col)
+    return {'misplaced': misplaced, 'manhattan': manhattan}
+
+
+@lru_cache(maxsize=None)
+def heuristic_deltas(width: int) -> Dict[str, List[List[List[int]]]]:
+    """delta[tile][from_idx][to_idx]: heuristic change when one tile slides between cells."""
+    cells = width * width
+    tables = {}
+    for name, cost in tile_cost_tables(width).items():
+        tables[name] = [[[cost[tile][to_idx] - cost[tile][from_idx] for to_idx in range(cells)]
+                         for from_idx in range(cells)]
+                        for tile in range(cells)]
+    return tables
+
+
+def count_inversions(values: Sequence[int]) -> int:
+    """Number of out-of-order pairs, counted with a merge sort in O(n log n).
+
+    Boards up to 4x4 take the plain pairwise count, which has far less
+    overhead than the recursion at that size.
+    """
+    values = list(values)
+    if len(values) <= SMALL_INVERSION_COUNT:
+        return sum(1 for i, value in enumerate(values) for other in values[i + 1:] if value > other)
+    return _sort_and_count(values)[1]
+
+
+def _sort_and_count(values: List[int]) -> Tuple[List[int], int]:
+    if len(values) < 2:
+        return values, 0
+    mid = len(values) // 2
+    left, left_count = _sort_and_count(values[:mid])
+    right, right_count = _sort_and_count(values[mid:])
+    merged = []
+    inversions = left_count + right_count
+    i = j = 0
+    while i < len(left) and j < len(right):
+        if left[i] <= right[j]:
+            merged.append(left[i])
+            i += 1
+        else:
+            # Every remaining left value is greater than right[j]
+            merged.append(right[j])
+            inversions += len(left) - i
+            j += 1
+    merged.extend(left[i:])
+    merged.extend(right[j:])
+    return merged, inversions
+
+
+def _parity(state: Sequence[int], width: int) -> int:
+    parity = count_inversions([tile for tile in state if tile != 0]) % 2
+    if width % 2 == 0:
+        # On even widths a vertical move also flips the inversion parity,
+        # so the blank's row is part of the invariant
+        parity = (parity + list(state).index(0) // width) % 2
+    return parity
+
+
+@lru_cache(maxsize=None)
+def _goal_parity(width: int) -> int:
+    return _parity(goal_state(width), width)
+
+
+def is_solvable(state: Sequence[int], width: Optional[int] = None,
+                goal: Optional[Sequence[int]] = None) -> bool:
+    """Whether goal (default: blank last) is reachable from state, by permutation parity."""
+    width = width or board_width(state)
+    goal_parity = _goal_parity(width) if goal is None else _parity(goal, width)
+    return _parity(state, width) == goal_parity
+
+
+def encode(state: Sequence[int]) -> int:
+    """Pack a state tuple into an integer, 4 bits per tile."""
+    code = 0
+    for tile in state:
+        code = (code << 4) | tile
+    return code
+
+
+# Hex digit characters to nibble values, for decode
+_HEX_DIGITS = bytes.maketrans(b"0123456789abcdef", bytes(range(16)))
+
+
+def decode(code: int, cells: int = CELLS) -> Tuple[int, ...]:
+    """Unpack an integer back into a state tuple."""
+    # Each hex digit is one tile; formatting and translating runs in C, a few
+    # times faster than shifting out each nibble in Python
+    return tuple(("%0*x" % (cells, code)).encode().translate(_HEX_DIGITS))
+
+
+# Tables for the classic 3x3 board
+NEIGHBORS = neighbor_table(SIZE)
+TILE_COSTS = tile_cost_tables(SIZE)
+HEURISTIC_DELTAS = heuristic_deltas(SIZE)
+
+
+def packed_heuristic(code: int, heuristic: str = 'manhattan', width: int = SIZE) -> int:
+    """Evaluate a heuristic from scratch on a packed board."""
+    cost = tile_cost_tables(width)[heuristic]
+    cells = width * width
+    return sum(cost[(code >> (4 * (cells - 1 - idx))) & 0xF][idx] for idx in range(cells))
+
+
+@lru_cache(maxsize=None)
+def packed_moves(width: int, heuristic: Optional[str] = None) -> Tuple[Tuple[Tuple[int, int, int, List[int]], ...], ...]:
+    """For each blank cell, its moves as (new blank, new blank's shift, blank's shift, delta by tile).
+
+    delta by tile is the heuristic change when that tile slides into the old
+    blank cell (all zeros without a heuristic), so the search loop does one
+    lookup per child instead of walking the nested delta table.
+    """
+    cells = width * width
+    shifts = [4 * (cells - 1 - idx) for idx in range(cells)]
+    delta = heuristic_deltas(width)[heuristic] if heuristic else None
+    return tuple(
+        tuple((new_blank, shifts[new_blank], shifts[blank],
+               [delta[tile][new_blank][blank] for tile in range(cells)] if delta else [0] * cells)
+              for new_blank in neighbors)
+        for blank, neighbors in enumerate(neighbor_table(width)))
+
+
+@lru_cache(maxsize=None)
+def _goal_code(width: int) -> int:
+    return encode(goal_state(width))
+
+
+def _push_children(buckets: List[list], code: int, blank: int, g: int, h: int, moves, parents: Dict[int, int],
+                   base: int, heuristic_func: Optional[Callable], cells: int) -> int:
+    """Queue each child of a packed board that is not yet expanded; returns the lowest bucket used."""
+    lowest = len(buckets)
+    new_g = g + 1
+    for new_blank, shift, blank_shift, delta in moves:
+        tile = (code >> shift) & 0xF
+        new_code = code - (tile << shift) + (tile << blank_shift)
+        if new_code in parents:
+            continue
+        if heuristic_func:
+            new_h = heuristic_func(decode(new_code, cells))
+        else:
+            # Only the moved tile changes, so the heuristic is updated in place
+            new_h = h + delta[tile]
+        f = new_g + new_h
+        key = (f * (f + 1) >> 1) + new_h - base
+        if key >= len(buckets):
+            buckets += [[] for _ in range(key + 1 - len(buckets))]
+        buckets[key].append((new_code, new_blank, new_g, new_h, code))
+        if key < lowest:
+            lowest = key
+    return lowest
+
+
+def a_star_packed(initial_state: Sequence[int], heuristic: Union[str, Callable] = 'manhattan'):
+    """A* over packed boards; returns (path, nodes_explored, depth) like the tuple version.
+
+    heuristic names a tile-cost table ('misplaced' or 'manhattan'), which is
+    updated per move, or is any admissible callable on state tuples, which is
+    evaluated on every child. Per-width move tables are built once and
+    cached, so short searches pay almost nothing beyond the search itself.
+    """
+    width = board_width(initial_state)
+    if width > 4:
+        raise ValueError("Packed boards hold at most 16 cells")
+    if not is_solvable(initial_state, width):
+        return None, 0, 0
+
+    cells = width * width
+    heuristic_func = heuristic if callable(heuristic) else None
+    moves = packed_moves(width, None if heuristic_func else heuristic)
+    goal = _goal_code(width)
+    start = encode(initial_state)
+    if heuristic_func:
+        start_h = heuristic_func(tuple(initial_state))
+    else:
+        cost = tile_cost_tables(width)[heuristic]
+        start_h = sum([cost[tile][idx] for idx, tile in enumerate(initial_state)])
+
+    # Bucket queue keyed by (f, h): the same primary order as the tuple version's
+    # heap, but pushes and pops are plain list operations. Since h <= f, level f
+    # needs only f + 1 buckets, so (f, h) maps to bucket f * (f + 1) / 2 + h.
+    # Entries are (code, blank, g, h, parent_code) and parents doubles as the
+    # closed set. The table heuristics are consistent, so f never drops below
+    # the start's and keys can be stored relative to its level; callables may not be
+    base = 0 if heuristic_func else start_h * (start_h + 1) >> 1
+    cursor = (start_h * (start_h + 1) >> 1) + start_h - base
+    buckets: List[list] = [[] for _ in range(cursor + 1)]
+    buckets[cursor].append((start, list(initial_state).index(0), 0, start_h, NO_PARENT))
+    parents: Dict[int, int] = {}
+    nodes_explored = 0
+
+    while cursor < len(buckets):
+        bucket = buckets[cursor]
+        if not bucket:
+            cursor += 1
+            continue
+        code, blank, current_g, current_h, parent = bucket.pop()
+        nodes_explored += 1
+
+        if code == goal:
+            parents[code] = parent
+            return _reconstruct(parents, code, cells), nodes_explored, current_g
+
+        if code in parents:
+            continue
+        parents[code] = parent
+        lowest = _push_children(buckets, code, blank, current_g, current_h, moves[blank], parents,
+                                base, heuristic_func, cells)
+        if lowest < cursor:
+            cursor = lowest
+
+    return None, nodes_explored, 0
+
+
+def _reconstruct(parents: Dict[int, int], code: int, cells: int) -> List[Tuple[int, ...]]:
+    path = []
+    while code != NO_PARENT:
+        path.append(decode(code, cells))
+        code = parents[code]
+    path.reverse()
+    return path
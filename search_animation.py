@@ -0,0 +1,106 @@
+import time
+from typing import Callable, Dict, Optional
+
+# Plays a search written as a generator of (kind, payload) events, such as
+# maze_engine's ("frontier", cell), ("expand", cell) and ("path", cells),
+# on a Tk event loop. Searches never sleep or call update() themselves:
+# each frame the driver consumes as many events as the speed setting and
+# a time budget allow, then the visualizer redraws once.
+
+INSTANT = 0.0  # A rate that skips the animation and shows only the final state
+
+# Expanded nodes per second for the speed menus; None means as fast as frames allow
+SPEEDS: Dict[str, Optional[float]] = {
+    "Slow": 1.0,
+    "Normal": 2.0,
+    "Fast": 10.0,
+    "Max": None,
+    "Instant": INSTANT,
+}
+
+
+class SearchAnimation:
+    """Drives an event generator from widget.after() callbacks, one frame at a time.
+
+    on_event(kind, payload) is called for every event and should only
+    update state or canvas items; on_frame() runs once after each batch of
+    events, for redraws and counters; on_done(result) gets the generator's
+    return value. rate limits how many step_kind events are played per
+    second. Whatever the rate, a frame stops taking events after budget_ms
+    so the window stays responsive.
+    """
+    FRAME_MS = 16
+
+    def __init__(self, widget, events, on_event: Callable[[str, object], None], on_done: Callable[[object], None],
+                 on_frame: Optional[Callable[[], None]] = None, rate: Optional[float] = None,
+                 step_kind: str = "expand", budget_ms: float = 10.0):
+        self.widget = widget
+        self.events = events
+        self.on_event = on_event
+        self.on_done = on_done
+        self.on_frame = on_frame
+        self.rate = rate
+        self.step_kind = step_kind
+        self.budget = budget_ms / 1000
+        self.credit = 1.0  # Steps that may be played now; the first one shows at once
+        self.held = None  # A step pulled from the generator with no credit left to play it
+        self.last_tick = None
+        self.after_id = None
+        self.running = False
+
+    def start(self) -> 'SearchAnimation':
+        self.running = True
+        if self.rate == INSTANT:
+            self._finish_now()
+        else:
+            self._tick()
+        return self
+
+    def cancel(self):
+        """Stop playing; on_done is not called."""
+        if self.after_id is not None:
+            self.widget.after_cancel(self.after_id)
+            self.after_id = None
+        self.running = False
+        self.events.close()
+
+    def _finish_now(self):
+        # Still pass every event on, so the final picture matches an animated run
+        try:
+            while True:
+                self.on_event(*next(self.events))
+        except StopIteration as stop:
+            self._done(stop.value)
+
+    def _tick(self):
+        self.after_id = None
+        now = time.perf_counter()
+        if self.rate is not None and self.last_tick is not None:
+            # Cap the credit so a stalled window does not burst through a backlog
+            self.credit = min(self.credit + (now - self.last_tick) * self.rate, max(1.0, self.rate * 0.1))
+        self.last_tick = now
+        deadline = now + self.budget
+
+        try:
+            while time.perf_counter() < deadline:
+                event = self.held or next(self.events)
+                self.held = None
+                if event[0] == self.step_kind and self.rate is not None:
+                    if self.credit < 1:
+                        self.held = event
+                        break
+                    self.credit -= 1
+                self.on_event(*event)
+        except StopIteration as stop:
+            self._done(stop.value)
+            return
+
+        if self.on_frame:
+            self.on_frame()
+        self.after_id = self.widget.after(self.FRAME_MS, self._tick)
+
+    def _done(self, result):
+        self.running = False
+        if self.on_frame:
+            self.on_frame()
+        self.on_done(result)
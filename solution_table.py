@@ -0,0 +1,153 @@
+import argparse
+import math
+import os
+from collections import deque
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from pattern_database import DEFAULT_CACHE_DIR
+from puzzle_engine import board_width, goal_state
+
+# One byte per permutation rank: (distance << 2) | best blank move, or UNREACHABLE.
+# 3x3 distances top out at 31, so the entry always fits below 0xFF.
+UNREACHABLE = 0xFF
+MOVE_NAMES = ("Up", "Down", "Left", "Right")
+OPPOSITE = (1, 0, 3, 2)
+
+
+def lehmer_rank(state: Sequence[int]) -> int:
+    """Rank of a permutation in lexicographic order, via its Lehmer code."""
+    n = len(state)
+    rank = 0
+    for i in range(n):
+        smaller_after = 0
+        for j in range(i + 1, n):
+            if state[j] < state[i]:
+                smaller_after += 1
+        rank = rank * (n - i) + smaller_after
+    return rank
+
+
+def _blank_offsets(width: int) -> Tuple[int, int, int, int]:
+    return (-width, width, -1, 1)
+
+
+def _moves_from(blank: int, width: int) -> List[Tuple[int, int]]:
+    """(direction, new blank cell) for every legal blank move."""
+    row, col = divmod(blank, width)
+    moves = []
+    if row > 0:
+        moves.append((0, blank - width))
+    if row < width - 1:
+        moves.append((1, blank + width))
+    if col > 0:
+        moves.append((2, blank - 1))
+    if col < width - 1:
+        moves.append((3, blank + 1))
+    return moves
+
+
+def build_solution_table(width: int = 3) -> np.ndarray:
+    """Reverse BFS from the goal over every reachable board."""
+    goal = goal_state(width)
+    table = np.full(math.factorial(width * width), UNREACHABLE, dtype=np.uint8)
+    table[lehmer_rank(goal)] = 0
+    queue = deque([(goal, len(goal) - 1, 0)])
+
+    while queue:
+        state, blank, dist = queue.popleft()
+        for direction, cell in _moves_from(blank, width):
+            tiles = list(state)
+            tiles[blank], tiles[cell] = tiles[cell], 0
+            child = tuple(tiles)
+            rank = lehmer_rank(child)
+            if table[rank] != UNREACHABLE:
+                continue
+            # From the child, moving the blank back the opposite way leads toward the goal
+            table[rank] = ((dist + 1) << 2) | OPPOSITE[direction]
+            queue.append((child, cell, dist + 1))
+    return table
+
+
+class SolutionTable:
+    """Optimal distance and next move for every board, memory-mapped from disk."""
+
+    def __init__(self, table: np.ndarray, width: int = 3):
+        self.table = table
+        self.width = width
+        self._lookup = memoryview(table)
+
+    @staticmethod
+    def path_for(width: int, cache_dir: str) -> str:
+        return os.path.join(cache_dir, "solutions_{0}x{0}.npy".format(width))
+
+    @classmethod
+    def load_or_build(cls, width: int = 3, cache_dir: str = DEFAULT_CACHE_DIR) -> 'SolutionTable':
+        if width > 3:
+            raise ValueError("A full solution table is only practical for 3x3 boards")
+        path = cls.path_for(width, cache_dir)
+        if not os.path.exists(path):
+            os.makedirs(cache_dir, exist_ok=True)
+            tmp_path = path + ".tmp.npy"
+            np.save(tmp_path, build_solution_table(width))
+            os.replace(tmp_path, path)
+        return cls(np.load(path, mmap_mode="r"), width)
+
+    def _entry(self, state: Sequence[int]) -> int:
+        if board_width(state) != self.width:
+            raise ValueError(f"Expected a {self.width}x{self.width} board")
+        if sorted(state) != list(range(len(state))):
+            raise ValueError("Board must contain each tile 0..n-1 exactly once")
+        return self._lookup[lehmer_rank(state)]
+
+    def distance(self, state: Sequence[int]) -> Optional[int]:
+        """Optimal number of moves to the goal, or None if the goal is unreachable."""
+        entry = self._entry(state)
+        return None if entry == UNREACHABLE else entry >> 2
+
+    def solve(self, state: Sequence[int]) -> Optional[List[Tuple[int, ...]]]:
+        """Optimal path from state to the goal, read out move by move without searching."""
+        entry = self._entry(state)
+        if entry == UNREACHABLE:
+            return None
+        offsets = _blank_offsets(self.width)
+        tiles = list(state)
+        blank = tiles.index(0)
+        path = [tuple(tiles)]
+        while entry >> 2:
+            cell = blank + offsets[entry & 3]
+            tiles[blank], tiles[cell] = tiles[cell], 0
+            blank = cell
+            path.append(tuple(tiles))
+            entry = self._lookup[lehmer_rank(tiles)]
+        return path
+
+    def moves(self, state: Sequence[int]) -> Optional[List[str]]:
+        """Optimal blank moves as names (Up, Down, Left, Right)."""
+        path = self.solve(state)
+        if path is None:
+            return None
+        return [MOVE_NAMES[self._lookup[lehmer_rank(step)] & 3] for step in path[:-1]]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build or query the 8-puzzle optimal solution table.")
+    parser.add_argument("board", nargs="*", type=int, help="Board to solve, e.g. 8 1 3 4 0 2 7 6 5")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR)
+    args = parser.parse_args()
+
+    table = SolutionTable.load_or_build(cache_dir=args.cache_dir)
+    if not args.board:
+        reachable = int(np.count_nonzero(table.table != UNREACHABLE))
+        print(f"{reachable} reachable boards in {SolutionTable.path_for(3, args.cache_dir)}")
+        return
+    moves = table.moves(args.board)
+    if moves is None:
+        print("No solution: board cannot reach the goal")
+    else:
+        print(f"Optimal depth {len(moves)}: {' '.join(moves)}")
+
+
+if __name__ == "__main__":
+    main()
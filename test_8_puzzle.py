@@ -0,0 +1,76 @@
+import importlib.util
+import os
+import random
+import threading
+from queue import Queue
+
+# "8 puzzle.py" has a space in its name, so it cannot be imported by name
+_spec = importlib.util.spec_from_file_location(
+    "eight_puzzle", os.path.join(os.path.dirname(os.path.abspath(__file__)), "8 puzzle.py"))
+eight_puzzle = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(eight_puzzle)
+
+GOAL = [[1, 2, 3], [4, 5, 6], [7, 8, 0]]
+
+
+def solve(board):
+    return eight_puzzle.PuzzleSolver(eight_puzzle.PuzzleState(board), GOAL).solve()
+
+
+def test_states_are_keyed_by_their_tiles():
+    state = eight_puzzle.PuzzleState([[1, 2, 3], [4, 0, 6], [7, 5, 8]])
+    assert state == eight_puzzle.PuzzleState([[1, 2, 3], [4, 0, 6], [7, 5, 8]])
+    assert len({state, eight_puzzle.PuzzleState(state.board)}) == 1
+    assert state.get_blank_pos() == (1, 1)
+    moved = state.get_next_state((2, 1))
+    assert moved.key == (1, 2, 3, 4, 5, 6, 7, 0, 8) and moved.get_blank_pos() == (2, 1)
+
+
+def test_known_board_is_solved_optimally():
+    path = solve([[8, 1, 3], [4, 0, 2], [7, 6, 5]])
+    assert len(path) == 14
+    assert path[-1].board == GOAL
+    assert solve([[1, 2, 3], [4, 5, 6], [7, 0, 8]])[-1].board == GOAL
+
+
+def test_each_step_moves_one_tile():
+    start = eight_puzzle.PuzzleState([[4, 1, 3], [7, 2, 6], [0, 5, 8]])
+    path = [start] + eight_puzzle.PuzzleSolver(start, GOAL).solve()
+    assert len(path) == 7
+    for before, after in zip(path, path[1:]):
+        assert after.key[before.blank] != 0 and after.blank in [
+            row * 3 + col for row, col in before.get_possible_moves()]
+
+
+def test_unsolvable_boards_return_none():
+    assert solve([[1, 2, 3], [4, 5, 6], [8, 7, 0]]) is None
+    rng = random.Random(0)
+    for _ in range(5):
+        tiles = rng.sample(range(9), 9)
+        board = [tiles[i:i + 3] for i in range(0, 9, 3)]
+        path = solve(board)
+        assert path is None or path[-1].board == GOAL
+
+
+def test_progress_and_cancel():
+    solver = eight_puzzle.PuzzleSolver(eight_puzzle.PuzzleState([[8, 6, 7], [2, 5, 4], [3, 0, 1]]), GOAL)
+    reports = []
+    cancel = threading.Event()
+
+    def progress(expanded, frontier):
+        reports.append(expanded)
+        cancel.set()
+
+    assert solver.solve(cancel, progress, progress_every=50) is None
+    assert reports == [50]
+
+
+def test_background_solve_posts_progress_then_result():
+    solver = eight_puzzle.PuzzleSolver(eight_puzzle.PuzzleState([[8, 1, 3], [4, 0, 2], [7, 6, 5]]), GOAL)
+    messages = Queue()
+    eight_puzzle.PuzzleGUI.solve_in_background(solver, threading.Event(), messages)
+    posted = []
+    while not messages.empty():
+        posted.append(messages.get())
+    assert posted[-1][0] == "done" and len(posted[-1][1]) == 14
+    assert all(message[0] == "progress" for message in posted[:-1])
@@ -0,0 +1,67 @@
+import io
+import json
+import sys
+
+import pytest
+
+from batch_solver import main, read_boards, solve_batch
+
+
+def _by_line(results):
+    return sorted(results, key=lambda result: result["line"])
+
+
+def test_read_boards_skips_blank_and_comment_lines():
+    lines = ["# header", "", "[1, 2, 3, 4, 5, 6, 7, 0, 8]", "  8 1 3 4 0 2 7 6 5  "]
+    assert list(read_boards(lines)) == [(3, (1, 2, 3, 4, 5, 6, 7, 0, 8)), (4, (8, 1, 3, 4, 0, 2, 7, 6, 5))]
+
+
+def test_pdb_batch_solves_in_shared_memory(tmp_path):
+    lines = ["1 2 3 4 5 6 7 0 8", "8 1 3 4 0 2 7 6 5", "1 2 3 4 5 6 8 7 0", "1 1 2 3 4 5 6 7 0"]
+    results = _by_line(solve_batch(read_boards(lines), "pdb", workers=2, chunk_size=1,
+                                   include_path=True, cache_dir=str(tmp_path)))
+
+    assert [result["line"] for result in results] == [1, 2, 3, 4]
+    assert results[0]["depth"] == 1 and results[0]["path"][-1] == [1, 2, 3, 4, 5, 6, 7, 8, 0]
+    assert results[1]["depth"] == 14
+    assert results[2]["solvable"] is False
+    assert "error" in results[3]
+
+
+def test_pdb_batch_reports_boards_of_another_width(tmp_path):
+    lines = ["1 2 3 4 5 6 7 0 8", "1 2 3 4 5 6 7 8 9 10 11 12 13 14 0 15"]
+    results = _by_line(solve_batch(read_boards(lines), "pdb", workers=1, cache_dir=str(tmp_path)))
+    assert results[0]["depth"] == 1
+    assert "3x3" in results[1]["error"]
+
+
+def test_manhattan_batch_solves_mixed_widths():
+    lines = ["1 2 3 4 5 6 7 0 8", "1 2 3 4 5 6 7 8 9 10 11 12 13 14 0 15"]
+    results = _by_line(solve_batch(read_boards(lines), "manhattan", workers=1))
+    assert [result["depth"] for result in results] == [1, 1]
+
+
+def _run_main(monkeypatch, capsys, text, *args):
+    monkeypatch.setattr(sys, "argv", ["batch_solver.py", "-", "--workers", "1", *args])
+    monkeypatch.setattr(sys, "stdin", io.StringIO(text))
+    main()
+    return _by_line(json.loads(line) for line in capsys.readouterr().out.splitlines())
+
+
+def test_cli_reports_a_non_square_first_board(monkeypatch, capsys):
+    results = _run_main(monkeypatch, capsys, "1 2 3\n0 1 2 3 4 5 6 7\n1 2 3 4 5 6 7 0 8\n")
+    assert "error" in results[0] and "square" in results[1]["error"]
+    assert results[2]["depth"] == 1
+
+
+@pytest.mark.parametrize("first", ["1 2 3 0", "1 2 3 4 5 6 7 8 9 10 11 12 13 14 15 16 17 18 19 20 21 22 23 24 0"])
+def test_cli_pdb_takes_the_width_from_the_first_supported_board(monkeypatch, capsys, tmp_path, first):
+    text = f"{first}\n1 2 3 4 5 6 7 0 8\n"
+    results = _run_main(monkeypatch, capsys, text, "--heuristic", "pdb", "--cache-dir", str(tmp_path))
+    assert "3x3" in results[0]["error"]
+    assert results[1]["depth"] == 1
+
+
+def test_pdb_batch_of_empty_input_builds_nothing(tmp_path):
+    assert list(solve_batch(iter([]), "pdb", workers=1, cache_dir=str(tmp_path))) == []
+    assert not any(tmp_path.iterdir())
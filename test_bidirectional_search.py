@@ -0,0 +1,35 @@
+import random
+
+import pytest
+
+from bidirectional_search import mm_search, target_heuristic
+from puzzle_engine import GOAL_STATE
+from test_puzzle_engine import assert_valid_path, puzzle_complete, random_walk
+
+
+@pytest.mark.parametrize("heuristic", [puzzle_complete.h1, puzzle_complete.h2])
+def test_mm_search_matches_a_star(heuristic):
+    rng = random.Random(8)
+    for _ in range(25):
+        board = random_walk(rng.randrange(50), rng)
+        _, _, expected = puzzle_complete.a_star(board, heuristic)
+        path, _, depth = puzzle_complete.a_star(board, heuristic, engine="bidirectional")
+        assert depth == expected
+        assert_valid_path(path, board, depth)
+
+
+def test_mm_search_between_arbitrary_boards():
+    rng = random.Random(9)
+    start, goal = random_walk(20, rng), random_walk(20, rng)
+    path, _, depth = mm_search(start, "manhattan", goal)
+    assert path[0] == start and path[-1] == goal and len(path) == depth + 1
+    assert mm_search(GOAL_STATE) == ([GOAL_STATE], 0, 0)
+    assert mm_search((1, 2, 3, 4, 5, 6, 8, 7, 0)) == (None, 0, 0)
+
+
+def test_target_heuristic():
+    target = (0, 1, 2, 3, 4, 5, 6, 7, 8)
+    assert target_heuristic("manhattan", target)(target) == 0
+    assert target_heuristic("misplaced", target)(GOAL_STATE) == 8
+    with pytest.raises(ValueError):
+        target_heuristic("euclidean", target)
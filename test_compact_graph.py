@@ -0,0 +1,86 @@
+import random
+
+import pytest
+
+from compact_graph import CompactGraph
+from graph_search import breadth_first_search, dijkstra
+from test_landmarks import random_graph
+from UniformCSlab4 import Graph
+
+
+@pytest.fixture(scope="module")
+def graph():
+    return random_graph(300, 2000, seed=4)
+
+
+def test_compact_graph_matches_graph(graph):
+    compact = CompactGraph.from_graph(graph)
+    assert list(compact.nodes) == list(graph.nodes)
+    for node_id in graph.nodes:
+        assert compact.nodes[node_id].get_position() == graph.nodes[node_id].get_position()
+        # from_graph sees each edge from both ends, so only the neighbor order may differ
+        assert dict(compact.neighbors(node_id)) == dict(graph.neighbors(node_id))
+
+    rng = random.Random(0)
+    ids = list(graph.nodes)
+    for _ in range(20):
+        start, goal = rng.choice(ids), rng.choice(ids)
+        # Equal-cost paths may tie differently with the neighbor order, so compare costs
+        assert dijkstra(compact, start, goal).cost == pytest.approx(dijkstra(graph, start, goal).cost)
+        assert breadth_first_search(compact, start, goal).cost == breadth_first_search(graph, start, goal).cost
+
+
+def test_repeated_edges_keep_first_position_and_last_weight():
+    graph, compact = Graph(), CompactGraph()
+    for g in (graph, compact):
+        for node_id, x in (("a", 0), ("b", 1), ("c", 2)):
+            g.add_node(node_id, x, 0)
+        for a, b, weight in (("a", "b", 1.0), ("b", "c", 2.0), ("b", "a", 3.0), ("a", "z", 5.0)):
+            g.add_edge(a, b, weight)
+    for node_id in "abc":
+        assert list(compact.neighbors(node_id)) == list(graph.neighbors(node_id))
+    assert compact.num_edges == 2
+
+
+def test_self_loops_are_dropped():
+    compact = CompactGraph()
+    compact.add_node("a", 0, 0)
+    compact.add_edge("a", "a", 1.0)
+    assert list(compact.neighbors("a")) == []
+
+
+def test_frozen_graph_is_read_only():
+    compact = CompactGraph()
+    compact.add_node("a", 0, 0)
+    compact.freeze()
+    with pytest.raises(RuntimeError):
+        compact.add_node("b", 1, 1)
+    with pytest.raises(RuntimeError):
+        compact.add_edge("a", "a", 1.0)
+
+
+def test_nodes_are_readable_while_building():
+    compact = CompactGraph()
+    compact.add_node("a", 1, 2)
+    assert compact.nodes["a"].get_position() == (1.0, 2.0)
+    compact.add_node("b", 3, 4)
+    compact.add_node("a", 5, 6)  # Re-adding a node moves it, as in Graph
+    compact.add_edge("a", "b", 2.0)
+    assert not compact.frozen and compact.num_edges == 1
+    positions = {node_id: node.get_position() for node_id, node in compact.nodes.items()}
+    assert positions == {"a": (5.0, 6.0), "b": (3.0, 4.0)}
+    with pytest.raises(KeyError):
+        compact.nodes["c"]
+
+    compact.freeze()
+    assert compact.nodes["a"].get_position() == (5.0, 6.0)
+    assert list(compact.neighbors("a")) == [("b", 2.0)]
+
+
+def test_edges_to_unknown_nodes_are_ignored_while_building():
+    compact = CompactGraph()
+    compact.add_node("a", 0, 0)
+    version = compact.version
+    compact.add_edge("a", "z", 1.0)
+    assert compact.num_edges == 0 and compact.version == version
+    assert list(compact.neighbors("a")) == [] and compact.frozen
@@ -0,0 +1,103 @@
+import random
+from collections import deque
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from graph_csr import CSRGraph, bfs_csr, bidirectional_bfs_csr, bidirectional_bfs_masks, dfs_csr
+
+
+def reference_hops(neighbors, start):
+    """Plain BFS edge counts from start."""
+    hops = {start: 0}
+    queue = deque([start])
+    while queue:
+        node = queue.popleft()
+        for neighbor in neighbors(node):
+            if neighbor not in hops:
+                hops[neighbor] = hops[node] + 1
+                queue.append(neighbor)
+    return hops
+
+
+def recursive_dfs(graph, start, end, path=None, visited=None):
+    """The original Lab2 dfs, as the reference for visit order."""
+    if path is None:
+        path = [start]
+    if visited is None:
+        visited = set()
+    if start == end:
+        return path
+    visited.add(start)
+    for neighbor in graph.neighbors(start):
+        if neighbor not in visited:
+            result = recursive_dfs(graph, neighbor, end, path + [neighbor], visited)
+            if result:
+                return result
+    return None
+
+
+@pytest.fixture(scope="module")
+def csr_graph():
+    rng = np.random.default_rng(0)
+    n = 3000
+    # Sparse enough to leave several components, with repeated edges and self-loops
+    return CSRGraph.from_arrays(rng.integers(0, n, 2400), rng.integers(0, n, 2400), [f"n{i}" for i in range(n)])
+
+
+def assert_walk(graph, path, start, end):
+    assert path[0] == start and path[-1] == end
+    for a, b in zip(path, path[1:]):
+        assert graph.index_of[b] in graph.neighbors(graph.index_of[a])
+
+
+def test_from_arrays_stores_each_edge_both_ways():
+    graph = CSRGraph.from_arrays([0, 1, 1, 2, 2], [1, 0, 2, 2, 0], "abc")
+    # (a, b), (b, c) and (c, a); the repeated edge and the self-loop are dropped
+    assert graph.num_edges == 3
+    assert graph.neighbors(0).tolist() == [1, 2]
+    assert graph.neighbors(1).tolist() == [0, 2]
+    assert graph.neighbors(2).tolist() == [1, 0]
+
+
+def test_from_edge_list_and_networkx_agree():
+    edges = [("A", "B"), ("A", "C"), ("B", "D"), ("C", "E"), ("D", "E"), ("D", "F"), ("E", "F"), ("F", "G")]
+    from_edges = CSRGraph.from_edge_list(edges, nodes=["Z"])
+    assert from_edges.labels[0] == "Z" and len(from_edges.neighbors(0)) == 0
+    graph = nx.Graph(edges)
+    from_nx = CSRGraph.from_networkx(graph)
+    for label in graph:
+        expected = sorted(graph.neighbors(label))
+        assert sorted(from_nx.to_labels(from_nx.neighbors(from_nx.index_of[label]).tolist())) == expected
+        assert sorted(from_edges.to_labels(from_edges.neighbors(from_edges.index_of[label]).tolist())) == expected
+
+
+def test_searches_match_reference_bfs(csr_graph):
+    rng = random.Random(0)
+    labels = csr_graph.labels
+    for _ in range(60):
+        start, end = rng.choice(labels), rng.choice(labels)
+        hops = reference_hops(lambda node: csr_graph.neighbors(node).tolist(), csr_graph.index_of[start])
+        expected = hops.get(csr_graph.index_of[end])
+        for search in (bfs_csr, bidirectional_bfs_csr, bidirectional_bfs_masks):
+            path = search(csr_graph, start, end)
+            if expected is None:
+                assert path is None
+            else:
+                assert len(path) - 1 == expected
+                assert_walk(csr_graph, path, start, end)
+        path = dfs_csr(csr_graph, start, end)
+        assert (path is None) == (expected is None)
+        if path is not None:
+            assert_walk(csr_graph, path, start, end)
+
+
+def test_dfs_keeps_the_recursive_visit_order():
+    rng = random.Random(1)
+    for seed in range(10):
+        graph = nx.gnm_random_graph(40, 60, seed=seed)
+        csr = CSRGraph.from_networkx(graph)
+        for _ in range(10):
+            start, end = rng.randrange(40), rng.randrange(40)
+            assert dfs_csr(csr, start, end) == recursive_dfs(graph, start, end)
@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+from compact_graph import CompactGraph
+from graph_generators import knn_edges, radius_edges, random_geometric_graph
+from UniformCSlab4 import Graph
+
+
+def _pairs(src, dst):
+    return {(min(a, b), max(a, b)) for a, b in zip(src.tolist(), dst.tolist())}
+
+
+def _brute_distances(xs, ys):
+    return np.hypot(xs[:, None] - xs[None, :], ys[:, None] - ys[None, :])
+
+
+@pytest.fixture
+def points():
+    rng = np.random.default_rng(5)
+    # Clustered and spread-out points, so some cells are crowded and some empty
+    xs = np.concatenate([rng.uniform(0, 1000, 300), rng.normal(200, 10, 100)])
+    ys = np.concatenate([rng.uniform(0, 500, 300), rng.normal(300, 10, 100)])
+    return xs, ys
+
+
+@pytest.mark.parametrize("radius", [15.0, 60.0, 2000.0])
+def test_radius_edges_match_brute_force(points, radius):
+    xs, ys = points
+    src, dst = radius_edges(xs, ys, radius)
+    assert len(src) == len(_pairs(src, dst))
+    within = np.argwhere(np.triu(_brute_distances(xs, ys) <= radius, k=1))
+    assert _pairs(src, dst) == {(int(i), int(j)) for i, j in within}
+
+
+@pytest.mark.parametrize("k", [1, 4, 10])
+def test_knn_edges_match_brute_force(points, k):
+    xs, ys = points
+    src, dst = knn_edges(xs, ys, k)
+    distances = _brute_distances(xs, ys)
+    np.fill_diagonal(distances, np.inf)
+    kth = np.sort(distances, axis=1)[:, k - 1]
+    assert np.bincount(src, minlength=len(xs)).tolist() == [k] * len(xs)
+    assert np.all(src != dst)
+    # k picks per point, none farther than its k-th nearest: the k nearest up to ties
+    assert np.all(distances[src, dst] <= kth[src] + 1e-9)
+
+
+def test_random_geometric_graph_is_deterministic_per_seed():
+    a = random_geometric_graph(500, k=5, seed=1)
+    b = random_geometric_graph(500, k=5, seed=1)
+    assert np.array_equal(a.indices, b.indices) and np.array_equal(a.weights, b.weights)
+    assert not np.array_equal(a.xs, random_geometric_graph(500, k=5, seed=2).xs)
+
+
+def test_graph_factories_agree():
+    compact = random_geometric_graph(300, radius=80.0, seed=7)
+    graph = random_geometric_graph(300, radius=80.0, seed=7, graph_factory=Graph)
+    assert isinstance(compact, CompactGraph)
+    for node_id in graph.nodes:
+        assert dict(compact.neighbors(node_id)) == dict(graph.neighbors(node_id))
+
+
+@pytest.mark.parametrize("radius", [0.0, -5.0, float("nan")])
+def test_radius_must_be_positive(points, radius):
+    with pytest.raises(ValueError):
+        radius_edges(*points, radius)
+    with pytest.raises(ValueError):
+        random_geometric_graph(10, radius=radius, seed=0)
+
+
+def test_exactly_one_of_radius_or_k():
+    with pytest.raises(ValueError):
+        random_geometric_graph(10, seed=0)
+    with pytest.raises(ValueError):
+        random_geometric_graph(10, radius=1.0, k=2, seed=0)
@@ -0,0 +1,86 @@
+import io
+
+import numpy as np
+import pytest
+
+from graph_generators import random_geometric_graph
+from graph_io import ALIGNMENT, npz_memmaps, load_graph, read_dimacs, read_edge_list, save_graph
+from UniformCSlab4 import Graph
+
+
+def _assert_same_graph(a, b):
+    assert list(a.ids) == list(b.ids)
+    for name in ("xs", "ys", "indptr", "indices", "weights"):
+        assert np.array_equal(getattr(a, name), getattr(b, name))
+    for node_id in list(a.ids)[:50]:
+        assert list(a.neighbors(node_id)) == list(b.neighbors(node_id))
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_save_load_round_trip(tmp_path, mmap):
+    graph = random_geometric_graph(3000, k=4, seed=0)
+    path = str(tmp_path / "graph.npz")
+    save_graph(graph, path)
+    loaded = load_graph(path, mmap=mmap)
+    _assert_same_graph(graph, loaded)
+    # The standard reader sees an ordinary .npz
+    with np.load(path) as archive:
+        assert np.array_equal(archive["weights"], graph.weights)
+
+
+def test_round_trip_keeps_arbitrary_ids(tmp_path):
+    graph = Graph()
+    for node_id, x, y in (("depot", 0, 0), ("b", 3, 4), ("07", 6, 8)):
+        graph.add_node(node_id, x, y)
+    graph.add_edge("depot", "b", 5.0)
+    graph.add_edge("b", "07", 5.0)
+    path = str(tmp_path / "graph.npz")
+    save_graph(graph, path)
+    loaded = load_graph(path)
+    assert list(loaded.ids) == ["depot", "b", "07"]
+    assert list(loaded.neighbors("b")) == [("depot", 5.0), ("07", 5.0)]
+    assert loaded.nodes["07"].get_position() == (6.0, 8.0)
+
+
+def test_large_members_are_aligned_memmaps(tmp_path):
+    path = str(tmp_path / "graph.npz")
+    save_graph(random_geometric_graph(5000, k=6, seed=1), path)
+    arrays = npz_memmaps(path)
+    for name in ("xs", "ys", "indptr", "indices", "weights"):
+        assert isinstance(arrays[name], np.memmap)
+        assert arrays[name].offset % ALIGNMENT == 0
+
+
+def test_read_edge_list():
+    text = io.StringIO("# comment\n% also a comment\n\na b 2.5\nb c\nc a 1\n")
+    graph = read_edge_list(text, default_weight=7.0)
+    assert list(graph.ids) == ["a", "b", "c"]
+    assert dict(graph.neighbors("b")) == {"a": 2.5, "c": 7.0}
+    with pytest.raises(ValueError):
+        read_edge_list(io.StringIO("a\n"))
+
+
+def test_read_dimacs_with_coordinates():
+    gr = io.StringIO("c tiny road network\np sp 3 4\na 1 2 10\na 2 1 10\na 2 3 4\na 3 2 6\n")
+    co = io.StringIO("c coordinates\nv 1 0 0\nv 2 10 0\nv 3 10 5\n")
+    graph = read_dimacs(gr, co)
+    assert list(graph.ids) == ["1", "2", "3"]
+    # Opposite arcs merge into one edge and the later weight wins
+    assert graph.num_edges == 2
+    assert dict(graph.neighbors("2")) == {"1": 10.0, "3": 6.0}
+    assert graph.nodes["3"].get_position() == (10.0, 5.0)
+
+
+def test_read_dimacs_skips_crlf_blank_lines():
+    gr = io.StringIO("c road network\r\n\r\np sp 2 1\r\n  \r\na 1 2 3.5\r\n", newline="")
+    co = io.StringIO("v 1 0 0\r\n\r\nv 2 3 4\r\n", newline="")
+    graph = read_dimacs(gr, co)
+    assert dict(graph.neighbors("1")) == {"2": 3.5}
+    assert graph.nodes["2"].get_position() == (3.0, 4.0)
+
+
+def test_read_dimacs_rejects_bad_input():
+    with pytest.raises(ValueError):
+        read_dimacs(io.StringIO("a 1 2 3\n"))
+    with pytest.raises(ValueError):
+        read_dimacs(io.StringIO("p sp 2 1\nx 1 2\n"))
@@ -0,0 +1,58 @@
+import random
+from collections import deque
+
+import pytest
+
+from graph_search import INF, breadth_first_search, dijkstra
+from test_landmarks import random_graph, reference_costs
+
+
+def reference_hops(neighbors, start):
+    """Plain BFS edge counts from start."""
+    hops = {start: 0}
+    queue = deque([start])
+    while queue:
+        node = queue.popleft()
+        for neighbor in neighbors(node):
+            if neighbor not in hops:
+                hops[neighbor] = hops[node] + 1
+                queue.append(neighbor)
+    return hops
+
+
+@pytest.fixture(scope="module")
+def graph():
+    return random_graph(400, 3000, seed=3)
+
+
+def test_searches_match_reference(graph):
+    rng = random.Random(1)
+    ids = list(graph.nodes)
+    for _ in range(30):
+        start, goal = rng.choice(ids), rng.choice(ids)
+        costs = reference_costs(graph.neighbors, start)
+        hops = reference_hops(lambda node: [n for n, _ in graph.neighbors(node)], start)
+        gx, gy = graph.nodes[goal].get_position()
+
+        def euclidean(node_id):
+            x, y = graph.nodes[node_id].get_position()
+            return ((x - gx) ** 2 + (y - gy) ** 2) ** 0.5 - 1e-6
+
+        for result in (dijkstra(graph, start, goal), dijkstra(graph, start, goal, euclidean)):
+            if goal not in costs:
+                assert result.path is None and result.cost == INF
+            else:
+                assert result.cost == pytest.approx(costs[goal])
+                walked = sum(dict(graph.neighbors(a))[b] for a, b in zip(result.path, result.path[1:]))
+                assert walked == pytest.approx(costs[goal])
+
+        result = breadth_first_search(graph, start, goal)
+        assert (result.path is None) == (goal not in hops)
+        if result.path is not None:
+            assert result.path[0] == start and result.path[-1] == goal
+            assert result.cost == len(result.path) - 1 == hops[goal]
+
+
+def test_start_is_goal(graph):
+    assert dijkstra(graph, "5", "5") == (["5"], 0.0, 1)
+    assert breadth_first_search(graph, "5", "5") == (["5"], 0, 1)
@@ -0,0 +1,26 @@
+import random
+
+from ida_star import ida_star, manhattan_linear_conflict
+from puzzle_engine import GOAL_STATE
+from test_puzzle_engine import assert_valid_path, puzzle_complete, random_walk
+
+
+def test_ida_star_finds_optimal_paths():
+    rng = random.Random(4)
+    for _ in range(30):
+        board = random_walk(rng.randrange(60), rng)
+        _, _, expected = puzzle_complete.a_star(board, puzzle_complete.h2)
+        path, _, depth = ida_star(board)
+        assert depth == expected
+        assert_valid_path(path, board, depth)
+
+
+def test_linear_conflict_bounds():
+    assert manhattan_linear_conflict(GOAL_STATE) == 0
+    # 2 and 1 swapped in their goal row: Manhattan 2 plus one conflict
+    assert manhattan_linear_conflict((2, 1, 3, 4, 5, 6, 7, 8, 0)) == 4
+    rng = random.Random(5)
+    for _ in range(30):
+        board = random_walk(rng.randrange(60), rng)
+        _, _, depth = puzzle_complete.a_star(board, puzzle_complete.h2)
+        assert puzzle_complete.h2(board) <= manhattan_linear_conflict(board) <= depth
@@ -0,0 +1,58 @@
+import random
+
+import networkx as nx
+import pytest
+
+import Lab2
+from test_graph_csr import recursive_dfs, reference_hops
+
+
+def _random_graphs():
+    # Sparse graphs leave some goals in other components
+    return [nx.gnm_random_graph(30, edges, seed=seed) for seed, edges in enumerate([20, 30, 45, 80] * 3)]
+
+
+def _assert_walk(graph, path, start, end):
+    assert path[0] == start and path[-1] == end
+    assert all(graph.has_edge(a, b) for a, b in zip(path, path[1:]))
+
+
+@pytest.mark.parametrize("search", [Lab2.bfs, Lab2.iddfs, Lab2.bidirectional_bfs])
+def test_shortest_path_searches_match_reference_bfs(search):
+    rng = random.Random(0)
+    for graph in _random_graphs():
+        for _ in range(10):
+            start, end = rng.randrange(30), rng.randrange(30)
+            hops = reference_hops(graph.neighbors, start)
+            path = search(graph, start, end)
+            if end not in hops:
+                assert path is None
+            else:
+                assert len(path) - 1 == hops[end]
+                _assert_walk(graph, path, start, end)
+
+
+def test_dfs_matches_the_recursive_original():
+    rng = random.Random(1)
+    for graph in _random_graphs():
+        for _ in range(10):
+            start, end = rng.randrange(30), rng.randrange(30)
+            assert Lab2.dfs(graph, start, end) == recursive_dfs(graph, start, end)
+
+
+def test_depth_limits():
+    graph = nx.path_graph(6)
+    graph.add_edge(0, 5)
+    assert Lab2.dfs(graph, 0, 4) == [0, 1, 2, 3, 4]
+    assert Lab2.dfs(graph, 0, 4, depth_limit=2) == [0, 5, 4]
+    assert Lab2.dfs(graph, 0, 3, depth_limit=2) is None
+    assert Lab2.iddfs(graph, 0, 3, max_depth=2) is None
+    assert len(Lab2.iddfs(graph, 0, 3)) == 4
+
+
+@pytest.mark.parametrize("search", [Lab2.bfs, Lab2.dfs, Lab2.iddfs, Lab2.bidirectional_bfs])
+def test_start_is_the_goal(search):
+    graph = nx.Graph([("A", "B"), ("A", "C"), ("B", "D"), ("C", "E"), ("D", "E"), ("D", "F")])
+    assert search(graph, "A", "A") == ["A"]
+    graph.add_node("Z")
+    assert search(graph, "A", "Z") is None
@@ -0,0 +1,97 @@
+import heapq
+import random
+
+import numpy as np
+import pytest
+
+from compact_graph import CompactGraph
+from landmarks import INF, LandmarkIndex
+from UniformCSlab4 import Graph
+
+
+def reference_costs(neighbors, start):
+    """Textbook Dijkstra; neighbors(node) yields (neighbor, weight)."""
+    costs = {}
+    heap = [(0.0, start)]
+    while heap:
+        cost, node = heapq.heappop(heap)
+        if node in costs:
+            continue
+        costs[node] = cost
+        for neighbor, weight in neighbors(node):
+            if neighbor not in costs:
+                heapq.heappush(heap, (cost + weight, neighbor))
+    return costs
+
+
+def random_graph(num_nodes, num_edges, seed):
+    """Nodes scattered on a plane, joined to nearby nodes by Euclidean edges; not always connected."""
+    rng = random.Random(seed)
+    graph = Graph()
+    points = {}
+    for i in range(num_nodes):
+        points[str(i)] = (rng.randrange(1000), rng.randrange(1000))
+        graph.add_node(str(i), *points[str(i)])
+    for _ in range(num_edges):
+        a, b = rng.sample(sorted(points), 2)
+        (ax, ay), (bx, by) = points[a], points[b]
+        if abs(ax - bx) + abs(ay - by) < 250:
+            graph.add_edge(a, b, round(((ax - bx) ** 2 + (ay - by) ** 2) ** 0.5, 2))
+    return graph
+
+
+def graph_neighbors(graph):
+    return lambda node_id: ((neighbor.id, weight) for neighbor, weight in graph.nodes[node_id].neighbors.items())
+
+
+@pytest.fixture(scope="module")
+def graph():
+    return random_graph(400, 3000, seed=0)
+
+
+def test_landmark_a_star_matches_dijkstra(graph):
+    index = LandmarkIndex(graph, num_landmarks=6, seed=0)
+    rng = random.Random(1)
+    ids = list(graph.nodes)
+    for _ in range(30):
+        start, goal = rng.choice(ids), rng.choice(ids)
+        costs = reference_costs(graph_neighbors(graph), start)
+        path, cost, _ = index.shortest_path(start, goal)
+        if goal not in costs:
+            assert path is None and cost == INF
+            continue
+        assert cost == pytest.approx(costs[goal])
+        assert path[0] == start and path[-1] == goal
+        walked = sum(graph.nodes[a].neighbors[graph.nodes[b]] for a, b in zip(path, path[1:]))
+        assert walked == pytest.approx(costs[goal])
+
+
+def test_landmark_bounds_are_admissible(graph):
+    index = LandmarkIndex(graph, num_landmarks=6, seed=0)
+    goal = index.node_ids[17]
+    costs = reference_costs(graph_neighbors(graph), goal)
+    bound = index.lower_bound(index.index_of[goal])
+    for node_id, i in index.index_of.items():
+        assert bound(i) <= costs.get(node_id, INF) + 1e-9
+
+
+def test_compact_graph_tables_match_graph(graph):
+    index = LandmarkIndex(graph, num_landmarks=6, seed=0)
+    # A frozen CompactGraph is searched through its CSR arrays and id maps
+    compact = LandmarkIndex(CompactGraph.from_graph(graph), num_landmarks=6, seed=0)
+    assert compact.landmarks == index.landmarks
+    assert np.allclose(compact.distances, index.distances)
+    for i, landmark in enumerate(index.landmarks):
+        costs = reference_costs(graph_neighbors(graph), index.node_ids[landmark])
+        for node_id, cost in costs.items():
+            assert index.distances[index.index_of[node_id], i] == pytest.approx(cost)
+
+
+def test_index_rebuilds_after_graph_changes():
+    graph = random_graph(50, 0, seed=2)
+    index = LandmarkIndex(graph, num_landmarks=3, seed=0)
+    assert index.shortest_path("0", "1")[0] is None
+    graph.add_edge("0", "1", 5.0)
+    assert index.is_stale()
+    path, cost, _ = index.shortest_path("0", "1")
+    assert path == ["0", "1"] and cost == 5.0
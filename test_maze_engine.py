@@ -0,0 +1,97 @@
+from collections import deque
+
+import numpy as np
+import pytest
+
+from maze_engine import Maze, bfs, bfs_events, dfs, wavefront_bfs, wavefront_distances
+
+
+def _random_grid(seed, shape=(25, 31), density=0.65):
+    grid = (np.random.default_rng(seed).random(shape) < density).astype(np.uint8)
+    grid[0, 0] = grid[-1, -1] = 1
+    return grid
+
+
+def reference_distances(grid, start):
+    """Plain BFS step counts from start over open cells."""
+    dist = {start: 0}
+    queue = deque([start])
+    while queue:
+        r, c = queue.popleft()
+        for cell in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+            if 0 <= cell[0] < grid.shape[0] and 0 <= cell[1] < grid.shape[1] and grid[cell] and cell not in dist:
+                dist[cell] = dist[(r, c)] + 1
+                queue.append(cell)
+    return dist
+
+
+def _assert_walk(grid, path, start, end):
+    assert path[0] == start and path[-1] == end
+    assert all(grid[cell] for cell in path)
+    for (r1, c1), (r2, c2) in zip(path, path[1:]):
+        assert abs(r1 - r2) + abs(c1 - c2) == 1
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_searches_match_reference_bfs(seed):
+    grid = _random_grid(seed)
+    maze = Maze(grid)
+    rng = np.random.default_rng(seed)
+    open_cells = [tuple(cell) for cell in np.argwhere(grid)]
+    for _ in range(10):
+        start = open_cells[rng.integers(len(open_cells))]
+        end = open_cells[rng.integers(len(open_cells))]
+        expected = reference_distances(grid, start).get(end)
+        queued, waved, deep = bfs(maze, start, end), wavefront_bfs(maze, start, end), dfs(maze, start, end)
+        assert (queued.path is None) == (waved.path is None) == (deep.path is None) == (expected is None)
+        if expected is not None:
+            assert len(queued.path) - 1 == len(waved.path) - 1 == expected
+            for path in (queued.path, waved.path, deep.path):
+                _assert_walk(grid, path, start, end)
+
+
+def test_wavefront_distances_match_reference():
+    grid = _random_grid(99)
+    maze = Maze(grid)
+    dist = wavefront_distances(maze, [(0, 0)])
+    expected = reference_distances(grid, (0, 0))
+    for cell in map(tuple, np.argwhere(grid)):
+        assert dist[cell] == expected.get(cell, -1)
+    assert (dist[grid == 0] == -1).all()
+
+
+def test_wavefront_distances_from_several_sources():
+    grid = _random_grid(7)
+    maze = Maze(grid)
+    sources = [(0, 0), (24, 30)]
+    dist = wavefront_distances(maze, sources)
+    first, second = (reference_distances(grid, source) for source in sources)
+    for cell in map(tuple, np.argwhere(grid)):
+        nearest = min(first.get(cell, np.inf), second.get(cell, np.inf))
+        assert dist[cell] == (nearest if nearest != np.inf else -1)
+
+
+def test_traced_bfs_matches_untraced():
+    grid = _random_grid(5)
+    maze = Maze(grid)
+    events = bfs_events(maze, (0, 0), (24, 30))
+    kinds = []
+    try:
+        while True:
+            kinds.append(next(events)[0])
+    except StopIteration as stop:
+        traced = stop.value
+    assert traced == bfs(maze, (0, 0), (24, 30))
+    assert kinds.count("expand") == traced.expanded
+    assert kinds.count("frontier") == traced.explored
+
+
+def test_closed_start_and_outside_cells():
+    grid = np.ones((3, 3), dtype=np.uint8)
+    grid[1, 1] = 0
+    maze = Maze(grid)
+    assert bfs(maze, (1, 1), (0, 0)).path is None
+    assert dfs(maze, (1, 1), (0, 0)).path is None
+    assert wavefront_bfs(maze, (1, 1), (0, 0)).path is None
+    with pytest.raises(ValueError):
+        bfs(maze, (3, 0), (0, 0))
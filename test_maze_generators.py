@@ -0,0 +1,64 @@
+import struct
+import zlib
+
+import numpy as np
+import pytest
+
+from maze_engine import Maze, wavefront_distances
+from maze_generators import GENERATORS, PNG_SIGNATURE, _png_chunk, load_maze, open_corners, save_maze
+
+
+@pytest.mark.parametrize("name", sorted(GENERATORS))
+def test_generators_are_deterministic_per_seed(name):
+    generate = GENERATORS[name]
+    assert np.array_equal(generate(15, 20, 7), generate(15, 20, 7))
+    assert not np.array_equal(generate(15, 20, 7), generate(15, 20, 8))
+
+
+@pytest.mark.parametrize("name", sorted(GENERATORS))
+@pytest.mark.parametrize("rows, cols", [(1, 1), (1, 9), (12, 17)])
+def test_generators_make_perfect_mazes(name, rows, cols):
+    grid = GENERATORS[name](rows, cols, 3)
+    assert grid.shape == (2 * rows + 1, 2 * cols + 1)
+    assert not grid[0].any() and not grid[-1].any() and not grid[:, 0].any() and not grid[:, -1].any()
+    assert grid[1::2, 1::2].all()
+    assert not grid[::2, ::2].any()
+
+    # A spanning tree: every cell reachable and exactly cells - 1 passages
+    passages = int(grid.sum()) - rows * cols
+    assert passages == rows * cols - 1
+    dist = wavefront_distances(Maze(grid), [open_corners(grid)[0]])
+    assert (dist[grid == 1] >= 0).all()
+
+
+@pytest.mark.parametrize("suffix", [".npz", ".png"])
+def test_saved_mazes_load_back(tmp_path, suffix):
+    grid = GENERATORS["kruskal"](9, 13, 1)
+    path = str(tmp_path / ("maze" + suffix))
+    save_maze(grid, path)
+    assert np.array_equal(load_maze(path), grid)
+
+
+def test_read_png_undoes_sub_and_up_filters(tmp_path):
+    grid = GENERATORS["prim"](4, 6, 2)
+    pixels = grid.astype(np.uint8) * 255
+    scanlines = []
+    for i, row in enumerate(pixels):
+        if i % 3 == 0:
+            scanlines.append(bytes([0]) + row.tobytes())
+        elif i % 3 == 1:
+            scanlines.append(bytes([1]) + np.diff(row, prepend=np.uint8(0)).tobytes())
+        else:
+            scanlines.append(bytes([2]) + (row - pixels[i - 1]).tobytes())
+    header = struct.pack(">IIBBBBB", grid.shape[1], grid.shape[0], 8, 0, 0, 0, 0)
+    path = tmp_path / "filtered.png"
+    path.write_bytes(PNG_SIGNATURE + _png_chunk(b"IHDR", header)
+                     + _png_chunk(b"IDAT", zlib.compress(b"".join(scanlines))) + _png_chunk(b"IEND", b""))
+    assert np.array_equal(load_maze(str(path)), grid)
+
+
+def test_read_png_rejects_other_files(tmp_path):
+    path = tmp_path / "maze.png"
+    path.write_bytes(b"not a png")
+    with pytest.raises(ValueError):
+        load_maze(str(path))
@@ -0,0 +1,59 @@
+import itertools
+import random
+
+import numpy as np
+import pytest
+
+from pattern_database import AdditivePDB, PatternDatabase, rank_positions, table_size
+from puzzle_engine import GOAL_STATE, neighbor_table
+from test_puzzle_engine import puzzle_complete, random_walk
+
+
+@pytest.fixture(scope="module")
+def pdb(tmp_path_factory):
+    return AdditivePDB(3, cache_dir=str(tmp_path_factory.mktemp("pdb")))
+
+
+def test_rank_positions_is_a_compact_bijection():
+    ranks = [rank_positions(positions, 9) for positions in itertools.permutations(range(9), 3)]
+    assert sorted(ranks) == list(range(table_size(9, 3)))
+
+
+def test_additive_pdb_is_admissible(pdb):
+    assert pdb(GOAL_STATE) == 0
+    rng = random.Random(3)
+    for _ in range(40):
+        board = random_walk(rng.randrange(60), rng)
+        _, _, depth = puzzle_complete.a_star(board, puzzle_complete.h2)
+        assert pdb(board) <= depth
+
+
+def test_additive_pdb_is_consistent(pdb):
+    # One move changes the bound by at most one, so A* never reopens a node
+    neighbors = neighbor_table(3)
+    rng = random.Random(4)
+    for _ in range(40):
+        board = random_walk(rng.randrange(60), rng)
+        blank = board.index(0)
+        for cell in neighbors[blank]:
+            moved = list(board)
+            moved[blank], moved[cell] = moved[cell], 0
+            assert abs(pdb(board) - pdb(tuple(moved))) <= 1
+
+
+@pytest.mark.parametrize("engine", ["tuple", "packed"])
+def test_a_star_with_the_pdb_is_optimal(pdb, engine):
+    rng = random.Random(5)
+    for _ in range(15):
+        board = random_walk(rng.randrange(80), rng)
+        _, _, expected = puzzle_complete.a_star(board, puzzle_complete.h2)
+        _, _, depth = puzzle_complete.a_star(board, pdb, engine=engine)
+        assert depth == expected
+
+
+def test_tables_are_cached_on_disk(pdb, tmp_path):
+    database = pdb.databases[0]
+    loaded = PatternDatabase.load_or_build(3, database.tiles, str(tmp_path))
+    assert np.array_equal(loaded.table, database.table)
+    again = PatternDatabase.load_or_build(3, database.tiles, str(tmp_path))
+    assert isinstance(again.table, np.memmap)
@@ -0,0 +1,144 @@
+import importlib.util
+import os
+import random
+
+import pytest
+
+from ida_star import ida_star, manhattan_linear_conflict
+from puzzle_engine import (GOAL_STATE, a_star_packed, count_inversions, decode, encode, goal_state, is_solvable,
+                           neighbor_table)
+
+# 8Puzzlecomplete.py starts with a digit, so it cannot be imported by name
+_spec = importlib.util.spec_from_file_location(
+    "puzzle_complete", os.path.join(os.path.dirname(os.path.abspath(__file__)), "8Puzzlecomplete.py"))
+puzzle_complete = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(puzzle_complete)
+
+
+def random_walk(moves, rng, width=3):
+    """A solvable board from a random walk of the blank."""
+    state = list(goal_state(width))
+    neighbors = neighbor_table(width)
+    blank = len(state) - 1
+    for _ in range(moves):
+        cell = rng.choice(neighbors[blank])
+        state[blank], state[cell] = state[cell], 0
+        blank = cell
+    return tuple(state)
+
+
+@pytest.fixture(scope="module")
+def boards():
+    rng = random.Random(0)
+    return [random_walk(rng.randrange(60), rng) for _ in range(40)]
+
+
+def assert_valid_path(path, start, depth):
+    assert path[0] == tuple(start) and path[-1] == goal_state(int(len(start) ** 0.5))
+    assert len(path) == depth + 1
+    for before, after in zip(path, path[1:]):
+        moved = [idx for idx in range(len(before)) if before[idx] != after[idx]]
+        assert len(moved) == 2 and 0 in (before[moved[0]], before[moved[1]])
+
+
+@pytest.mark.parametrize("heuristic", [puzzle_complete.h1, puzzle_complete.h2])
+def test_packed_engine_matches_tuple_a_star(boards, heuristic):
+    for board in boards:
+        _, _, expected = puzzle_complete.a_star(board, heuristic)
+        path, _, depth = puzzle_complete.a_star(board, heuristic, engine="packed")
+        assert depth == expected
+        assert_valid_path(path, board, depth)
+
+
+def test_packed_engine_takes_heuristic_functions(boards):
+    for board in boards:
+        _, _, expected = puzzle_complete.a_star(board, puzzle_complete.h2)
+        path, _, depth = a_star_packed(board, manhattan_linear_conflict)
+        assert depth == expected
+        assert_valid_path(path, board, depth)
+
+
+def test_a_star_rejects_unknown_engines():
+    with pytest.raises(ValueError):
+        puzzle_complete.a_star(GOAL_STATE, puzzle_complete.h2, engine="quantum")
+    with pytest.raises(ValueError):
+        puzzle_complete.a_star(GOAL_STATE, manhattan_linear_conflict, engine="bidirectional")
+
+
+def test_a_star_passes_other_heuristics_to_the_packed_engine(boards):
+    for board in boards[:10]:
+        _, _, expected = puzzle_complete.a_star(board, puzzle_complete.h2)
+        path, _, depth = puzzle_complete.a_star(board, manhattan_linear_conflict, engine="packed")
+        assert depth == expected
+        assert_valid_path(path, board, depth)
+
+
+@pytest.mark.parametrize("heuristic", [puzzle_complete.h1, puzzle_complete.h2])
+def test_packed_engine_leaves_shallow_boards_to_the_tuple_loop(boards, heuristic):
+    threshold = puzzle_complete.SHALLOW_BELOW[heuristic]
+    name = puzzle_complete.HEURISTIC_NAMES[heuristic]
+    for board in boards:
+        result = puzzle_complete.a_star(board, heuristic, engine="packed")
+        if heuristic(board) < threshold:
+            assert result == puzzle_complete.a_star(board, heuristic)
+        else:
+            assert result == a_star_packed(board, name)
+
+
+def test_packed_engine_on_the_goal():
+    assert a_star_packed(GOAL_STATE) == ([GOAL_STATE], 1, 0)
+
+
+def test_encode_round_trips():
+    rng = random.Random(2)
+    for _ in range(50):
+        state = tuple(rng.sample(range(9), 9))
+        assert decode(encode(state)) == state
+    # Integer order matches tuple order
+    assert encode((0, 8, 7, 6, 5, 4, 3, 2, 1)) < encode(GOAL_STATE) < encode((8, 7, 6, 5, 4, 3, 2, 1, 0))
+
+
+@pytest.mark.parametrize("heuristic", [puzzle_complete.h1, puzzle_complete.h2])
+def test_incremental_heuristics_match_full_evaluation(boards, heuristic):
+    for board in boards:
+        assert (puzzle_complete.a_star(board, heuristic)
+                == puzzle_complete.a_star(board, heuristic, incremental=False))
+
+
+def test_unsolvable_boards_are_rejected_without_searching():
+    rng = random.Random(1)
+    for _ in range(40):
+        board = tuple(rng.sample(range(9), 9))
+        tiles = [idx for idx, tile in enumerate(board) if tile]
+        # Swapping two tiles always flips solvability
+        swapped = list(board)
+        swapped[tiles[0]], swapped[tiles[1]] = swapped[tiles[1]], swapped[tiles[0]]
+        assert is_solvable(board) != is_solvable(swapped)
+        for state in (board, tuple(swapped)):
+            path, nodes, _ = puzzle_complete.a_star(state, puzzle_complete.h2)
+            assert (path is not None) == is_solvable(state)
+            if path is None:
+                assert nodes == 0
+
+
+def test_count_inversions_matches_pairwise_count():
+    rng = random.Random(6)
+    for _ in range(200):
+        values = [rng.randrange(50) for _ in range(rng.randrange(40))]
+        pairs = sum(values[i] > values[j] for i in range(len(values)) for j in range(i + 1, len(values)))
+        assert count_inversions(values) == pairs
+
+
+def test_fifteen_puzzle_boards():
+    rng = random.Random(7)
+    for _ in range(10):
+        board = random_walk(rng.randrange(25), rng, width=4)
+        assert decode(encode(board), 16) == board
+        assert is_solvable(board)
+        first, second = [idx for idx, tile in enumerate(board) if tile][:2]
+        swapped = list(board)
+        swapped[first], swapped[second] = board[second], board[first]
+        assert not is_solvable(swapped)
+        path, _, depth = a_star_packed(board)
+        assert depth == ida_star(board)[2]
+        assert_valid_path(path, board, depth)
@@ -0,0 +1,127 @@
+import pytest
+
+import search_animation
+from search_animation import INSTANT, SearchAnimation
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeWidget:
+    """Stands in for a Tk widget: after() queues one callback that run_frames() fires."""
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.pending = None
+        self.cancelled = []
+        self.ids = 0
+
+    def after(self, ms, callback):
+        self.ids += 1
+        self.pending = (self.ids, ms, callback)
+        return self.ids
+
+    def after_cancel(self, after_id):
+        self.cancelled.append(after_id)
+        self.pending = None
+
+    def run_frames(self, limit=10_000):
+        frames = 0
+        while self.pending is not None and frames < limit:
+            _, ms, callback = self.pending
+            self.pending = None
+            self.clock.now += ms / 1000
+            callback()
+            frames += 1
+        return frames
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(search_animation.time, "perf_counter", clock)
+    return clock
+
+
+def events(clock, count, cost=0.0):
+    """count expand events, each taking cost seconds of fake time; returns "result"."""
+    for i in range(count):
+        clock.now += cost
+        yield "expand", i
+    return "result"
+
+
+class Recorder:
+    def __init__(self):
+        self.events, self.frames, self.done = [], [], []
+
+    def on_event(self, kind, payload):
+        self.events.append(payload)
+
+    def on_frame(self):
+        self.frames.append(len(self.events))
+
+    def on_done(self, result):
+        self.done.append(result)
+
+
+def _animate(clock, recorder, generator, **kwargs):
+    widget = FakeWidget(clock)
+    animation = SearchAnimation(widget, generator, recorder.on_event, recorder.on_done, recorder.on_frame, **kwargs)
+    return widget, animation.start()
+
+
+def test_frames_stop_taking_events_after_the_budget(clock):
+    recorder = Recorder()
+    widget, animation = _animate(clock, recorder, events(clock, 100, cost=0.003), budget_ms=10.0)
+    widget.run_frames()
+    per_frame = [b - a for a, b in zip([0] + recorder.frames, recorder.frames)]
+    # Each event takes 3 ms, so a 10 ms budget fits four before the deadline check fails
+    assert max(per_frame) == 4
+    assert recorder.events == list(range(100))
+    assert recorder.done == ["result"]
+
+
+def test_rate_limits_steps_per_second(clock):
+    recorder = Recorder()
+    widget, animation = _animate(clock, recorder, events(clock, 1000), rate=10.0)
+    began = clock.now
+    widget.run_frames(limit=125)  # Two seconds of 16 ms frames
+    elapsed = clock.now - began
+    # The first step shows at once; after that steps come no faster than the rate,
+    # and only a little slower, since credit is capped at one step between frames
+    assert 0.8 * 10 * elapsed <= len(recorder.events) <= 1 + 10 * elapsed
+    assert animation.running and not recorder.done
+
+
+def test_stops_when_the_search_finishes(clock):
+    recorder = Recorder()
+    widget, animation = _animate(clock, recorder, events(clock, 30))
+    frames = widget.run_frames()
+    assert frames < 10_000 and widget.pending is None
+    assert recorder.done == ["result"] and not animation.running
+    assert recorder.events == list(range(30))
+
+
+def test_instant_plays_everything_without_frames(clock):
+    recorder = Recorder()
+    widget, animation = _animate(clock, recorder, events(clock, 500), rate=INSTANT)
+    assert widget.ids == 0
+    assert recorder.events == list(range(500)) and recorder.done == ["result"]
+
+
+def test_cancel_stops_without_calling_on_done(clock):
+    recorder = Recorder()
+    generator = events(clock, 1000)
+    widget, animation = _animate(clock, recorder, generator, rate=10.0)
+    widget.run_frames(limit=5)
+    animation.cancel()
+    assert widget.cancelled and widget.pending is None
+    assert not animation.running and not recorder.done
+    with pytest.raises(StopIteration):
+        next(generator)
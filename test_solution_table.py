@@ -0,0 +1,40 @@
+import pytest
+
+from solution_table import SolutionTable, lehmer_rank
+from test_puzzle_engine import puzzle_complete
+
+
+@pytest.fixture(scope="module")
+def table(tmp_path_factory):
+    return SolutionTable.load_or_build(cache_dir=str(tmp_path_factory.mktemp("solutions")))
+
+
+def test_lehmer_rank_orders_permutations():
+    assert lehmer_rank((0, 1, 2)) == 0
+    assert lehmer_rank((2, 1, 0)) == 5
+    assert lehmer_rank((1, 0, 2)) == 2
+
+
+def test_distance_and_solve_agree(table):
+    state = (8, 1, 3, 4, 0, 2, 7, 6, 5)
+    path = table.solve(state)
+    assert table.distance(state) == len(path) - 1 == 14
+    assert path[-1] == (1, 2, 3, 4, 5, 6, 7, 8, 0)
+    assert len(table.moves(state)) == 14
+    assert table.distance((1, 2, 3, 4, 5, 6, 8, 7, 0)) is None
+    assert table.solve((1, 2, 3, 4, 5, 6, 8, 7, 0)) is None
+
+
+def test_distances_match_a_star(table):
+    for state in [(1, 2, 3, 0, 4, 6, 7, 5, 8), (0, 3, 4, 5, 1, 2, 8, 6, 7), (5, 3, 6, 7, 0, 4, 8, 1, 2)]:
+        assert table.distance(state) == puzzle_complete.a_star(state, puzzle_complete.h2)[2]
+    # One of the two hardest 3x3 boards
+    assert table.distance((8, 6, 7, 2, 5, 4, 3, 0, 1)) == 31
+
+
+@pytest.mark.parametrize("state", [(1, 2, 3), tuple(range(16)), (1, 1, 2, 3, 4, 5, 6, 7, 0)])
+def test_invalid_boards_are_rejected(table, state):
+    with pytest.raises(ValueError):
+        table.distance(state)
+    with pytest.raises(ValueError):
+        table.solve(state)